@@ -1,8 +1,14 @@
-import streamlit as st
-import requests
-import json
+import os
 import random
 
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from constants.string_constants import StringConstants
+from src.input_schema import load_compiled_schema
+from src.prediction_client import PredictionClient
+
 # Set your model endpoint here
 PREDICTION_URL = (
     "https://your_model_server_url/predict"  # Replace with the actual endpoint
@@ -11,25 +17,65 @@ PREDICTION_URL = (
 # Title for the Streamlit app
 st.title("Ethereum Fraud Detection")
 
-# Define feature names for reference
-feature_names = [
-    "avg_min_between_sent_tnx",
-    "avg_min_between_received_tnx",
-    "time_diff_between_first_and_last_(mins)",
-    "sent_tnx",
-    "received_tnx",
-    "number_of_created_contracts",
-    "max_value_received",
-    "avg_val_received",
-    "avg_val_sent",
-    "total_ether_sent",
-    "total_ether_balance",
-    "erc20_total_ether_received",
-    "erc20_total_ether_sent",
-    "erc20_total_ether_sent_contract",
-    "erc20_uniq_sent_addr",
-    "erc20_uniq_rec_token_name",
-]
+# Feature names in model order, from the input schema saved at training time
+schema = load_compiled_schema(StringConstants.input_schema_path)
+feature_names = schema.columns
+
+
+@st.cache_resource
+def get_local_model(model_source: str):
+    """Loads the model once per Streamlit server and keeps it across reruns."""
+    if model_source.endswith(".h5"):
+        from sklearn.pipeline import Pipeline
+
+        from src.data_modelling import PipelineNumpyGeneticModel
+
+        return Pipeline([("model", PipelineNumpyGeneticModel(model_source))])
+
+    from src.prediction_server import load_pipeline
+
+    return load_pipeline(model_source)
+
+
+@st.cache_resource
+def get_local_transformer():
+    """Loads the feature transformer the models were trained behind, once per server."""
+    from src.model_packaging import load_feature_transformer
+
+    return load_feature_transformer(StringConstants.transformer_path)
+
+
+@st.cache_resource
+def get_prediction_client() -> PredictionClient:
+    """Keeps one pooled client across Streamlit reruns."""
+    return PredictionClient(PREDICTION_URL, columns=feature_names)
+
+
+# Score in this process by default, so the app works without a running server
+mode = st.sidebar.radio("Scoring", ["Local model", "Prediction server"])
+if mode == "Local model":
+    default_source = (
+        StringConstants.model_package_path
+        if os.path.exists(StringConstants.model_package_path)
+        else StringConstants.genetic_model_path
+    )
+    model_source = st.sidebar.text_input(
+        "Model package, MLflow URI or .h5 network", value=default_source
+    )
+
+
+def score(X: np.ndarray) -> np.ndarray:
+    """Returns the fraud score of every row of a float32 array in model column order."""
+    if mode == "Local model":
+        from src.data_modelling import predict_positive_scores
+
+        model = get_local_model(model_source)
+        # The models were trained on transformed features; the server transforms them itself.
+        transformed = get_local_transformer().transform(pd.DataFrame(X, columns=feature_names))
+        return predict_positive_scores(model, pd.DataFrame(transformed, columns=feature_names))
+    predictions = get_prediction_client().predict(X)
+    return predictions.reshape(len(X), -1)[:, -1]
+
 
 # Fraud likely values dataset
 fraud_likely_data = {
@@ -98,24 +144,61 @@ if st.button("Fraud Likely Values"):
     fraud_index = (fraud_index + 1) % len(fraud_likely_data)
     st.experimental_rerun()
 
+
 # Predict button
 if st.button("Predict Fraud Probability"):
-    # Prepare data as JSON
-    input_data = {name: inputs[name] for name in inputs}
-    json_data = json.dumps({"dataframe_records": [input_data]})
-
-    # Make prediction request
-    headers = {"Content-Type": "application/json"}
-    response = requests.post(PREDICTION_URL, headers=headers, data=json_data)
-
-    # Display prediction result
-    if response.status_code == 200:
-        prediction = response.json().get(
-            "probability", 0
-        )  # Adjust if API returns different structure
-        fraud_percentage = float(prediction) * 100
-        st.success(f"Prediction: {fraud_percentage:.2f}% likelihood of fraud")
-    else:
+    # Prepare data as a single row in model column order
+    input_data = np.array([[inputs[name] for name in feature_names]], dtype=np.float32)
+
+    try:
+        errors = schema.row_errors(schema.validate(input_data))
+        if errors:
+            st.error(f"Invalid input: {', '.join(errors[0]['reasons'])}")
+        else:
+            fraud_percentage = float(score(input_data)[0]) * 100
+            st.success(f"Prediction: {fraud_percentage:.2f}% likelihood of fraud")
+    except Exception as e:
         st.error("Prediction request failed")
-        st.error(f"Error: {response.status_code}")
-        st.error(response.text)
+        st.error(f"Error: {e}")
+
+# Bulk scoring of an uploaded file of addresses
+st.markdown("### Score a CSV of addresses")
+uploaded_file = st.file_uploader("CSV with one row per address", type="csv")
+threshold = st.slider("Fraud threshold", 0.0, 1.0, 0.5, 0.01)
+
+if uploaded_file is not None and st.button("Score File"):
+    from src.batch_scoring import score_records
+    from src.feature_cleaning import RenameFeatureCleaningStrategy
+
+    records = pd.read_csv(uploaded_file)
+    if not set(feature_names) <= set(records.columns):
+        # Files with the dataset's original column names are renamed like in training
+        records = RenameFeatureCleaningStrategy().apply_strategy(records)
+
+    progress_bar = st.progress(0.0, text=f"Scoring {len(records)} addresses")
+    try:
+        scored = score_records(
+            records,
+            score,
+            schema,
+            progress=lambda done: progress_bar.progress(
+                done, text=f"Scoring {len(records)} addresses"
+            ),
+        )
+    except ValueError as e:
+        st.error(str(e))
+    else:
+        progress_bar.progress(1.0, text=f"Scored {len(records)} addresses")
+        flagged = scored["fraud_score"] >= threshold
+        invalid = scored["input_errors"] != ""
+        st.success(
+            f"{int(flagged.sum())} of {len(scored)} addresses flagged at {threshold:.2f}"
+            + (f"; {int(invalid.sum())} rows could not be scored" if invalid.any() else "")
+        )
+        st.dataframe(scored[flagged].sort_values("fraud_score", ascending=False).head(100))
+        st.download_button(
+            "Download scored CSV",
+            scored.to_csv(index=False).encode(),
+            file_name="scored_addresses.csv",
+            mime="text/csv",
+        )
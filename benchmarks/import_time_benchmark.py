@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+import time
+
+import click
+
+# Project root, so that `src` and `constants` are importable from the subprocesses.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import_time(module: str, repeats: int = 5) -> float:
+    """
+    Measures the best wall-clock time of importing a module in a fresh interpreter.
+
+    The interpreter start-up time is measured separately and subtracted.
+
+    Parameters:
+        module (str): The dotted name of the module to import.
+        repeats (int): Number of fresh interpreters to time.
+
+    Returns:
+        float: The best import time in seconds.
+    """
+
+    def best_time(code: str) -> float:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, check=True)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return max(0.0, best_time(f"import {module}") - best_time("pass"))
+
+
+@click.command()
+@click.option(
+    "--module",
+    "modules",
+    multiple=True,
+    default=["src.data_modelling"],
+    help="Module to import; can be given several times.",
+)
+@click.option(
+    "--budget",
+    default=2.5,
+    help="Maximum allowed import time in seconds.",
+)
+@click.option("--repeats", default=5, help="Number of fresh interpreters per module.")
+def main(modules: tuple, budget: float, repeats: int):
+    """
+    Fails if importing any of the given modules exceeds the time budget.
+    """
+    failed = False
+    for module in modules:
+        import_time = measure_import_time(module, repeats)
+        status = "OK" if import_time <= budget else "OVER BUDGET"
+        print(f"{module}: {import_time:.3f}s (budget {budget:.3f}s) {status}")
+        failed |= import_time > budget
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
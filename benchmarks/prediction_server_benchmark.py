@@ -0,0 +1,168 @@
+import asyncio
+import json
+import os
+import sys
+import time
+
+import click
+import numpy as np
+
+# Project root, so that `src` and `constants` are importable.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def build_pipeline():
+    """
+    Builds the numpy GA network pipeline used as the benchmark model.
+    """
+    from sklearn.pipeline import Pipeline
+
+    from constants.string_constants import StringConstants
+    from src.data_modelling import PipelineNumpyGeneticModel
+
+    model = PipelineNumpyGeneticModel(os.path.join(ROOT_DIR, StringConstants.genetic_model_path))
+    return Pipeline([("model", model)])
+
+
+async def run_client(port: int, body: bytes, n_requests: int, latencies: list):
+    """
+    Sends single-record requests one after another over one keep-alive connection.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = (
+        f"POST /invocations HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        writer.write(request)
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+def instrumentation_seconds(batch_size: int, n_requests: int = 100_000) -> float:
+    """
+    Times the metrics work per request when requests are scored in batches of `batch_size`:
+    the timer reads and the decode, encode and request observations of every request, the
+    preprocess, model, batch and queue wait observations of every batch, and folding them
+    into the histograms.
+    """
+    from src.serving_metrics import ServingMetrics
+
+    metrics = ServingMetrics(model_version="v1")
+    start = time.perf_counter()
+    for _ in range(n_requests // batch_size):
+        queued = []
+        for _ in range(batch_size):
+            now = time.perf_counter()
+            metrics.observe_stages({"decode": time.perf_counter() - now})
+            queued.append(time.perf_counter())
+        now = time.perf_counter()
+        metrics.observe_batch(batch_size, [now - queued_at for queued_at in queued])
+        metrics.observe_stages(
+            {"preprocess": time.perf_counter() - now, "model": time.perf_counter() - now}
+        )
+        for _ in range(batch_size):
+            now = time.perf_counter()
+            metrics.observe_stage("encode", time.perf_counter() - now)
+            metrics.observe_request(200, time.perf_counter() - now)
+    metrics.render()
+    return (time.perf_counter() - start) / (n_requests // batch_size * batch_size)
+
+
+async def measure(
+    max_batch_size: int,
+    max_wait_ms: float,
+    concurrency: int,
+    n_requests: int,
+    swap: bool = False,
+    metrics: bool = False,
+) -> dict:
+    """
+    Serves the benchmark model and measures throughput and latency under concurrent load,
+    optionally while a new model version is hot-swapped in or with serving metrics on.
+    """
+    from src.prediction_server import PredictionServer
+    from src.serving_metrics import ServingMetrics
+
+    pipeline = build_pipeline()
+    columns = [f"feature_{index}" for index in range(pipeline.named_steps["model"].n_features_in_)]
+    record = dict(zip(columns, np.random.default_rng(0).normal(size=len(columns)).tolist()))
+    body = json.dumps({"dataframe_records": [record]}).encode()
+
+    server = PredictionServer(
+        pipeline,
+        columns=columns,
+        port=0,
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+        model_loader=lambda model_uri: build_pipeline(),
+        metrics=ServingMetrics() if metrics else None,
+    )
+    await server.start()
+    latencies = []
+    start = time.perf_counter()
+    clients = [run_client(server.port, body, n_requests, latencies) for _ in range(concurrency)]
+    if swap:
+        clients.append(server.swap_model("benchmark", model_version="v2"))
+    await asyncio.gather(*clients)
+    elapsed = time.perf_counter() - start
+    await server.stop()
+
+    batch_rows = server.metrics.summary()["batch_rows_mean"] if metrics else None
+    return {
+        "batch_rows_mean": batch_rows,
+        "requests_per_s": len(latencies) / elapsed,
+        "mean_ms": 1e3 * float(np.mean(latencies)),
+        "p50_ms": 1e3 * float(np.percentile(latencies, 50)),
+        "p99_ms": 1e3 * float(np.percentile(latencies, 99)),
+    }
+
+
+@click.command()
+@click.option("--concurrency", default=64, help="Number of concurrent client connections.")
+@click.option("--requests", "n_requests", default=100, help="Requests sent by every client.")
+@click.option("--max-batch-size", default=256, help="Micro-batch size limit of the batched run.")
+@click.option("--max-wait-ms", default=2.0, help="Micro-batch wait limit of the batched run.")
+def main(concurrency: int, n_requests: int, max_batch_size: int, max_wait_ms: float):
+    """
+    Compares per-request scoring (batch size 1) with micro-batched scoring, with and
+    without a hot model swap during the run, and measures the cost of serving metrics.
+    """
+    results = {}
+    for name, batch_size, wait_ms, swap, metrics in [
+        ("per-request", 1, 0.0, False, False),
+        ("per-request with metrics", 1, 0.0, False, True),
+        ("micro-batched", max_batch_size, max_wait_ms, False, False),
+        ("micro-batched with metrics", max_batch_size, max_wait_ms, False, True),
+        ("micro-batched during a hot swap", max_batch_size, max_wait_ms, True, False),
+    ]:
+        result = asyncio.run(measure(batch_size, wait_ms, concurrency, n_requests, swap, metrics))
+        results[name] = result
+        print(
+            f"{name}: {result['requests_per_s']:.0f} req/s, "
+            f"p50 {result['p50_ms']:.2f}ms, p99 {result['p99_ms']:.2f}ms"
+        )
+
+    # A/B runs on a loaded machine are noisier than the instrumentation itself, so time it
+    # directly and compare it with the request latency and with the server time a request
+    # costs at full load, i.e. the inverse of the throughput.
+    for name in ("per-request", "micro-batched"):
+        result = results[name]
+        batch_size = max(1, round(results[f"{name} with metrics"]["batch_rows_mean"]))
+        cost = instrumentation_seconds(batch_size)
+        print(
+            f"metrics instrumentation, {name} (mean batch of {batch_size} rows): "
+            f"{1e6 * cost:.1f}us per request, "
+            f"{100 * cost / (result['mean_ms'] / 1e3):.3f}% of the mean request time, "
+            f"{100 * cost * result['requests_per_s']:.2f}% of the server time per request"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+
+import click
+import numpy as np
+
+# Project root, so that `src` and `constants` are importable.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def best_time(fn, X: np.ndarray, repeats: int) -> float:
+    """
+    Returns the fastest of `repeats` calls, in milliseconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(X)
+        timings.append(time.perf_counter() - start)
+    return 1e3 * min(timings)
+
+
+@click.command()
+@click.option("--trees", default=500, help="Number of trees of the benchmark ensemble.")
+@click.option("--leaves", default=31, help="Number of leaves per tree.")
+@click.option("--repeats", default=20, help="Timed calls per batch size; the fastest is kept.")
+def main(trees: int, leaves: int, repeats: int):
+    """
+    Compares the flat tree ensemble with LightGBM's `predict_proba` on serving-sized
+    batches, on clean inputs and on inputs with NaN and zero (missing) values.
+    """
+    import lightgbm as lgb
+
+    from src.tree_ensemble import FlatTreeEnsemble
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(20_000, 16))
+    y = (X[:, :4].sum(axis=1) + rng.normal(size=len(X)) > 0).astype(int)
+    # Missing values in training give the trees NaN and zero-as-missing default directions.
+    X_train = X.copy()
+    X_train[rng.random(X.shape) < 0.05] = np.nan
+    model = lgb.LGBMClassifier(n_estimators=trees, num_leaves=leaves, verbose=-1).fit(X_train, y)
+    flat = FlatTreeEnsemble.from_lightgbm(model)
+
+    X_missing = X.copy()
+    X_missing[rng.random(X.shape) < 0.05] = np.nan
+    X_missing[rng.random(X.shape) < 0.05] = 0.0
+
+    for label, data in (("clean", X), ("NaN and zeros", X_missing)):
+        for n_rows in (1, 10, 20, 32, 50, 100, 1000, 5000):
+            batch = data[:n_rows]
+            np.testing.assert_allclose(
+                flat.predict_proba(batch), model.predict_proba(batch), rtol=1e-12, atol=1e-15
+            )
+            lightgbm_ms = best_time(model.predict_proba, batch, repeats)
+            flat_ms = best_time(flat.predict_proba, batch, repeats)
+            print(
+                f"{label:>13}, {n_rows:>5} rows: LightGBM {lightgbm_ms:7.3f}ms, "
+                f"flat {flat_ms:7.3f}ms ({lightgbm_ms / flat_ms:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
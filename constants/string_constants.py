@@ -4,3 +4,7 @@ class StringConstants:
     pipeline_name = "continuous_deployment_pipeline"
     pipeline_step_name = "mlflow_model_deployer_step"
     genetic_model_path = "pre_trained_models/genetic_model.h5"
+    worker_pool_socket = "/tmp/ethereum_fraud_detection.sock"
+    input_schema_path = "pre_trained_models/input_schema.json"
+    model_package_path = "pre_trained_models/ethereum_fraud_detection.efmp"
+    transformer_path = "pre_trained_models/feature_transformer.efmp"
@@ -0,0 +1,26 @@
+import click
+
+
+@click.command()
+@click.option(
+    "--model-uri",
+    required=True,
+    help="MLflow URI of the trained pipeline, e.g. models:/ethereum_fraud_detection/latest.",
+)
+@click.option("--output", "output_path", required=True, help="Path of the model package to write.")
+def run_main(model_uri: str, output_path: str):
+    """Packages the trained pipeline into a single file whose weights are memory-mapped
+    by every serving process. Pass the package path as --model-uri to the serving commands.
+    """
+    from src.model_packaging import save_model_package
+    from src.prediction_server import load_pipeline
+
+    summary = save_model_package(load_pipeline(model_uri), output_path)
+    print(
+        f"Packaged {summary['buffers']} weight arrays ({summary['weight_bytes']} bytes) "
+        f"into {output_path}"
+    )
+
+
+if __name__ == "__main__":
+    run_main()
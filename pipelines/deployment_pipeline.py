@@ -4,9 +4,10 @@ from constants.string_constants import StringConstants
 from pipelines.training_pipeline import ml_pipeline
 from zenml.integrations.mlflow.steps import mlflow_model_deployer_step
 
+from steps.data_modelling_step import get_experiment_tracker_name
 from steps.dynamic_importer import dynamic_importer
 from steps.prediction_service_loader import prediction_service_loader
-from steps.predictor import predictor
+from steps.predictor import predictor, warm_pool_predictor
 
 
 @pipeline
@@ -38,4 +39,18 @@ def inference_pipeline(enable_cache=True):
     )
 
     # Run predictions on the batch data
-    predictor(service=model_deployment_service, input_data=batch_data)
+    predictor.with_options(experiment_tracker=get_experiment_tracker_name())(
+        service=model_deployment_service, input_data=batch_data
+    )
+
+
+@pipeline
+def warm_inference_pipeline(enable_cache=True):
+    """Run a batch inference job on the warm worker pool instead of the MLflow service."""
+    # Load batch data for inference
+    batch_data = dynamic_importer()
+
+    # Run predictions on the already warm workers
+    warm_pool_predictor.with_options(experiment_tracker=get_experiment_tracker_name())(
+        input_data=batch_data
+    )
@@ -1,11 +1,15 @@
 from zenml import pipeline, Model
 from constants.string_constants import StringConstants
+from steps.cross_validation_step import cross_validation_step
 from steps.data_ingestion_step import data_ingestion_step
-from steps.data_modelling_step import data_modelling_step
+from steps.data_modelling_step import data_modelling_step, get_experiment_tracker_name
 from steps.data_splitting_step import data_splitter_step
 from steps.feature_cleaning_step import feature_cleaning_step
 from steps.feature_engineering_step import feature_engineering_step
+from steps.feature_selection_step import feature_selection_step
+from steps.input_schema_step import input_schema_step
 from steps.missing_value_handling_step import missing_value_handling_step
+from steps.model_evaluation_step import model_evaluation_step
 
 
 @pipeline(
@@ -14,8 +18,23 @@ from steps.missing_value_handling_step import missing_value_handling_step
         name=StringConstants.name
     )
 )
-def ml_pipeline():
-    """Complete End-To-End Pipeline"""
+def ml_pipeline(
+    strategy: str = "gacs",
+    cross_validate: bool = False,
+    genetic_feature_selection: bool = False,
+    feature_penalty: float = 0.0,
+):
+    """Complete End-To-End Pipeline
+
+    Args:
+        strategy (str): The modelling strategy trained, as in `data_modelling_step`.
+        cross_validate (bool): Whether to cross-validate the strategy first. It trains one
+            model per fold in worker processes, so it is off by default.
+        genetic_feature_selection (bool): Whether to select features with the genetic
+            algorithm on the training split. Not available for the GA network strategies.
+        feature_penalty (float): Fitness penalty per fraction of features kept by the
+            genetic selection.
+    """
 
     # Data Ingestion Step
     raw_df = data_ingestion_step(file_path=StringConstants.file_path)
@@ -39,16 +58,56 @@ def ml_pipeline():
         target_column="flag",
     )
 
+    # Feature Selection Step on the training split only
+    if genetic_feature_selection:
+        X_train, X_test = feature_selection_step(
+            X_train=X_train,
+            X_test=X_test,
+            y_train=y_train,
+            strategy=strategy,
+            feature_penalty=feature_penalty,
+        )
+
+    # Record the raw input schema the serving path validates requests against
+    input_schema_step.with_options(
+        experiment_tracker=get_experiment_tracker_name()
+    )(
+        X=X_train,
+    )
+
+    # Cross-Validation Step on the raw training data
+    if cross_validate:
+        cross_validation_step.with_options(
+            experiment_tracker=get_experiment_tracker_name()
+        )(
+            X=X_train,
+            y=y_train,
+            strategy=strategy,
+        )
+
     # Normalize the training dataset
-    X_train_norm = feature_engineering_step(
+    X_train_norm, transformer = feature_engineering_step(
         df=X_train,
     )
 
     # Data Modelling Step
-    model = data_modelling_step(
+    model = data_modelling_step.with_options(
+        experiment_tracker=get_experiment_tracker_name()
+    )(
         X_train=X_train_norm,
         y_train=y_train,
+        strategy=strategy,
+    )
+
+    # Model Evaluation Step
+    model_evaluation_step.with_options(
+        experiment_tracker=get_experiment_tracker_name()
+    )(
+        trained_model=model,
+        X_train=X_train_norm,
+        X_test=X_test,
+        y_test=y_test,
+        transformer=transformer,
     )
 
-    # TODO: Implement model evaluation
     return model
@@ -0,0 +1,69 @@
+import click
+
+from constants.string_constants import StringConstants
+
+
+@click.command()
+@click.option(
+    "--model-uri",
+    required=True,
+    help="MLflow URI of the trained pipeline, e.g. models:/ethereum_fraud_detection/latest.",
+)
+@click.option("--input", "input_path", required=True, help="JSONL or CSV file of records to score.")
+@click.option("--output", "output_path", required=True, help="JSONL or CSV file to write the scored records to.")
+@click.option("--chunk-size", default=50_000, help="Number of records scored at once.")
+@click.option("--workers", default=None, type=int, help="Number of scoring threads. Defaults to the CPU count.")
+@click.option(
+    "--transformer",
+    "transformer_path",
+    default=StringConstants.transformer_path,
+    help="Feature transformer saved at training time; records are transformed before scoring.",
+)
+@click.option(
+    "--schema",
+    "schema_path",
+    default=StringConstants.input_schema_path,
+    help="Input schema artifact saved at training time; invalid records are reported, not scored.",
+)
+def run_main(
+    model_uri: str,
+    input_path: str,
+    output_path: str,
+    chunk_size: int,
+    workers: int,
+    transformer_path: str,
+    schema_path: str,
+):
+    """Streams a file of records through the trained pipeline with bounded memory
+    and writes them back with their fraud score, in input order.
+    """
+    import os
+
+    from src.batch_scoring import StreamingBatchScorer
+    from src.input_schema import load_compiled_schema
+    from src.model_packaging import load_feature_transformer
+    from src.prediction_server import load_pipeline
+
+    # The pipeline was trained on transformed features, so raw records must not reach it.
+    try:
+        transformer = load_feature_transformer(transformer_path)
+    except FileNotFoundError as e:
+        raise click.ClickException(str(e))
+
+    scorer = StreamingBatchScorer(
+        load_pipeline(model_uri),
+        columns=list(transformer.feature_names_in_),
+        transformer=transformer,
+        chunk_size=chunk_size,
+        n_workers=workers,
+        schema=load_compiled_schema(schema_path) if os.path.exists(schema_path) else None,
+    )
+    summary = scorer.score_file(input_path, output_path)
+    print(
+        f"Scored {summary['rows']} records in {summary['seconds']:.1f}s "
+        f"({summary['rows_per_second']:.0f} records/s) into {output_path}"
+    )
+
+
+if __name__ == "__main__":
+    run_main()
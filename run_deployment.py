@@ -1,14 +1,6 @@
 import click
 from constants.string_constants import StringConstants
-from pipelines.deployment_pipeline import (
-    continuous_deployment_pipeline,
-    inference_pipeline,
-)
 from rich import print
-from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
-from zenml.integrations.mlflow.model_deployers.mlflow_model_deployer import (
-    MLFlowModelDeployer,
-)
 
 
 # This command is used to stop the deployment service.
@@ -25,6 +17,11 @@ def run_main(stop_service: bool):
     """
     model_name = StringConstants.name
 
+    # ZenML and the MLflow deployer are only loaded once a command needs them
+    from zenml.integrations.mlflow.model_deployers.mlflow_model_deployer import (
+        MLFlowModelDeployer,
+    )
+
     # If the stop-service flag is set, stop the prediction service.
     if stop_service:
         # Get the MLflow model deployer stack component
@@ -43,6 +40,13 @@ def run_main(stop_service: bool):
             existing_services[0].stop(timeout=10)
         return
 
+    # The pipelines pull in the training and modelling steps, which stopping a service does not need
+    from pipelines.deployment_pipeline import (
+        continuous_deployment_pipeline,
+        inference_pipeline,
+    )
+    from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
+
     # Run the continuous deployment pipeline
     continuous_deployment_pipeline()
 
@@ -1,15 +1,47 @@
 import click
-from pipelines.training_pipeline import ml_pipeline
-from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
 
 
 @click.command()
-def main():
+@click.option(
+    "--strategy",
+    default="gacs",
+    help="Modelling strategy: 'gacs', 'numpy_gacs', 'lgbm', 'lgbm_classifier' or 'cascade'.",
+)
+@click.option(
+    "--cross-validate",
+    is_flag=True,
+    default=False,
+    help="Cross-validate the strategy on stratified folds before training it.",
+)
+@click.option(
+    "--genetic-feature-selection",
+    is_flag=True,
+    default=False,
+    help="Select features with the genetic algorithm on the training split "
+    "(not with the GA network strategies).",
+)
+@click.option(
+    "--feature-penalty",
+    default=0.0,
+    help="Fitness penalty per fraction of features kept by the genetic selection.",
+)
+def main(
+    strategy: str, cross_validate: bool, genetic_feature_selection: bool, feature_penalty: float
+):
     """
     Run the ML pipeline and start the MLflow UI for experiment tracking.
     """
+    # Imported here so that `--help` does not initialise ZenML and the modelling backends
+    from pipelines.training_pipeline import ml_pipeline
+    from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
+
     # Run the pipeline
-    run = ml_pipeline()
+    run = ml_pipeline(
+        strategy=strategy,
+        cross_validate=cross_validate,
+        genetic_feature_selection=genetic_feature_selection,
+        feature_penalty=feature_penalty,
+    )
 
     # You can uncomment and customize the following lines if you want to retrieve and inspect the trained model:
     # trained_model = run["model_building_step"]  # Replace with actual step name if different
@@ -0,0 +1,141 @@
+import click
+
+from constants.string_constants import StringConstants
+
+
+@click.command()
+@click.option(
+    "--model-uri",
+    required=True,
+    help="MLflow URI of the trained pipeline, e.g. models:/ethereum_fraud_detection/latest.",
+)
+@click.option("--host", default="127.0.0.1", help="Interface to listen on.")
+@click.option("--port", default=8000, help="Port to listen on.")
+@click.option(
+    "--max-batch-size",
+    default=256,
+    help="Maximum number of rows scored in one micro-batch.",
+)
+@click.option(
+    "--max-wait-ms",
+    default=2.0,
+    help="Longest time a request waits for others to join its micro-batch.",
+)
+@click.option(
+    "--cache-size",
+    default=100_000,
+    help="Number of row predictions cached in front of the model; 0 disables the cache.",
+)
+@click.option("--cache-ttl", default=300.0, help="Lifetime of a cached prediction, in seconds.")
+@click.option(
+    "--replay-size",
+    default=256,
+    help="Number of recent requests replayed to warm up a model version swapped in on /swap.",
+)
+@click.option(
+    "--shadow-model-uri",
+    default=None,
+    help="MLflow URI of a candidate pipeline that scores a copy of the traffic in the background.",
+)
+@click.option(
+    "--shadow-queue-size",
+    default=1024,
+    help="Mirrored requests waiting for the candidate; further ones are dropped.",
+)
+@click.option(
+    "--schema",
+    "schema_path",
+    default=StringConstants.input_schema_path,
+    help="Input schema artifact saved at training time; requests are validated against it.",
+)
+@click.option(
+    "--transformer",
+    "transformer_path",
+    default=StringConstants.transformer_path,
+    help="Feature transformer saved at training time; rows are transformed before scoring.",
+)
+@click.option(
+    "--metrics/--no-metrics",
+    default=True,
+    help="Export per-stage latency histograms for Prometheus on /metrics.",
+)
+@click.option(
+    "--explain-background",
+    "explain_background_path",
+    default=None,
+    help="JSONL or CSV file of raw records (e.g. a training sample) SHAP values are computed "
+    "against; enables /explain.",
+)
+def run_main(
+    model_uri: str,
+    host: str,
+    port: int,
+    max_batch_size: int,
+    max_wait_ms: float,
+    cache_size: int,
+    cache_ttl: float,
+    replay_size: int,
+    shadow_model_uri: str,
+    shadow_queue_size: int,
+    schema_path: str,
+    transformer_path: str,
+    metrics: bool,
+    explain_background_path: str,
+):
+    """Serves the trained pipeline with micro-batched predictions on /invocations,
+    as a local alternative to the MLflow prediction server. New model versions are
+    swapped in without downtime by posting {"model_uri": ...} to /swap, and a candidate
+    can be compared on live traffic on /shadow. Prometheus scrapes /metrics, and
+    /explain returns the SHAP values of the posted rows.
+    """
+    import os
+
+    from src.caching import PredictionCache
+    from src.input_schema import load_compiled_schema
+    from src.model_packaging import load_feature_transformer
+    from src.prediction_server import PredictionServer, load_pipeline
+    from src.serving_metrics import ServingMetrics
+    from src.shadow_scoring import ShadowScorer
+
+    # The pipelines were trained on transformed features, so raw rows must not reach them.
+    try:
+        transformer = load_feature_transformer(transformer_path)
+    except FileNotFoundError as e:
+        raise click.ClickException(str(e))
+
+    explanation_background = None
+    if explain_background_path:
+        from src.batch_scoring import iter_record_chunks
+
+        # A thousand rows are plenty; the network explainer keeps a sample of them.
+        explanation_background = next(iter_record_chunks(explain_background_path, 1000))
+
+    shadow = None
+    if shadow_model_uri:
+        shadow = ShadowScorer(
+            load_pipeline(shadow_model_uri),
+            max_queue_size=shadow_queue_size,
+            model_version=shadow_model_uri,
+        )
+
+    server = PredictionServer(
+        load_pipeline(model_uri),
+        transformer=transformer,
+        host=host,
+        port=port,
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+        cache=PredictionCache(cache_size, cache_ttl) if cache_size else None,
+        # The model URI identifies the deployed version, e.g. models:/<name>/<version>.
+        model_version=model_uri,
+        replay_size=replay_size,
+        shadow=shadow,
+        schema=load_compiled_schema(schema_path) if os.path.exists(schema_path) else None,
+        metrics=ServingMetrics() if metrics else None,
+        explanation_background=explanation_background,
+    )
+    server.run()
+
+
+if __name__ == "__main__":
+    run_main()
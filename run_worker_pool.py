@@ -0,0 +1,79 @@
+import click
+
+from constants.string_constants import StringConstants
+
+
+@click.command()
+@click.option(
+    "--model-uri",
+    required=True,
+    help="MLflow URI of the trained pipeline, e.g. models:/ethereum_fraud_detection/latest.",
+)
+@click.option("--workers", default=3, help="Number of pre-forked worker processes.")
+@click.option(
+    "--socket",
+    "socket_path",
+    default=StringConstants.worker_pool_socket,
+    help="Unix socket the workers accept batches on.",
+)
+@click.option(
+    "--schema",
+    "schema_path",
+    default=StringConstants.input_schema_path,
+    help="Input schema artifact saved at training time, giving the model's feature order.",
+)
+@click.option(
+    "--transformer",
+    "transformer_path",
+    default=StringConstants.transformer_path,
+    help="Feature transformer saved at training time; rows are transformed before scoring.",
+)
+def run_main(
+    model_uri: str, workers: int, socket_path: str, schema_path: str, transformer_path: str
+):
+    """Serves the trained pipeline from a pool of pre-forked warm workers until interrupted.
+    A model package is loaded once and shared by the workers; other models (e.g. the Keras
+    GA network, which is not fork-safe) are loaded by every worker after the fork.
+    """
+    import os
+
+    from src.input_schema import InputSchema
+    from src.model_packaging import is_model_package, load_feature_transformer
+    from src.prediction_server import load_pipeline
+    from src.worker_pool import WarmWorkerPool
+
+    try:
+        transformer = load_feature_transformer(transformer_path)
+    except FileNotFoundError as e:
+        raise click.ClickException(str(e))
+    columns = InputSchema.load(schema_path).columns
+
+    # Packages hold numpy arrays mapped read-only, which are safe to share across a fork.
+    if os.path.isfile(model_uri) and is_model_package(model_uri):
+        model, model_loader = load_pipeline(model_uri), None
+    else:
+        model, model_loader = None, lambda: load_pipeline(model_uri)
+
+    pool = WarmWorkerPool(
+        model,
+        columns,
+        n_workers=workers,
+        socket_path=socket_path,
+        transformer=transformer,
+        model_loader=model_loader,
+    )
+    pool.start()
+    try:
+        ready = pool.wait_until_ready()
+    except RuntimeError as e:
+        pool.stop()
+        raise click.ClickException(str(e))
+    if not ready:
+        pool.stop()
+        raise click.ClickException("The workers did not warm up in time.")
+    click.echo(f"{workers} warm workers listening on {socket_path}. Press Ctrl+C to stop.")
+    pool.supervise()
+
+
+if __name__ == "__main__":
+    run_main()
@@ -0,0 +1,333 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from src.data_modelling import predict_positive_scores
+from src.input_schema import CompiledSchema, describe_error
+from src.payload_decoding import EXPECTED_COLUMNS
+from src.serving_metrics import ServingMetrics
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+# Marks the end of the chunk stream on the writer queue.
+_END_OF_STREAM = None
+
+
+def _file_format(path: str) -> str:
+    """
+    Returns 'jsonl' or 'csv' from the file extension.
+
+    Raises:
+        ValueError: If the extension is neither.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(f"Unsupported file format: {path} (expected .jsonl or .csv)")
+
+
+def iter_record_chunks(path: str, chunk_size: int):
+    """
+    Reads a JSONL or CSV file of records in fixed-size chunks.
+
+    Parameters:
+        path (str): The input file.
+        chunk_size (int): Number of records per chunk.
+
+    Yields:
+        pd.DataFrame: The records of each chunk.
+    """
+    if _file_format(path) == "csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    else:
+        with open(path) as f:
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    return
+                # A chunk of blank lines is skipped; only the end of the file stops reading.
+                records = [json.loads(line) for line in lines if line.strip()]
+                if records:
+                    yield pd.DataFrame.from_records(records)
+
+
+def _row_errors(codes: np.ndarray) -> np.ndarray:
+    """
+    Describes the schema errors of every row, with an empty string for valid rows.
+    """
+    errors = np.full(len(codes), "", dtype=object)
+    for row in np.flatnonzero(codes):
+        errors[row] = ", ".join(describe_error(codes[row]))
+    return errors
+
+
+def write_chunk(chunk: pd.DataFrame, f, file_format: str, first: bool):
+    """
+    Appends one scored chunk to an open output file.
+    """
+    if file_format == "csv":
+        chunk.to_csv(f, header=first, index=False)
+    else:
+        text = chunk.to_json(orient="records", lines=True)
+        f.write(text if text.endswith("\n") else text + "\n")
+
+
+# Streaming batch scorer
+# ----------------------
+# Reading, scoring and writing overlap: a bounded window of chunks is scored on a worker
+# pool while a writer thread drains the finished chunks in input order, so memory stays
+# flat however large the input is. With an input schema, invalid rows are reported
+# instead of scored, as in `score_records`.
+class StreamingBatchScorer:
+    def __init__(
+        self,
+        model,
+        columns: list = None,
+        transformer=None,
+        chunk_size: int = 50_000,
+        n_workers: int = None,
+        max_pending: int = None,
+        score_column: str = "fraud_score",
+        metrics: ServingMetrics = None,
+        schema: CompiledSchema = None,
+    ):
+        """
+        Initializes the StreamingBatchScorer with a trained model loaded once.
+
+        Parameters:
+            model: The trained model or pipeline.
+            columns (list): Feature order expected by the model. Defaults to the schema's
+                columns, then to the model's `feature_names_in_`, then to EXPECTED_COLUMNS.
+            transformer: Feature transformer applied before predicting, if the model expects it.
+            chunk_size (int): Number of records scored at once.
+            n_workers (int): Number of scoring threads. Defaults to the CPU count.
+            max_pending (int): Maximum number of chunks read but not yet written. Defaults to 2 * n_workers.
+            score_column (str): Name of the fraud score column added to the output.
+            metrics (ServingMetrics): Records the time spent reading, building frames,
+                validating, preprocessing, predicting and writing each chunk, if given.
+            schema (CompiledSchema): Input schema every record is validated against; invalid
+                records get no score and an 'input_errors' description, if given.
+        """
+        if columns is None and schema is not None:
+            columns = schema.columns
+        if columns is None:
+            columns = getattr(model, "feature_names_in_", None)
+        self.model = model
+        self.columns = list(columns) if columns is not None else EXPECTED_COLUMNS
+        self.transformer = transformer
+        self.chunk_size = chunk_size
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.n_workers
+        self.score_column = score_column
+        self.metrics = metrics
+        self.schema = schema
+
+    def score_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Scores one chunk of records and appends the fraud score.
+
+        Parameters:
+            chunk (pd.DataFrame): The records, with at least the model's feature columns.
+
+        Returns:
+            pd.DataFrame: The records with the score column, plus an 'input_errors' column
+                when a schema is used.
+
+        Raises:
+            ValueError: If a feature column is missing from the records.
+        """
+        missing = [column for column in self.columns if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+
+        start = time.perf_counter()
+        features = chunk[self.columns]
+        selected = time.perf_counter()
+        codes = None
+        if self.schema is not None:
+            # Text that is not a number becomes NaN and is rejected as a missing value.
+            features = features.apply(pd.to_numeric, errors="coerce")
+            codes = self.schema.validate(features.to_numpy(np.float32))
+            features = features[codes == 0]
+        validated = time.perf_counter()
+        if self.transformer is not None:
+            X = self.transformer.transform(features)
+        else:
+            X = features.to_numpy(dtype=np.float32)
+        preprocessed = time.perf_counter()
+        X = pd.DataFrame(X, columns=self.columns)
+        framed = time.perf_counter()
+        scores = predict_positive_scores(self.model, X) if len(X) else np.zeros(0)
+
+        if codes is None:
+            scored = chunk.assign(**{self.score_column: scores})
+        else:
+            all_scores = np.full(len(chunk), np.nan)
+            all_scores[codes == 0] = scores
+            scored = chunk.assign(
+                **{self.score_column: all_scores, "input_errors": _row_errors(codes)}
+            )
+
+        if self.metrics is not None:
+            stages = {
+                "dataframe": (selected - start) + (framed - preprocessed),
+                "preprocess": preprocessed - validated,
+                "model": time.perf_counter() - framed,
+            }
+            if codes is not None:
+                stages["validate"] = validated - selected
+            self.metrics.observe_stages(stages)
+            self.metrics.observe_batch(len(chunk))
+        return scored
+
+    def _write_chunks(self, output_path: str, chunks: queue.Queue, errors: list):
+        """
+        Writes scored chunks from the queue until the end of the stream.
+        """
+        file_format = _file_format(output_path)
+        try:
+            with open(output_path, "w", newline="") as f:
+                first = True
+                while True:
+                    chunk = chunks.get()
+                    if chunk is _END_OF_STREAM:
+                        return
+                    start = time.perf_counter()
+                    write_chunk(chunk, f, file_format, first)
+                    if self.metrics is not None:
+                        self.metrics.observe_stage("encode", time.perf_counter() - start)
+                    first = False
+        except Exception as e:
+            errors.append(e)
+            # Keep draining so the producer never blocks on a dead writer.
+            while chunks.get() is not _END_OF_STREAM:
+                pass
+
+    def score_file(self, input_path: str, output_path: str) -> dict:
+        """
+        Streams a JSONL or CSV file through the model into an output file of the same records
+        plus their score, in input order.
+
+        Parameters:
+            input_path (str): The JSONL or CSV file of records.
+            output_path (str): The JSONL or CSV file to write.
+
+        Returns:
+            dict: The number of rows and chunks, the elapsed time and the throughput, plus
+                the mean and p95 time of every stage when metrics are recorded.
+        """
+        _file_format(output_path)
+        logging.info(
+            f"Scoring {input_path} in chunks of {self.chunk_size} with {self.n_workers} workers."
+        )
+        start = time.perf_counter()
+        n_rows = n_chunks = 0
+
+        finished = queue.Queue(maxsize=self.max_pending)
+        errors = []
+        writer = threading.Thread(
+            target=self._write_chunks, args=(output_path, finished, errors), daemon=True
+        )
+        writer.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                pending = deque()
+                chunks = iter_record_chunks(input_path, self.chunk_size)
+                while True:
+                    read_start = time.perf_counter()
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    if self.metrics is not None:
+                        self.metrics.observe_stage("decode", time.perf_counter() - read_start)
+                    if errors:
+                        break
+                    pending.append(executor.submit(self.score_chunk, chunk))
+                    n_rows += len(chunk)
+                    n_chunks += 1
+                    # Wait for the oldest chunk once the window is full; this applies backpressure.
+                    if len(pending) >= self.max_pending:
+                        finished.put(pending.popleft().result())
+                while pending:
+                    finished.put(pending.popleft().result())
+        finally:
+            finished.put(_END_OF_STREAM)
+            writer.join()
+
+        if errors:
+            raise errors[0]
+
+        elapsed = time.perf_counter() - start
+        summary = {
+            "rows": n_rows,
+            "chunks": n_chunks,
+            "seconds": elapsed,
+            "rows_per_second": n_rows / elapsed if elapsed else 0.0,
+        }
+        if self.metrics is not None:
+            summary.update(self.metrics.summary())
+        logging.info(f"Batch scoring completed: {summary}")
+        return summary
+
+
+def score_records(
+    records: pd.DataFrame,
+    score_fn,
+    schema: CompiledSchema,
+    chunk_size: int = 10_000,
+    score_column: str = "fraud_score",
+    progress=None,
+) -> pd.DataFrame:
+    """
+    Scores an in-memory table of records in vectorized chunks, e.g. an uploaded file.
+
+    Rows failing the schema checks are not scored; their errors are reported instead.
+
+    Parameters:
+        records (pd.DataFrame): The records, with at least the schema's feature columns.
+        score_fn (callable): Maps a float32 array in the schema's column order to one fraud
+            score per row.
+        schema (CompiledSchema): The model's input schema.
+        chunk_size (int): Number of rows scored at once.
+        score_column (str): Name of the fraud score column added to the output.
+        progress (callable): Called with the fraction of rows done after every chunk.
+
+    Returns:
+        pd.DataFrame: The records with the score column (NaN for invalid rows) and an
+            'input_errors' column describing why a row was not scored.
+
+    Raises:
+        ValueError: If a feature column is missing from the records.
+    """
+    missing = [column for column in schema.columns if column not in records.columns]
+    if missing:
+        raise ValueError(f"Missing feature columns: {missing}")
+
+    # Text that is not a number becomes NaN and is rejected as a missing value.
+    X = records[schema.columns].apply(pd.to_numeric, errors="coerce").to_numpy(np.float32)
+    codes = schema.validate(X)
+    valid_rows = np.flatnonzero(codes == 0)
+
+    scores = np.full(len(records), np.nan)
+    for start in range(0, len(valid_rows), chunk_size):
+        rows = valid_rows[start : start + chunk_size]
+        scores[rows] = np.asarray(score_fn(X[rows]), dtype=np.float64).reshape(len(rows), -1)[:, -1]
+        if progress is not None:
+            progress(min(start + chunk_size, len(valid_rows)) / len(valid_rows))
+
+    return records.assign(**{score_column: scores, "input_errors": _row_errors(codes)})
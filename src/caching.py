@@ -0,0 +1,192 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+# Bounded LRU cache
+# -----------------
+# Keeps the most recently used entries up to a fixed size, optionally expiring them
+# a fixed time after they were stored.
+class LRUCache:
+    def __init__(self, max_size: int = 100_000, ttl_seconds: float = None):
+        """
+        Initializes the LRUCache with a maximum number of entries.
+
+        Parameters:
+            max_size (int): Number of entries kept before the least recently used is evicted.
+            ttl_seconds (float): Lifetime of an entry; None keeps entries until evicted.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Returns the cached value of a key, or None when it is not cached or has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Caches a value, evicting the least recently used entry when full.
+        """
+        expires_at = None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Drops all entries and resets the statistics.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the size, hit/miss counters and hit rate of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def feature_vector_keys(X: np.ndarray) -> list:
+    """
+    Hashes every schema-ordered feature row into a stable 16-byte key.
+
+    The rows are canonicalised first, so -0.0 and 0.0, and all NaN payloads, share a key.
+
+    Parameters:
+        X (np.ndarray): The feature data, already in the model's column order.
+
+    Returns:
+        list: One key per row.
+    """
+    X = np.asarray(X, dtype=np.float64) + 0.0
+    X[np.isnan(X)] = np.nan
+    row_bytes = np.ascontiguousarray(X).tobytes()
+    width = X.shape[1] * X.itemsize
+    return [
+        hashlib.blake2b(row_bytes[start : start + width], digest_size=16).digest()
+        for start in range(0, len(row_bytes), width)
+    ]
+
+
+# Prediction cache
+# ----------------
+# Caches the predictions of feature rows for the active model version.
+class PredictionCache:
+    def __init__(self, max_size: int = 100_000, ttl_seconds: float = 300.0, model_version: str = None):
+        """
+        Initializes the PredictionCache with its bounds.
+
+        Parameters:
+            max_size (int): Maximum number of cached rows.
+            ttl_seconds (float): Lifetime of a cached prediction, bounding staleness.
+            model_version (str): Version of the model whose predictions are cached.
+        """
+        self.cache = LRUCache(max_size, ttl_seconds)
+        self.model_version = model_version
+
+    def set_model_version(self, model_version: str):
+        """
+        Invalidates all cached predictions when a different model version is deployed.
+
+        Parameters:
+            model_version (str): The newly active model version.
+        """
+        if model_version != self.model_version:
+            logging.info(
+                f"Model version changed from {self.model_version} to {model_version}; "
+                f"dropping {len(self.cache)} cached predictions."
+            )
+            self.cache.clear()
+            self.model_version = model_version
+
+    def reset(self, model_version: str):
+        """
+        Drops all cached predictions for a newly swapped-in model, even if its version label
+        is unchanged, e.g. a moving alias such as 'models:/<name>/latest'.
+
+        Parameters:
+            model_version (str): The newly active model version.
+        """
+        logging.info(
+            f"Model swapped from {self.model_version} to {model_version}; "
+            f"dropping {len(self.cache)} cached predictions."
+        )
+        self.cache.clear()
+        self.model_version = model_version
+
+    def lookup(self, X: np.ndarray) -> tuple:
+        """
+        Looks up the cached predictions of a batch.
+
+        Parameters:
+            X (np.ndarray): The feature data, in the model's column order.
+
+        Returns:
+            tuple: The row keys, the cached predictions (None for misses) and the indices of the missed rows.
+        """
+        keys = feature_vector_keys(X)
+        cached = [self.cache.get(key) for key in keys]
+        missing = [index for index, value in enumerate(cached) if value is None]
+        return keys, cached, missing
+
+    def store(self, keys: list, predictions: np.ndarray):
+        """
+        Caches the predictions of freshly scored rows.
+
+        Parameters:
+            keys (list): The keys of the scored rows.
+            predictions (np.ndarray): Their predictions, one entry per key.
+        """
+        for key, prediction in zip(keys, predictions):
+            self.cache.put(key, prediction)
+
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics with the cached model version.
+        """
+        return {**self.cache.stats(), "model_version": self.model_version}
@@ -0,0 +1,197 @@
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.data_modelling import (
+    DataModellingStrategy,
+    init_thread_limited_worker,
+    predict_positive_scores,
+    thread_limited_environment,
+)
+from src.feature_engineering import NormalizeFeatureEngineeringStrategy
+from src.model_evaluation import StreamingMetricsAccumulator
+from src.shared_arrays import SharedArray, attach_shared_array
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+def _run_fold(
+    fold: int,
+    strategy: DataModellingStrategy,
+    descriptors: dict,
+    columns: list,
+    train_index: np.ndarray,
+    test_index: np.ndarray,
+    threshold: float,
+) -> dict:
+    """
+    Fits the preprocessing and the model on one training fold and evaluates them on its test fold.
+
+    The imputer and the power transform are fitted on the training fold only, so no
+    statistics of the test fold leak into the model.
+
+    Returns:
+        dict: The timings and metrics of the fold.
+    """
+    from sklearn.metrics import roc_auc_score
+
+    X = attach_shared_array(descriptors["X"])
+    y = attach_shared_array(descriptors["y"])
+
+    start = time.perf_counter()
+    X_train = pd.DataFrame(X[train_index], columns=columns)
+    X_test = pd.DataFrame(X[test_index], columns=columns)
+
+    medians = X_train.median()
+    X_train = X_train.fillna(medians)
+    X_test = X_test.fillna(medians)
+
+    normalizer = NormalizeFeatureEngineeringStrategy()
+    X_train = normalizer.apply_transformation(X_train)
+    X_test = pd.DataFrame(normalizer.transformer.transform(X_test), columns=columns)
+    preprocessing_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model = strategy.build_and_train_model(X_train, pd.Series(y[train_index]))
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = predict_positive_scores(model, X_test)
+    predict_time = time.perf_counter() - start
+
+    accumulator = StreamingMetricsAccumulator(threshold=threshold)
+    accumulator.update(y[test_index], scores)
+    metrics = accumulator.result()
+
+    return {
+        "fold": fold,
+        "train_rows": len(train_index),
+        "test_rows": len(test_index),
+        "preprocessing_time_s": preprocessing_time,
+        "fit_time_s": fit_time,
+        "predict_time_s": predict_time,
+        "accuracy": metrics["accuracy"],
+        "precision": metrics["precision"],
+        "recall": metrics["recall"],
+        "f1_score": metrics["f1_score"],
+        "log_loss": metrics["log_loss"],
+        "roc_auc": roc_auc_score(y[test_index], scores),
+    }
+
+
+# Parallel Stratified Cross-Validation
+# ------------------------------------
+# The feature matrix is copied once into shared memory; the folds only send index arrays
+# to the worker processes.
+class StratifiedCrossValidator:
+    def __init__(
+        self,
+        n_splits: int = 5,
+        n_workers: int = None,
+        threads_per_worker: int = 1,
+        threshold: float = 0.5,
+        random_state: int = 42,
+    ):
+        """
+        Initializes the StratifiedCrossValidator with specific parameters.
+
+        Parameters:
+            n_splits (int): Number of stratified folds.
+            n_workers (int): Number of worker processes. Defaults to CPU count / threads_per_worker.
+            threads_per_worker (int): BLAS/OpenMP threads allowed per worker.
+            threshold (float): Decision threshold on the fraud score.
+            random_state (int): Seed of the fold shuffling.
+        """
+        self.n_splits = n_splits
+        self.n_workers = n_workers
+        self.threads_per_worker = threads_per_worker
+        self.threshold = threshold
+        self.random_state = random_state
+
+    def cross_validate(
+        self, strategy: DataModellingStrategy, X: pd.DataFrame, y: pd.Series
+    ) -> pd.DataFrame:
+        """
+        Trains and evaluates the strategy on every fold in parallel.
+
+        Parameters:
+            strategy (DataModellingStrategy): The modelling strategy to validate.
+            X (pd.DataFrame): The raw (not yet imputed or normalized) feature data.
+            y (pd.Series): The target data.
+
+        Returns:
+            pd.DataFrame: One row of timings and metrics per fold.
+        """
+        from sklearn.model_selection import StratifiedKFold
+
+        folds = StratifiedKFold(
+            n_splits=self.n_splits, shuffle=True, random_state=self.random_state
+        ).split(np.zeros(len(y)), y)
+
+        n_workers = self.n_workers or max(1, (os.cpu_count() or 1) // self.threads_per_worker)
+        n_workers = min(n_workers, self.n_splits)
+        logging.info(
+            f"Cross-validating {type(strategy).__name__} on {self.n_splits} folds "
+            f"with {n_workers} workers."
+        )
+
+        shared = {
+            "X": SharedArray(X.to_numpy(dtype=np.float64)),
+            "y": SharedArray(np.asarray(y)),
+        }
+        descriptors = {key: array.descriptor for key, array in shared.items()}
+
+        try:
+            with thread_limited_environment(self.threads_per_worker), ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_thread_limited_worker,
+                initargs=(self.threads_per_worker,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _run_fold,
+                        fold,
+                        strategy,
+                        descriptors,
+                        list(X.columns),
+                        train_index,
+                        test_index,
+                        self.threshold,
+                    )
+                    for fold, (train_index, test_index) in enumerate(folds)
+                ]
+                rows = [future.result() for future in futures]
+        finally:
+            for array in shared.values():
+                array.release()
+
+        results = pd.DataFrame(rows)
+        logging.info(f"Cross-validation results:\n{results.to_string(index=False)}")
+        return results
+
+    @staticmethod
+    def summarize(results: pd.DataFrame) -> dict:
+        """
+        Summarizes the per-fold results into their mean and standard deviation.
+
+        Parameters:
+            results (pd.DataFrame): The output of `cross_validate`.
+
+        Returns:
+            dict: `cv_<column>_mean` and `cv_<column>_std` for every timing and metric.
+        """
+        columns = results.columns.drop(["fold", "train_rows", "test_rows"])
+        summary = {}
+        for column in columns:
+            summary[f"cv_{column}_mean"] = float(results[column].mean())
+            summary[f"cv_{column}_std"] = float(results[column].std(ddof=0))
+        return summary
@@ -1,12 +1,22 @@
+import itertools
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import numpy as np
 import pandas as pd
-from sklearn.base import RegressorMixin
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
-from keras.models import load_model
-from lightgbm import LGBMRegressor
 
 from constants.string_constants import StringConstants
+from src.numpy_inference import NumpyGeneticModel
+from src.shared_arrays import SharedArray, attach_shared_array
+from src.tree_ensemble import FlatTreeEnsemble
 
 
 # Abstract class for Model Building Strategy
@@ -47,6 +57,9 @@ class GACSModellingStrategy(DataModellingStrategy):
         Returns:
             Pipeline: The trained pipeline containing the GACS model.
         """
+        # TensorFlow is only imported once a GACS model is actually built
+        from keras.models import load_model
+
         # Set up logging
         logging.basicConfig(level=logging.INFO)
         logger = logging.getLogger(__name__)
@@ -71,6 +84,70 @@ class GACSModellingStrategy(DataModellingStrategy):
         return pipeline
 
 
+# Numpy GACS network with the scikit-learn estimator interface required by Pipeline.
+class PipelineNumpyGeneticModel(NumpyGeneticModel, BaseEstimator):
+    pass
+
+
+# Flat LightGBM ensemble with the scikit-learn estimator interface required by Pipeline.
+class PipelineFlatTreeEnsemble(FlatTreeEnsemble, BaseEstimator):
+    pass
+
+
+def flatten_lgbm_pipeline(pipeline: Pipeline) -> Pipeline:
+    """
+    Replaces the trained LightGBM model of a pipeline with its flat array-based predictor.
+
+    Parameters:
+        pipeline (Pipeline): A trained pipeline whose 'model' step is a LightGBM model.
+
+    Returns:
+        Pipeline: A pipeline with the same preceding steps and a flat tree ensemble.
+    """
+    flat_model = FlatTreeEnsemble.from_lightgbm(pipeline.named_steps["model"])
+    steps = pipeline.steps[:-1] + [
+        ("model", PipelineFlatTreeEnsemble(flat_model.arrays, flat_model.metadata))
+    ]
+    return Pipeline(steps)
+
+
+# Concrete class to serve the GACS network without TensorFlow.
+class NumpyGACSModellingStrategy(DataModellingStrategy):
+    def build_and_train_model(
+        self,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+    ) -> RegressorMixin:
+        """
+        Loads the pre-trained GACS network into the numpy inference engine.
+
+        Parameters:
+            X_train (pd.DataFrame): The feature data for training the model.
+            y_train (pd.Series): The target data for training the model.
+
+        Returns:
+            Pipeline: The pipeline containing the numpy GACS model.
+        """
+        # Set up logging
+        logging.basicConfig(level=logging.INFO)
+        logger = logging.getLogger(__name__)
+
+        logger.info("Loading the genetic model weights for numpy inference.")
+
+        try:
+            gacs_model = PipelineNumpyGeneticModel(StringConstants.genetic_model_path)
+            logger.info("Model weights loaded successfully.")
+        except Exception as e:
+            logger.error(f"Error loading model weights: {e}")
+            raise
+
+        # The network is pre-trained, so fitting the pipeline is a no-op.
+        pipeline = Pipeline([("model", gacs_model)])
+        pipeline.fit(X_train, y_train)
+
+        return pipeline
+
+
 # Concrete class to implement the LGBM Algorithm.
 class LGBMModellingStrategy(DataModellingStrategy):
     def build_and_train_model(
@@ -88,6 +165,8 @@ class LGBMModellingStrategy(DataModellingStrategy):
         Returns:
             Pipeline: The trained pipeline containing the LGBM model.
         """
+        from lightgbm import LGBMRegressor
+
         # Set up logging
         logging.basicConfig(level=logging.INFO)
         logger = logging.getLogger(__name__)
@@ -111,6 +190,601 @@ class LGBMModellingStrategy(DataModellingStrategy):
             raise
 
 
+# Concrete class to implement the LGBM classifier with successive-halving tuning.
+class LGBMClassifierModellingStrategy(DataModellingStrategy):
+    # Grid from the EDA notebook; n_estimators is the resource of successive halving.
+    default_param_grid = {
+        "learning_rate": [0.01, 0.1, 0.2],
+        "max_depth": [3, 5, 7],
+        "num_leaves": [31, 63, 127],
+    }
+
+    def __init__(
+        self,
+        param_grid: dict = None,
+        max_estimators: int = 300,
+        reduction_factor: int = 3,
+        validation_size: float = 0.2,
+        early_stopping_rounds: int = 30,
+        n_jobs: int = None,
+        random_state: int = 42,
+    ):
+        """
+        Initializes the LGBMClassifierModellingStrategy with specific parameters.
+
+        Parameters:
+            param_grid (dict): Hyperparameter grid to search. Defaults to the notebook grid.
+            max_estimators (int): Boosting rounds given to the candidates of the last rung.
+            reduction_factor (int): Fraction of candidates (1 / factor) promoted to the next rung.
+            validation_size (float): Proportion of the training data held out for early stopping.
+            early_stopping_rounds (int): Rounds without validation improvement before stopping.
+            n_jobs (int): Number of candidates trained in parallel. Defaults to the CPU count.
+            random_state (int): The seed used by the random number generator.
+        """
+        self.param_grid = param_grid or self.default_param_grid
+        self.max_estimators = max_estimators
+        self.reduction_factor = reduction_factor
+        self.validation_size = validation_size
+        self.early_stopping_rounds = early_stopping_rounds
+        self.n_jobs = n_jobs or os.cpu_count()
+        self.random_state = random_state
+        self.search_results_ = []
+
+    def _train_candidate(self, params: dict, budget: int, train_set, valid_set):
+        """
+        Trains one candidate on the shared pre-binned Dataset with early stopping.
+
+        Returns:
+            tuple: The validation AUC and the best number of boosting rounds.
+        """
+        import lightgbm as lgb
+
+        booster = lgb.train(
+            dict(
+                params,
+                objective="binary",
+                metric="auc",
+                num_threads=1,
+                seed=self.random_state,
+                verbose=-1,
+            ),
+            train_set,
+            num_boost_round=budget,
+            valid_sets=[valid_set],
+            callbacks=[lgb.early_stopping(self.early_stopping_rounds, verbose=False)],
+        )
+        best_iteration = booster.best_iteration or budget
+        return booster.best_score["valid_0"]["auc"], best_iteration
+
+    def tune(self, X_train: pd.DataFrame, y_train: pd.Series) -> tuple:
+        """
+        Searches the grid with successive halving over the number of boosting rounds.
+
+        Every rung trains all remaining candidates in parallel threads on one
+        pre-binned Dataset and keeps the best 1 / reduction_factor of them.
+
+        Parameters:
+            X_train (pd.DataFrame): The feature data for training the model.
+            y_train (pd.Series): The target data for training the model.
+
+        Returns:
+            tuple: The best parameters and their best number of boosting rounds.
+        """
+        import lightgbm as lgb
+
+        X_fit, X_valid, y_fit, y_valid = train_test_split(
+            X_train,
+            y_train,
+            test_size=self.validation_size,
+            stratify=y_train,
+            random_state=self.random_state,
+        )
+        # Bin the features once; every candidate reuses the same Datasets.
+        train_set = lgb.Dataset(X_fit, label=y_fit, params={"verbose": -1}).construct()
+        valid_set = lgb.Dataset(X_valid, label=y_valid, reference=train_set).construct()
+
+        names = list(self.param_grid)
+        candidates = [
+            dict(zip(names, values))
+            for values in itertools.product(*self.param_grid.values())
+        ]
+        n_rungs = 0
+        while self.reduction_factor**n_rungs < len(candidates):
+            n_rungs += 1
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            for rung in range(n_rungs + 1):
+                budget = max(
+                    1, self.max_estimators // self.reduction_factor ** (n_rungs - rung)
+                )
+                results = list(
+                    executor.map(
+                        lambda params: self._train_candidate(
+                            params, budget, train_set, valid_set
+                        ),
+                        candidates,
+                    )
+                )
+                for params, (score, best_iteration) in zip(candidates, results):
+                    self.search_results_.append(
+                        dict(params, rung=rung, budget=budget, auc=score, n_estimators=best_iteration)
+                    )
+                logging.info(
+                    f"Rung {rung}: {len(candidates)} candidates with {budget} rounds, "
+                    f"best validation AUC {max(score for score, _ in results):.4f}"
+                )
+
+                order = np.argsort([-score for score, _ in results], kind="stable")
+                if len(candidates) == 1 or rung == n_rungs:
+                    break
+                n_keep = max(1, len(candidates) // self.reduction_factor)
+                candidates = [candidates[i] for i in order[:n_keep]]
+
+        best = order[0]
+        return candidates[best], results[best][1]
+
+    def build_and_train_model(
+        self,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+    ) -> RegressorMixin:
+        """
+        Tunes and trains the LGBM classifier using the provided training data.
+
+        Parameters:
+            X_train (pd.DataFrame): The feature data for training the model.
+            y_train (pd.Series): The target data for training the model.
+
+        Returns:
+            Pipeline: The trained pipeline containing the LGBM classifier.
+        """
+        from lightgbm import LGBMClassifier
+
+        # Set up logging
+        logging.basicConfig(level=logging.INFO)
+        logger = logging.getLogger(__name__)
+
+        logger.info("Tuning the LGBM classifier with successive halving.")
+
+        try:
+            best_params, n_estimators = self.tune(X_train, y_train)
+            logger.info(f"Best parameters: {best_params}, n_estimators={n_estimators}")
+
+            lgbm_model = LGBMClassifier(
+                **best_params,
+                n_estimators=n_estimators,
+                random_state=self.random_state,
+                verbose=-1,
+            )
+
+            # Create a pipeline with the LGBM model
+            pipeline = Pipeline([("model", lgbm_model)])
+
+            logger.info("Fitting the pipeline to the training data.")
+            pipeline.fit(X_train, y_train)
+            logger.info("Model training completed successfully.")
+
+            return pipeline
+        except Exception as e:
+            logger.error(f"Error building or training the LGBM classifier: {e}")
+            raise
+
+
+def predict_positive_scores(model, X) -> np.ndarray:
+    """
+    Returns the fraud score of every row, whatever the prediction interface of the model.
+
+    Parameters:
+        model: A trained model or pipeline with `predict_proba` or `predict`.
+        X (array-like): The feature data to score.
+
+    Returns:
+        np.ndarray: One score per row.
+    """
+    if hasattr(model, "predict_proba"):
+        return np.asarray(model.predict_proba(X))[:, -1]
+    return np.asarray(model.predict(X)).reshape(len(X), -1)[:, -1]
+
+
+# Two-stage model: the fast stage scores everything, the slow stage only the uncertain band.
+class CascadeModel(BaseEstimator):
+    def __init__(
+        self,
+        stage_one,
+        stage_two,
+        lower: float = 0.2,
+        upper: float = 0.8,
+        stage_two_weight: float = 1.0,
+        stage_two_columns: list = None,
+    ):
+        """
+        Initializes the CascadeModel with its two trained stages.
+
+        Parameters:
+            stage_one: The cheap model scoring every row.
+            stage_two: The expensive model scoring rows in the uncertainty band.
+            lower (float): Lower bound (inclusive) of the stage-one uncertainty band.
+            upper (float): Upper bound (inclusive) of the stage-one uncertainty band.
+            stage_two_weight (float): Weight of the stage-two score in the blended score.
+            stage_two_columns (list): Columns passed to stage two, by name or position.
+                Names are resolved through `feature_names_in_` for array inputs. Defaults
+                to all columns.
+        """
+        self.stage_one = stage_one
+        self.stage_two = stage_two
+        self.lower = lower
+        self.upper = upper
+        self.stage_two_weight = stage_two_weight
+        self.stage_two_columns = stage_two_columns
+        self.classes_ = np.array([0, 1])
+        # Serving threads score concurrently, so the counters are updated under a lock.
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def __getstate__(self) -> dict:
+        # The parent's state may be the instance's own __dict__, so copy it first.
+        state = dict(super().__getstate__())
+        state.pop("_stats_lock", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        super().__setstate__(state)
+        self._stats_lock = threading.Lock()
+
+    def reset_stats(self):
+        """
+        Resets the per-stage row counters and latencies.
+        """
+        with self._stats_lock:
+            self.stats_ = {
+                "rows": 0,
+                "stage_two_rows": 0,
+                "stage_one_seconds": 0.0,
+                "stage_two_seconds": 0.0,
+            }
+
+    def stats(self) -> dict:
+        """
+        Reports per-stage hit rates and mean latency per scored row.
+
+        Returns:
+            dict: Hit rates of both stages and their mean latency in microseconds per row.
+        """
+        with self._stats_lock:
+            stats = dict(self.stats_)
+        rows = max(stats["rows"], 1)
+        return {
+            "stage_one_hit_rate": 1 - stats["stage_two_rows"] / rows,
+            "stage_two_hit_rate": stats["stage_two_rows"] / rows,
+            "stage_one_latency_us": 1e6 * stats["stage_one_seconds"] / rows,
+            "stage_two_latency_us": 1e6 * stats["stage_two_seconds"] / rows,
+        }
+
+    def _stage_two_inputs(self, X):
+        """
+        Selects the stage-two columns of the uncertain rows.
+
+        Raises:
+            ValueError: If a column name cannot be resolved for an array input.
+        """
+        if self.stage_two_columns is None:
+            return X
+        if hasattr(X, "iloc"):
+            if all(isinstance(column, (int, np.integer)) for column in self.stage_two_columns):
+                return X.iloc[:, self.stage_two_columns]
+            return X[self.stage_two_columns]
+
+        names = list(getattr(self, "feature_names_in_", []))
+        positions = []
+        for column in self.stage_two_columns:
+            if isinstance(column, (int, np.integer)):
+                positions.append(int(column))
+            elif column in names:
+                positions.append(names.index(column))
+            else:
+                raise ValueError(f"Cannot find stage-two column {column!r} in an array input.")
+        return X[:, positions]
+
+    def fit(self, X, y=None):
+        """
+        Both stages are trained by the CascadeModellingStrategy, so fitting is a no-op.
+
+        Returns:
+            CascadeModel: The model itself.
+        """
+        return self
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Scores every row with stage one and re-scores the uncertain band with stage two.
+
+        Parameters:
+            X (array-like): The feature data to score.
+
+        Returns:
+            np.ndarray: Class probabilities of shape (n_samples, 2).
+        """
+        start = time.perf_counter()
+        scores = predict_positive_scores(self.stage_one, X)
+        stage_one_end = time.perf_counter()
+
+        uncertain = np.flatnonzero((scores >= self.lower) & (scores <= self.upper))
+        if len(uncertain):
+            X_uncertain = X.iloc[uncertain] if hasattr(X, "iloc") else np.asarray(X)[uncertain]
+            X_uncertain = self._stage_two_inputs(X_uncertain)
+            stage_two_scores = predict_positive_scores(self.stage_two, X_uncertain)
+            scores[uncertain] = (
+                self.stage_two_weight * stage_two_scores
+                + (1 - self.stage_two_weight) * scores[uncertain]
+            )
+
+        stage_two_end = time.perf_counter()
+        with self._stats_lock:
+            self.stats_["rows"] += len(scores)
+            self.stats_["stage_two_rows"] += len(uncertain)
+            self.stats_["stage_one_seconds"] += stage_one_end - start
+            self.stats_["stage_two_seconds"] += stage_two_end - stage_one_end
+
+        return np.column_stack([1 - scores, scores])
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predicts the fraud label of every row at the 0.5 threshold.
+
+        Parameters:
+            X (array-like): The feature data to score.
+
+        Returns:
+            np.ndarray: The predicted labels.
+        """
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+
+
+# Concrete class to implement the two-stage cascade.
+class CascadeModellingStrategy(DataModellingStrategy):
+    def __init__(
+        self,
+        stage_one_strategy: DataModellingStrategy = None,
+        stage_two_strategy: DataModellingStrategy = None,
+        lower: float = 0.2,
+        upper: float = 0.8,
+        stage_two_weight: float = 1.0,
+        stage_two_columns: list = None,
+    ):
+        """
+        Initializes the CascadeModellingStrategy with the strategies of both stages.
+
+        Parameters:
+            stage_one_strategy (DataModellingStrategy): Strategy of the cheap stage. Defaults to the LGBM classifier.
+            stage_two_strategy (DataModellingStrategy): Strategy of the expensive stage. Defaults to the numpy GACS network.
+            lower (float): Lower bound of the stage-one uncertainty band.
+            upper (float): Upper bound of the stage-one uncertainty band.
+            stage_two_weight (float): Weight of the stage-two score in the blended score.
+            stage_two_columns (list): Columns passed to stage two. Defaults to all columns.
+        """
+        self.stage_one_strategy = stage_one_strategy or LGBMClassifierModellingStrategy()
+        self.stage_two_strategy = stage_two_strategy or NumpyGACSModellingStrategy()
+        self.lower = lower
+        self.upper = upper
+        self.stage_two_weight = stage_two_weight
+        self.stage_two_columns = stage_two_columns
+
+    def build_and_train_model(
+        self,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+    ) -> RegressorMixin:
+        """
+        Trains both stages and combines them into a single cascade pipeline.
+
+        Parameters:
+            X_train (pd.DataFrame): The feature data for training the model.
+            y_train (pd.Series): The target data for training the model.
+
+        Returns:
+            Pipeline: The pipeline containing the cascade model.
+        """
+        # Set up logging
+        logging.basicConfig(level=logging.INFO)
+        logger = logging.getLogger(__name__)
+
+        logger.info("Training stage one of the cascade.")
+        stage_one = self.stage_one_strategy.build_and_train_model(X_train, y_train)
+
+        logger.info("Training stage two of the cascade.")
+        X_stage_two = (
+            X_train if self.stage_two_columns is None else X_train[self.stage_two_columns]
+        )
+        stage_two = self.stage_two_strategy.build_and_train_model(X_stage_two, y_train)
+
+        cascade = CascadeModel(
+            stage_one,
+            stage_two,
+            lower=self.lower,
+            upper=self.upper,
+            stage_two_weight=self.stage_two_weight,
+            stage_two_columns=self.stage_two_columns,
+        )
+        # Lets serving resolve the stage-two column names on array inputs.
+        cascade.feature_names_in_ = np.asarray(X_train.columns, dtype=object)
+
+        # Report how the band splits the training data, then start serving with clean counters.
+        cascade.predict_proba(X_train)
+        cascade.training_stats_ = cascade.stats()
+        logger.info(f"Cascade stage statistics on the training data: {cascade.training_stats_}")
+        cascade.reset_stats()
+
+        return Pipeline([("model", cascade)])
+
+
+# Concrete class to train any scikit-learn compatible estimator.
+class SklearnModellingStrategy(DataModellingStrategy):
+    def __init__(self, estimator, name: str = None):
+        """
+        Initializes the SklearnModellingStrategy with an unfitted estimator.
+
+        Parameters:
+            estimator: A scikit-learn compatible estimator.
+            name (str): Display name of the model. Defaults to the estimator class name.
+        """
+        self.estimator = estimator
+        self.name = name or type(estimator).__name__
+
+    def build_and_train_model(
+        self,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+    ) -> RegressorMixin:
+        """
+        Trains a fresh clone of the estimator using the provided training data.
+
+        Parameters:
+            X_train (pd.DataFrame): The feature data for training the model.
+            y_train (pd.Series): The target data for training the model.
+
+        Returns:
+            Pipeline: The trained pipeline containing the estimator.
+        """
+        from sklearn.base import clone
+
+        logging.info(f"Fitting the {self.name} pipeline to the training data.")
+        pipeline = Pipeline([("model", clone(self.estimator))])
+        pipeline.fit(X_train, y_train)
+        return pipeline
+
+
+def default_comparison_strategies() -> list:
+    """
+    Returns the classifiers compared in the EDA notebook as modelling strategies.
+
+    XGBoost is left out, with a warning, when it is not installed.
+
+    Returns:
+        list: One DataModellingStrategy per classifier.
+    """
+    from sklearn.ensemble import AdaBoostClassifier, RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.neighbors import KNeighborsClassifier
+    from sklearn.svm import SVC
+    from sklearn.tree import DecisionTreeClassifier
+
+    strategies = [
+        SklearnModellingStrategy(LogisticRegression(), "Logistic Regression"),
+        SklearnModellingStrategy(SVC(probability=True), "SVC"),
+        SklearnModellingStrategy(KNeighborsClassifier(), "KNN"),
+        SklearnModellingStrategy(DecisionTreeClassifier(), "Decision Tree"),
+        SklearnModellingStrategy(RandomForestClassifier(), "Random Forest"),
+    ]
+    try:
+        from xgboost import XGBClassifier
+    except ImportError:
+        logging.warning("xgboost is not installed; XGBoost is left out of the comparison.")
+    else:
+        strategies.append(SklearnModellingStrategy(XGBClassifier(), "XGBoost"))
+
+    return strategies + [
+        SklearnModellingStrategy(AdaBoostClassifier(), "AdaBoost"),
+        LGBMClassifierModellingStrategy(n_jobs=1),
+        NumpyGACSModellingStrategy(),
+    ]
+
+
+# Environment variables capping the native thread pools of a worker process.
+THREAD_LIMIT_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+@contextmanager
+def thread_limited_environment(threads_per_worker: int):
+    """
+    Sets the thread limit variables while worker processes are spawned, then restores them.
+
+    Spawned workers inherit these before importing numpy or any model library.
+
+    Parameters:
+        threads_per_worker (int): BLAS/OpenMP threads allowed per worker.
+    """
+    previous_environment = {key: os.environ.get(key) for key in THREAD_LIMIT_VARIABLES}
+    os.environ.update({key: str(threads_per_worker) for key in THREAD_LIMIT_VARIABLES})
+    try:
+        yield
+    finally:
+        for key, value in previous_environment.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def init_thread_limited_worker(threads_per_worker: int):
+    """
+    Caps the BLAS/OpenMP thread pools of a worker process.
+
+    The environment variables are already inherited from the parent at spawn time;
+    threadpoolctl additionally limits pools of libraries loaded before that.
+    """
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(limits=threads_per_worker)
+
+
+def _train_and_evaluate(
+    name: str,
+    strategy: DataModellingStrategy,
+    descriptors: dict,
+    columns: list,
+    threshold: float,
+) -> dict:
+    """
+    Trains one strategy on the shared training data and evaluates it on the shared test data.
+
+    Returns:
+        dict: The leaderboard row of the strategy.
+    """
+    from sklearn.metrics import (
+        accuracy_score,
+        f1_score,
+        precision_score,
+        recall_score,
+        roc_auc_score,
+    )
+
+    X_train = pd.DataFrame(attach_shared_array(descriptors["X_train"]), columns=columns, copy=False)
+    y_train = pd.Series(attach_shared_array(descriptors["y_train"]), copy=False)
+    X_test = pd.DataFrame(attach_shared_array(descriptors["X_test"]), columns=columns, copy=False)
+    y_test = attach_shared_array(descriptors["y_test"])
+
+    start = time.perf_counter()
+    model = strategy.build_and_train_model(X_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = predict_positive_scores(model, X_test)
+    predict_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predict_positive_scores(model, X_test.iloc[:1])
+    single_row_latency = time.perf_counter() - start
+
+    y_pred = scores >= threshold
+    return {
+        "model": name,
+        "fit_time_s": fit_time,
+        "predict_latency_us_per_row": 1e6 * predict_time / len(X_test),
+        "single_row_latency_ms": 1e3 * single_row_latency,
+        "accuracy": accuracy_score(y_test, y_pred),
+        "precision": precision_score(y_test, y_pred, pos_label=1, zero_division=0),
+        "recall": recall_score(y_test, y_pred, pos_label=1, zero_division=0),
+        "f1_score": f1_score(y_test, y_pred, pos_label=1, zero_division=0),
+        "roc_auc": roc_auc_score(y_test, scores),
+    }
+
+
 # Context class for Model Building
 class DataModeller:
     def __init__(self, strategy: DataModellingStrategy):
@@ -159,3 +833,76 @@ class DataModeller:
         """
         logging.info("Building and training the model using the selected strategy.")
         return self._strategy.build_and_train_model(X_train, y_train)
+
+    def compare_models(
+        self,
+        strategies: list,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        X_test: pd.DataFrame,
+        y_test: pd.Series,
+        n_workers: int = None,
+        threads_per_worker: int = 1,
+        threshold: float = 0.5,
+    ) -> pd.DataFrame:
+        """
+        Trains several strategies concurrently and ranks them on the test data.
+
+        The training and test data are copied once into shared memory; every worker
+        process maps the same copy. Native thread pools are capped per worker to avoid
+        oversubscribing the cores.
+
+        Parameters:
+            strategies (list): The modelling strategies to compare.
+            X_train (pd.DataFrame): The feature data for training the models.
+            y_train (pd.Series): The target data for training the models.
+            X_test (pd.DataFrame): The feature data for evaluating the models.
+            y_test (pd.Series): The target data for evaluating the models.
+            n_workers (int): Number of worker processes. Defaults to CPU count / threads_per_worker.
+            threads_per_worker (int): BLAS/OpenMP threads allowed per worker.
+            threshold (float): Decision threshold on the fraud score.
+
+        Returns:
+            pd.DataFrame: The leaderboard with fit time, predict latency and metrics per model.
+        """
+        n_workers = n_workers or max(1, (os.cpu_count() or 1) // threads_per_worker)
+        n_workers = min(n_workers, len(strategies))
+        logging.info(
+            f"Comparing {len(strategies)} models on {n_workers} workers "
+            f"with {threads_per_worker} threads each."
+        )
+
+        shared = {
+            "X_train": SharedArray(X_train.to_numpy(dtype=np.float64)),
+            "y_train": SharedArray(np.asarray(y_train)),
+            "X_test": SharedArray(X_test.to_numpy(dtype=np.float64)),
+            "y_test": SharedArray(np.asarray(y_test)),
+        }
+        descriptors = {key: array.descriptor for key, array in shared.items()}
+
+        try:
+            with thread_limited_environment(threads_per_worker), ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_thread_limited_worker,
+                initargs=(threads_per_worker,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _train_and_evaluate,
+                        getattr(strategy, "name", type(strategy).__name__),
+                        strategy,
+                        descriptors,
+                        list(X_train.columns),
+                        threshold,
+                    )
+                    for strategy in strategies
+                ]
+                rows = [future.result() for future in futures]
+        finally:
+            for array in shared.values():
+                array.release()
+
+        leaderboard = pd.DataFrame(rows).sort_values("roc_auc", ascending=False)
+        logging.info(f"Model comparison leaderboard:\n{leaderboard.to_string(index=False)}")
+        return leaderboard.reset_index(drop=True)
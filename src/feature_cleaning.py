@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+import os
+import tempfile
+import time
 import pandas as pd
 import numpy as np
 import logging
@@ -198,6 +202,265 @@ class ImbalanceFeatureCleaningStrategy(FeatureCleaningStrategy):
         return balanced_df
 
 
+# Number of timed predictions per latency measurement; the fastest is kept.
+LATENCY_REPEATS = 3
+
+# Dataset shared by the fitness workers, loaded once per process from the binary file,
+# and the raw features, labels and latency sample rows used to time a mask's model.
+_worker_dataset = None
+_worker_features = None
+_worker_labels = None
+_worker_sample_rows = None
+
+
+def _init_fitness_worker(
+    dataset_path: str, features_path: str, labels: np.ndarray, sample_rows: np.ndarray
+):
+    """
+    Loads the pre-binned LightGBM Dataset once per worker process and maps the raw features.
+
+    Parameters:
+        dataset_path (str): Path to the LightGBM binary Dataset file.
+        features_path (str): Path to the `.npy` file of the raw features.
+        labels (np.ndarray): The target of every row.
+        sample_rows (np.ndarray): Rows used to measure prediction latency.
+    """
+    import lightgbm as lgb
+
+    global _worker_dataset, _worker_features, _worker_labels, _worker_sample_rows
+    _worker_dataset = lgb.Dataset(dataset_path, params={"verbose": -1})
+    _worker_dataset.construct()
+    _worker_features = np.load(features_path, mmap_mode="r")
+    _worker_labels = labels
+    _worker_sample_rows = sample_rows
+
+
+def _measure_latency(selected: list, params: dict, num_boost_round: int) -> float:
+    """
+    Trains a model on the selected columns only and times its prediction on them, as
+    the model served with this mask would be. The features are binned again for every
+    mask, so this is only done when latency is penalized.
+
+    Returns:
+        float: The prediction latency in milliseconds per 1000 rows.
+    """
+    import lightgbm as lgb
+
+    X = np.ascontiguousarray(_worker_features[:, selected])
+    booster = lgb.train(
+        params,
+        lgb.Dataset(X, label=_worker_labels, params={"verbose": -1}),
+        num_boost_round=num_boost_round,
+    )
+    sample = np.ascontiguousarray(X[_worker_sample_rows])
+    timings = []
+    for _ in range(LATENCY_REPEATS):
+        start = time.perf_counter()
+        booster.predict(sample)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000 * 1000 / len(sample)
+
+
+def _evaluate_feature_mask(
+    mask: np.ndarray, lgbm_params: dict, n_folds: int, measure_latency: bool = False
+):
+    """
+    Scores a feature mask with LightGBM cross-validation on the shared Dataset.
+
+    The mask is applied through a single interaction constraint, so the Dataset
+    is never re-binned for a new subset of features.
+
+    Parameters:
+        mask (np.ndarray): Boolean genome selecting the features.
+        lgbm_params (dict): Parameters for the LightGBM booster.
+        n_folds (int): Number of cross-validation folds.
+        measure_latency (bool): Whether to time a model trained on the selected columns.
+
+    Returns:
+        tuple: The mean CV AUC and the prediction latency in milliseconds per 1000 rows
+            (0 when it is not measured).
+    """
+    import lightgbm as lgb
+
+    selected = np.flatnonzero(mask).tolist()
+    params = dict(lgbm_params)
+    num_boost_round = params.pop("num_boost_round", 100)
+    results = lgb.cv(
+        dict(params, interaction_constraints=[selected]),
+        _worker_dataset,
+        num_boost_round=num_boost_round,
+        nfold=n_folds,
+        stratified=True,
+    )
+    auc = results["valid auc-mean"][-1]
+
+    latency = _measure_latency(selected, params, num_boost_round) if measure_latency else 0.0
+    return auc, latency
+
+
+# Concrete strategy to select features with a genetic algorithm.
+class GeneticFeatureSelectionStrategy(FeatureCleaningStrategy):
+    def __init__(
+        self,
+        target_column: str,
+        population_size: int = 20,
+        n_generations: int = 10,
+        crossover_rate: float = 0.75,
+        mutation_prob: float = 0.03,
+        feature_penalty: float = 0.0,
+        latency_penalty: float = 0.0,
+        n_folds: int = 3,
+        n_workers: int = None,
+        random_state: int = 42,
+    ):
+        """
+        Initializes the GeneticFeatureSelectionStrategy with specific parameters.
+
+        Parameters:
+            target_column (str): The name of the target column.
+            population_size (int): Number of bitmask genomes per generation.
+            n_generations (int): Number of generations to evolve.
+            crossover_rate (float): Probability of taking a gene from the first parent.
+            mutation_prob (float): Probability of flipping each gene.
+            feature_penalty (float): Fitness penalty per fraction of features kept.
+            latency_penalty (float): Fitness penalty per millisecond of prediction latency for 1000 rows,
+                timed with a model trained on the selected features only.
+            n_folds (int): Number of cross-validation folds in the fitness.
+            n_workers (int): Number of fitness worker processes. Defaults to the CPU count.
+            random_state (int): The seed used by the random number generator.
+        """
+        self.target_column = target_column
+        self.population_size = population_size
+        self.n_generations = n_generations
+        self.crossover_rate = crossover_rate
+        self.mutation_prob = mutation_prob
+        self.feature_penalty = feature_penalty
+        self.latency_penalty = latency_penalty
+        self.n_folds = n_folds
+        self.n_workers = n_workers or os.cpu_count()
+        self.random_state = random_state
+        self.lgbm_params = {
+            "objective": "binary",
+            "metric": "auc",
+            "num_boost_round": 100,
+            "num_threads": 1,
+            "verbose": -1,
+            "seed": random_state,
+        }
+        self.fitness_cache = {}
+
+    def _fitness(self, mask: np.ndarray, auc: float, latency: float) -> float:
+        """
+        Combines the CV AUC with the feature-count and latency penalties.
+        """
+        return (
+            auc
+            - self.feature_penalty * mask.mean()
+            - self.latency_penalty * latency
+        )
+
+    def _evaluate_population(self, executor, population: np.ndarray) -> np.ndarray:
+        """
+        Evaluates every genome, dispatching only masks that are not cached yet.
+        """
+        pending = {}
+        for mask in population:
+            key = mask.tobytes()
+            if key not in self.fitness_cache and key not in pending:
+                pending[key] = executor.submit(
+                    _evaluate_feature_mask,
+                    mask,
+                    self.lgbm_params,
+                    self.n_folds,
+                    self.latency_penalty > 0,
+                )
+
+        for key, future in pending.items():
+            auc, latency = future.result()
+            mask = np.frombuffer(key, dtype=bool)
+            self.fitness_cache[key] = self._fitness(mask, auc, latency)
+
+        return np.array([self.fitness_cache[mask.tobytes()] for mask in population])
+
+    def _next_generation(
+        self, rng, population: np.ndarray, scores: np.ndarray
+    ) -> np.ndarray:
+        """
+        Breeds a new population with elitism, tournament selection, uniform crossover and bit-flip mutation.
+        """
+        n_features = population.shape[1]
+        children = [population[np.argmax(scores)].copy()]
+
+        while len(children) < self.population_size:
+            parents = []
+            for _ in range(2):
+                contenders = rng.choice(len(population), size=2, replace=False)
+                parents.append(population[contenders[np.argmax(scores[contenders])]])
+
+            genes = rng.random(n_features) < self.crossover_rate
+            child = np.where(genes, parents[0], parents[1])
+            child ^= rng.random(n_features) < self.mutation_prob
+            if not child.any():
+                child[rng.integers(n_features)] = True
+            children.append(child)
+
+        return np.array(children)
+
+    def apply_strategy(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Evolves feature masks and drops the features not in the fittest mask.
+
+        Parameters:
+            df (pd.DataFrame): The input DataFrame containing the cleaned features and target column.
+
+        Returns:
+            pd.DataFrame: The DataFrame with only the selected features and the target column.
+        """
+        import lightgbm as lgb
+
+        logging.info("Selecting features with the genetic algorithm")
+        rng = np.random.default_rng(self.random_state)
+        features = df.drop(columns=[self.target_column])
+        X = features.to_numpy(dtype=np.float64)
+        y = df[self.target_column].to_numpy()
+
+        population = rng.random((self.population_size, X.shape[1])) < 0.5
+        population[0] = True
+        population[~population.any(axis=1), 0] = True
+
+        sample_rows = rng.choice(len(X), size=min(1000, len(X)), replace=False)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Bin the features once; every worker loads the same binary Dataset.
+            dataset_path = os.path.join(tmp_dir, "feature_selection.bin")
+            lgb.Dataset(X, label=y, params={"verbose": -1}).save_binary(dataset_path)
+            # The raw features are only read to time a model trained on each mask's columns.
+            features_path = os.path.join(tmp_dir, "features.npy")
+            np.save(features_path, X)
+
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_fitness_worker,
+                initargs=(dataset_path, features_path, y, sample_rows),
+            ) as executor:
+                scores = self._evaluate_population(executor, population)
+                for generation in range(self.n_generations):
+                    population = self._next_generation(rng, population, scores)
+                    scores = self._evaluate_population(executor, population)
+                    logging.info(
+                        f"Generation {generation + 1}: best fitness {scores.max():.4f}, "
+                        f"{len(self.fitness_cache)} masks evaluated"
+                    )
+
+        best_mask = population[np.argmax(scores)]
+        dropped = features.columns[~best_mask]
+        cleaned_df = df.drop(columns=dropped)
+        logging.info(
+            f"Genetic feature selection kept {best_mask.sum()} of {len(best_mask)} features."
+        )
+        return cleaned_df
+
+
 # Context class to set and implement the strategies.
 class FeatureCleaning:
     def __init__(self, strategy: FeatureCleaningStrategy):
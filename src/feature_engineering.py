@@ -22,6 +22,15 @@ class FeatureEngineeringStrategy(ABC):
 
 # Concrete strategy to normalize features in the dataset.
 class NormalizeFeatureEngineeringStrategy(FeatureEngineeringStrategy):
+    def __init__(self):
+        """
+        Initializes the NormalizeFeatureEngineeringStrategy.
+
+        The PowerTransformer fitted by `apply_transformation` is kept in `self.transformer`
+        so that test and serving data can be transformed exactly like the training data.
+        """
+        self.transformer = None
+
     def apply_transformation(
         self,
         df: pd.DataFrame,
@@ -43,6 +52,7 @@ class NormalizeFeatureEngineeringStrategy(FeatureEngineeringStrategy):
 
         X_norm = norm.fit_transform(X=df)
         X_norm_df = pd.DataFrame(X_norm, columns=df.columns)
+        self.transformer = norm
 
         logging.info("Feature engineering completed")
         return X_norm_df
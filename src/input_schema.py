@@ -0,0 +1,251 @@
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.payload_decoding import schema_id
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+# Per-row error codes; a row failing several checks carries the sum of their codes.
+ROW_VALID = 0
+ERROR_MISSING_VALUE = 1
+ERROR_NOT_FINITE = 2
+ERROR_BELOW_RANGE = 4
+ERROR_ABOVE_RANGE = 8
+
+# Schemas compiled by this process, keyed by artifact path.
+_compiled_schemas = {}
+
+ERROR_REASONS = {
+    ERROR_MISSING_VALUE: "missing value",
+    ERROR_NOT_FINITE: "infinite value",
+    ERROR_BELOW_RANGE: "value below the allowed range",
+    ERROR_ABOVE_RANGE: "value above the allowed range",
+}
+
+
+def load_compiled_schema(file_path: str) -> "CompiledSchema":
+    """
+    Loads a schema artifact and compiles it, once per process and path.
+
+    Parameters:
+        file_path (str): Path of the schema artifact.
+
+    Returns:
+        CompiledSchema: The compiled schema.
+    """
+    if file_path not in _compiled_schemas:
+        _compiled_schemas[file_path] = InputSchema.load(file_path).compile()
+    return _compiled_schemas[file_path]
+
+
+def describe_error(code: int) -> list:
+    """
+    Lists the reasons encoded in a per-row error code.
+
+    Parameters:
+        code (int): The error code of a row.
+
+    Returns:
+        list: One reason per failed check.
+    """
+    return [reason for flag, reason in ERROR_REASONS.items() if code & flag]
+
+
+# Input schema of a trained model
+# -------------------------------
+# Saved at training time next to the model: the ordered feature names, the range of each
+# feature seen in training and the bounds and missing-value rules enforced when serving.
+class InputSchema:
+    def __init__(self, features: list):
+        """
+        Initializes the InputSchema from its feature descriptions.
+
+        Parameters:
+            features (list): One dict per feature in model order, with 'name', 'minimum' and
+                'maximum' seen in training, the enforced 'lower' and 'upper' bounds (None
+                when unbounded) and 'allow_missing'.
+        """
+        self.features = features
+
+    @property
+    def columns(self) -> list:
+        return [feature["name"] for feature in self.features]
+
+    @classmethod
+    def from_frame(cls, X: pd.DataFrame) -> "InputSchema":
+        """
+        Derives the schema from the training features.
+
+        Features that were never negative in training must stay non-negative (counts,
+        amounts, durations); features that were never missing must not be missing.
+
+        Parameters:
+            X (pd.DataFrame): The raw training features, in model order.
+
+        Returns:
+            InputSchema: The schema of the model's input.
+        """
+        features = []
+        for column in X.columns:
+            values = pd.to_numeric(X[column], errors="coerce")
+            minimum, maximum = float(values.min()), float(values.max())
+            features.append(
+                {
+                    "name": column,
+                    "minimum": minimum,
+                    "maximum": maximum,
+                    "lower": 0.0 if minimum >= 0 else None,
+                    "upper": None,
+                    "allow_missing": bool(values.isna().any()),
+                }
+            )
+        return cls(features)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the JSON-serialisable form of the schema.
+        """
+        return {"schema_id": schema_id(self.columns).hex(), "features": self.features}
+
+    @classmethod
+    def from_dict(cls, schema: dict) -> "InputSchema":
+        """
+        Creates the schema from the output of `to_dict`.
+        """
+        return cls(schema["features"])
+
+    def save(self, file_path: str):
+        """
+        Saves the schema as JSON.
+
+        Parameters:
+            file_path (str): Destination path of the schema artifact.
+        """
+        with open(file_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(f"Saved the input schema of {len(self.features)} features to {file_path}.")
+
+    @classmethod
+    def load(cls, file_path: str) -> "InputSchema":
+        """
+        Loads a schema saved with `save`.
+
+        Parameters:
+            file_path (str): Path of the schema artifact.
+
+        Returns:
+            InputSchema: The loaded schema.
+        """
+        with open(file_path) as f:
+            return cls.from_dict(json.load(f))
+
+    def compile(self) -> "CompiledSchema":
+        """
+        Compiles the schema into the arrays used to validate every serving batch.
+        """
+        return CompiledSchema(self)
+
+
+# Compiled input schema
+# ---------------------
+# Built once per served model: the column layout and the bounds and missing-value rules as
+# arrays, so that validating a batch is a few vectorized comparisons over all its rows.
+class CompiledSchema:
+    def __init__(self, schema: InputSchema):
+        """
+        Initializes the CompiledSchema from an input schema.
+
+        Parameters:
+            schema (InputSchema): The schema saved at training time.
+        """
+        self.columns = schema.columns
+        self.schema_id = schema_id(self.columns)
+        self.lower = np.array(
+            [-np.inf if f["lower"] is None else f["lower"] for f in schema.features],
+            dtype=np.float64,
+        )
+        self.upper = np.array(
+            [np.inf if f["upper"] is None else f["upper"] for f in schema.features],
+            dtype=np.float64,
+        )
+        self.allow_missing = np.array([f["allow_missing"] for f in schema.features], dtype=bool)
+
+    def column_order(self, columns: list) -> np.ndarray:
+        """
+        Maps the model's columns onto their positions in a batch's columns.
+
+        Parameters:
+            columns (list): The column names of an incoming batch.
+
+        Returns:
+            np.ndarray: For every model column, its index in `columns`.
+
+        Raises:
+            ValueError: If a model column is missing from the batch.
+        """
+        positions = {column: position for position, column in enumerate(columns)}
+        missing = [column for column in self.columns if column not in positions]
+        if missing:
+            raise ValueError(f"Missing features: {missing}")
+        return np.array([positions[column] for column in self.columns], dtype=np.intp)
+
+    def validate(self, X: np.ndarray) -> np.ndarray:
+        """
+        Checks every row of a batch in the model's layout.
+
+        Parameters:
+            X (np.ndarray): The feature data of shape (n_samples, len(columns)).
+
+        Returns:
+            np.ndarray: One error code per row; ROW_VALID (0) for rows that can be scored.
+
+        Raises:
+            ValueError: If the batch does not have the model's number of features.
+        """
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != len(self.columns):
+            raise ValueError(f"Expected rows of {len(self.columns)} features, got shape {X.shape}.")
+
+        missing = np.isnan(X)
+        codes = np.where((missing & ~self.allow_missing).any(axis=1), ERROR_MISSING_VALUE, 0)
+        codes |= np.where(np.isinf(X).any(axis=1), ERROR_NOT_FINITE, 0)
+        # NaN never compares below or above, so missing values do not count twice.
+        codes |= np.where((X < self.lower).any(axis=1), ERROR_BELOW_RANGE, 0)
+        codes |= np.where((X > self.upper).any(axis=1), ERROR_ABOVE_RANGE, 0)
+        return codes.astype(np.uint8)
+
+    def conform(self, X: np.ndarray, columns: list = None) -> tuple:
+        """
+        Reorders a batch into the model's layout and validates it.
+
+        Parameters:
+            X (np.ndarray): The feature data of shape (n_samples, len(columns)).
+            columns (list): The batch's column names. Defaults to the model's columns.
+
+        Returns:
+            tuple: The batch in the model's layout and the error code of every row.
+        """
+        if columns is not None and list(columns) != self.columns:
+            X = np.take(X, self.column_order(columns), axis=1)
+        return X, self.validate(X)
+
+    def row_errors(self, codes: np.ndarray) -> list:
+        """
+        Describes the invalid rows of a batch.
+
+        Parameters:
+            codes (np.ndarray): The error codes returned by `validate`.
+
+        Returns:
+            list: A dict with the 'row', its 'code' and the 'reasons' for every invalid row.
+        """
+        return [
+            {"row": int(row), "code": int(codes[row]), "reasons": describe_error(codes[row])}
+            for row in np.flatnonzero(codes)
+        ]
@@ -1 +1,576 @@
-# TODO: Implement evaluation
+import json
+import logging
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from src.data_modelling import predict_positive_scores
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+# Streaming accumulator for binary classification metrics
+# -------------------------------------------------------
+# Keeps only fixed-size state (confusion counts, log-loss sum and score histograms),
+# so any number of batches can be evaluated in constant memory.
+class StreamingMetricsAccumulator:
+    def __init__(self, threshold: float = 0.5, n_bins: int = 1000, eps: float = 1e-15):
+        """
+        Initializes the StreamingMetricsAccumulator with empty state.
+
+        Parameters:
+        threshold (float): Decision threshold on the fraud score.
+        n_bins (int): Number of equal-width score bins over [0, 1] per class.
+        eps (float): Clipping applied to the scores in the log-loss.
+        """
+        self.threshold = threshold
+        self.n_bins = n_bins
+        self.eps = eps
+        self.true_positives = 0
+        self.false_positives = 0
+        self.true_negatives = 0
+        self.false_negatives = 0
+        self.log_loss_sum = 0.0
+        self.positive_histogram = np.zeros(n_bins, dtype=np.int64)
+        self.negative_histogram = np.zeros(n_bins, dtype=np.int64)
+
+    def update(self, y_true: np.ndarray, scores: np.ndarray):
+        """
+        Adds one batch of labels and scores to the running state.
+
+        Parameters:
+        y_true (np.ndarray): Binary labels of the batch.
+        scores (np.ndarray): Fraud scores of the batch.
+        """
+        y_true = np.asarray(y_true).astype(bool)
+        scores = np.asarray(scores, dtype=np.float64)
+        y_pred = scores >= self.threshold
+
+        self.true_positives += int(np.count_nonzero(y_true & y_pred))
+        self.false_positives += int(np.count_nonzero(~y_true & y_pred))
+        self.true_negatives += int(np.count_nonzero(~y_true & ~y_pred))
+        self.false_negatives += int(np.count_nonzero(y_true & ~y_pred))
+
+        clipped = np.clip(scores, self.eps, 1 - self.eps)
+        self.log_loss_sum -= float(
+            np.log(clipped[y_true]).sum() + np.log1p(-clipped[~y_true]).sum()
+        )
+
+        bins = np.minimum((np.clip(scores, 0, 1) * self.n_bins).astype(np.int64), self.n_bins - 1)
+        self.positive_histogram += np.bincount(bins[y_true], minlength=self.n_bins)
+        self.negative_histogram += np.bincount(bins[~y_true], minlength=self.n_bins)
+
+    def merge(self, other: "StreamingMetricsAccumulator"):
+        """
+        Adds the state of another accumulator with the same configuration.
+
+        Parameters:
+        other (StreamingMetricsAccumulator): The accumulator to merge into this one.
+        """
+        self.true_positives += other.true_positives
+        self.false_positives += other.false_positives
+        self.true_negatives += other.true_negatives
+        self.false_negatives += other.false_negatives
+        self.log_loss_sum += other.log_loss_sum
+        self.positive_histogram += other.positive_histogram
+        self.negative_histogram += other.negative_histogram
+
+    def result(self) -> dict:
+        """
+        Computes the metrics from the accumulated state.
+
+        Returns:
+        dict: Confusion counts, accuracy, precision, recall, F1, log-loss and the
+        ROC AUC estimated from the score histograms.
+        """
+        tp, fp = self.true_positives, self.false_positives
+        tn, fn = self.true_negatives, self.false_negatives
+        total = tp + fp + tn + fn
+
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+        # Negatives ranked below positives, counting same-bin pairs as ties.
+        positives_above = np.cumsum(self.positive_histogram[::-1])[::-1] - self.positive_histogram
+        n_positive, n_negative = self.positive_histogram.sum(), self.negative_histogram.sum()
+        auc = (
+            float(
+                np.sum(self.negative_histogram * (positives_above + 0.5 * self.positive_histogram))
+            )
+            / float(n_positive * n_negative)
+            if n_positive and n_negative
+            else float("nan")
+        )
+
+        return {
+            "true_positives": tp,
+            "false_positives": fp,
+            "true_negatives": tn,
+            "false_negatives": fn,
+            "accuracy": (tp + tn) / total if total else 0.0,
+            "precision": precision,
+            "recall": recall,
+            "f1_score": f1,
+            "log_loss": self.log_loss_sum / total if total else 0.0,
+            "roc_auc_binned": auc,
+        }
+
+
+def merge_score_histograms(histograms: list) -> tuple:
+    """
+    Merges pre-binned (positive, negative) score histograms, e.g. from distributed batch scoring.
+
+    Parameters:
+    histograms (list): (positive_histogram, negative_histogram) pairs with the same bins.
+
+    Returns:
+    tuple: The summed positive and negative histograms.
+    """
+    positive = np.sum([np.asarray(pair[0]) for pair in histograms], axis=0)
+    negative = np.sum([np.asarray(pair[1]) for pair in histograms], axis=0)
+    return positive, negative
+
+
+# Threshold Sweep and Cost Curve
+# ------------------------------
+# Computes every operating point from one sort (or one histogram) with cumulative sums.
+class ThresholdSweep:
+    def __init__(self, cost_fp: float = 1.0, cost_fn: float = 1.0):
+        """
+        Initializes the ThresholdSweep with the business cost of each error type.
+
+        Parameters:
+        cost_fp (float): Cost of flagging a legitimate address.
+        cost_fn (float): Cost of missing a fraudulent address.
+        """
+        self.cost_fp = cost_fp
+        self.cost_fn = cost_fn
+
+    def _operating_points(self, thresholds, tp, fp) -> pd.DataFrame:
+        """
+        Builds the operating point table from cumulative true and false positive weights.
+        """
+        positives, negatives = tp[-1], fp[-1]
+        fn = positives - tp
+        tn = negatives - fp
+        predicted = tp + fp
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.where(predicted > 0, tp / predicted, 1.0)
+            recall = tp / positives if positives else np.zeros_like(tp)
+            fpr = fp / negatives if negatives else np.zeros_like(fp)
+
+        return pd.DataFrame(
+            {
+                "threshold": thresholds,
+                "true_positives": tp,
+                "false_positives": fp,
+                "false_negatives": fn,
+                "true_negatives": tn,
+                "precision": precision,
+                "recall": recall,
+                "fpr": fpr,
+                "expected_cost": (self.cost_fp * fp + self.cost_fn * fn)
+                / (positives + negatives),
+            }
+        )
+
+    def from_scores(self, y_true, scores, sample_weight=None) -> pd.DataFrame:
+        """
+        Computes the operating point of every distinct score with a single sort.
+
+        A row is flagged when its score is greater than or equal to the threshold.
+        The first point flags nothing; its threshold is the next float above the highest
+        score, so that every threshold is finite and can be saved as JSON.
+
+        Parameters:
+        y_true (array-like): Binary labels.
+        scores (array-like): Fraud scores.
+        sample_weight (array-like): Optional weight of every row.
+
+        Returns:
+        pd.DataFrame: One row per threshold, from the highest to the lowest.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        y_true = np.asarray(y_true).astype(bool)
+        weights = (
+            np.ones(len(scores)) if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+        )
+
+        order = np.argsort(-scores, kind="stable")
+        sorted_scores = scores[order]
+        sorted_weights = weights[order]
+        sorted_labels = y_true[order]
+
+        tp = np.cumsum(np.where(sorted_labels, sorted_weights, 0.0))
+        fp = np.cumsum(np.where(sorted_labels, 0.0, sorted_weights))
+
+        # Last position of every run of equal scores.
+        distinct = np.r_[np.flatnonzero(np.diff(sorted_scores)), len(scores) - 1]
+        above_all = np.nextafter(sorted_scores[0] if len(scores) else 1.0, np.inf)
+        return self._operating_points(
+            np.r_[above_all, sorted_scores[distinct]],
+            np.r_[0.0, tp[distinct]],
+            np.r_[0.0, fp[distinct]],
+        )
+
+    def from_histograms(self, positive_histogram, negative_histogram) -> pd.DataFrame:
+        """
+        Computes the operating points at the bin edges of equal-width score histograms over [0, 1].
+
+        The first point flags nothing; its threshold is the next float above 1.
+
+        Parameters:
+        positive_histogram (array-like): Counts or weights of fraudulent rows per score bin.
+        negative_histogram (array-like): Counts or weights of legitimate rows per score bin.
+
+        Returns:
+        pd.DataFrame: One row per bin edge, from the highest to the lowest threshold.
+        """
+        positive_histogram = np.asarray(positive_histogram, dtype=np.float64)
+        negative_histogram = np.asarray(negative_histogram, dtype=np.float64)
+        n_bins = len(positive_histogram)
+
+        thresholds = np.arange(n_bins - 1, -1, -1) / n_bins
+        return self._operating_points(
+            np.r_[np.nextafter(1.0, np.inf), thresholds],
+            np.r_[0.0, np.cumsum(positive_histogram[::-1])],
+            np.r_[0.0, np.cumsum(negative_histogram[::-1])],
+        )
+
+    def optimal_threshold(self, operating_points: pd.DataFrame) -> dict:
+        """
+        Selects the operating point with the lowest expected cost.
+
+        Parameters:
+        operating_points (pd.DataFrame): The output of `from_scores` or `from_histograms`.
+
+        Returns:
+        dict: The deployable threshold artifact with its costs and metrics.
+        """
+        best = operating_points.iloc[int(np.argmin(operating_points["expected_cost"].to_numpy()))]
+        artifact = {
+            "threshold": float(best["threshold"]),
+            "expected_cost": float(best["expected_cost"]),
+            "precision": float(best["precision"]),
+            "recall": float(best["recall"]),
+            "fpr": float(best["fpr"]),
+            "cost_fp": self.cost_fp,
+            "cost_fn": self.cost_fn,
+        }
+        logging.info(f"Cost-optimal operating point: {artifact}")
+        return artifact
+
+    @staticmethod
+    def save_threshold(artifact: dict, file_path: str):
+        """
+        Writes the threshold artifact as JSON.
+
+        Parameters:
+        artifact (dict): The output of `optimal_threshold`.
+        file_path (str): Destination path of the JSON file.
+        """
+        with open(file_path, "w") as f:
+            json.dump(artifact, f, indent=2)
+
+
+# Poisson Bootstrap Confidence Intervals
+# --------------------------------------
+# Every row gets an independent Poisson(1) weight per replicate, so the total weight of a
+# group of rows sharing the same score and label is Poisson(group size). Drawing one weight
+# per group instead of per row makes thousands of replicates cheap for millions of rows.
+class PoissonBootstrap:
+    def __init__(
+        self,
+        n_replicates: int = 1000,
+        confidence: float = 0.95,
+        threshold: float = 0.5,
+        max_groups: int = 4096,
+        chunk_size: int = 250,
+        random_state: int = 42,
+    ):
+        """
+        Initializes the PoissonBootstrap with specific parameters.
+
+        Parameters:
+        n_replicates (int): Number of bootstrap replicates.
+        confidence (float): Coverage of the percentile intervals.
+        threshold (float): Decision threshold on the fraud score.
+        max_groups (int): Maximum number of score groups; above it, scores are binned by quantile.
+        chunk_size (int): Number of replicates drawn at once, bounding memory.
+        random_state (int): Seed of the weight generator.
+        """
+        self.n_replicates = n_replicates
+        self.confidence = confidence
+        self.threshold = threshold
+        self.max_groups = max_groups
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+
+    def _group_scores(self, y_true, scores) -> tuple:
+        """
+        Counts the positives and negatives per score group, in ascending score order.
+
+        Returns:
+        tuple: Positive counts, negative counts and the flagged mask of every group.
+        """
+        y_true = np.asarray(y_true).astype(bool)
+        scores = np.asarray(scores, dtype=np.float64)
+
+        distinct, groups = np.unique(scores, return_inverse=True)
+        if len(distinct) <= self.max_groups:
+            flagged = distinct >= self.threshold
+        else:
+            # Quantile bins with the threshold as an edge, so no bin straddles it.
+            edges = np.unique(
+                np.r_[
+                    np.quantile(distinct, np.linspace(0, 1, self.max_groups + 1)[1:-1]),
+                    self.threshold,
+                ]
+            )
+            groups = np.searchsorted(edges, scores, side="right")
+            flagged = np.r_[-np.inf, edges] >= self.threshold
+
+        n_groups = len(flagged)
+        positive_counts = np.bincount(groups[y_true], minlength=n_groups)
+        negative_counts = np.bincount(groups[~y_true], minlength=n_groups)
+        return positive_counts, negative_counts, flagged
+
+    @staticmethod
+    def _metrics(positive_weights: np.ndarray, negative_weights: np.ndarray, flagged) -> dict:
+        """
+        Computes the metrics of every replicate from its (replicates, groups) weight matrices.
+        """
+        tp = positive_weights[:, flagged].sum(axis=1)
+        fp = negative_weights[:, flagged].sum(axis=1)
+        n_positive = positive_weights.sum(axis=1)
+        n_negative = negative_weights.sum(axis=1)
+
+        # Positives in strictly higher score groups, counting same-group pairs as ties.
+        positives_above = n_positive[:, None] - np.cumsum(positive_weights, axis=1)
+        ranked_pairs = np.sum(negative_weights * (positives_above + 0.5 * positive_weights), axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+            recall = np.where(n_positive > 0, tp / n_positive, 0.0)
+            f1 = np.where(
+                precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0
+            )
+            auc = ranked_pairs / (n_positive * n_negative)
+
+        return {"roc_auc": auc, "f1_score": f1, "precision": precision, "recall": recall}
+
+    def _intervals(self, positive_counts, negative_counts, flagged) -> dict:
+        """
+        Draws the replicates in chunks and summarises them into percentile intervals.
+        """
+        # Groups without rows always get zero weight.
+        occupied = (positive_counts + negative_counts) > 0
+        positive_counts = positive_counts[occupied]
+        negative_counts = negative_counts[occupied]
+        flagged = flagged[occupied]
+
+        estimates = self._metrics(
+            positive_counts[None, :].astype(np.float64),
+            negative_counts[None, :].astype(np.float64),
+            flagged,
+        )
+
+        rng = np.random.default_rng(self.random_state)
+        replicates = {name: [] for name in estimates}
+        for start in range(0, self.n_replicates, self.chunk_size):
+            size = (min(self.chunk_size, self.n_replicates - start), len(positive_counts))
+            chunk = self._metrics(
+                rng.poisson(positive_counts, size=size).astype(np.float64),
+                rng.poisson(negative_counts, size=size).astype(np.float64),
+                flagged,
+            )
+            for name, values in chunk.items():
+                replicates[name].append(values)
+
+        alpha = (1 - self.confidence) / 2
+        intervals = {}
+        for name, estimate in estimates.items():
+            values = np.concatenate(replicates[name])
+            lower, upper = np.nanquantile(values, [alpha, 1 - alpha])
+            intervals[name] = {
+                "estimate": float(estimate[0]),
+                "lower": float(lower),
+                "upper": float(upper),
+            }
+        logging.info(
+            f"Bootstrap {self.confidence:.0%} intervals over {self.n_replicates} replicates: {intervals}"
+        )
+        return intervals
+
+    def from_scores(self, y_true, scores) -> dict:
+        """
+        Computes bootstrap confidence intervals from labels and scores.
+
+        Parameters:
+        y_true (array-like): Binary labels.
+        scores (array-like): Fraud scores.
+
+        Returns:
+        dict: The estimate and the lower and upper bounds of ROC AUC, F1, precision and recall.
+        """
+        return self._intervals(*self._group_scores(y_true, scores))
+
+    def from_histograms(self, positive_histogram, negative_histogram) -> dict:
+        """
+        Computes bootstrap confidence intervals from equal-width score histograms over [0, 1].
+
+        Bins whose lower edge is at or above the threshold count as flagged, which is exact
+        when the threshold falls on a bin edge.
+
+        Parameters:
+        positive_histogram (array-like): Counts of fraudulent rows per score bin.
+        negative_histogram (array-like): Counts of legitimate rows per score bin.
+
+        Returns:
+        dict: The estimate and the lower and upper bounds of ROC AUC, F1, precision and recall.
+        """
+        positive_histogram = np.asarray(positive_histogram, dtype=np.int64)
+        negative_histogram = np.asarray(negative_histogram, dtype=np.int64)
+        lower_edges = np.arange(len(positive_histogram)) / len(positive_histogram)
+        return self._intervals(
+            positive_histogram, negative_histogram, lower_edges >= self.threshold
+        )
+
+
+# Abstract Base Class for Model Evaluation Strategy
+# -------------------------------------------------
+# This class defines a common interface for different model evaluation strategies.
+# Subclasses must implement the evaluate_model method.
+class ModelEvaluationStrategy(ABC):
+    @abstractmethod
+    def evaluate_model(self, model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
+        """
+        Abstract method to evaluate a trained model on the test data.
+
+        Parameters:
+        model: The trained model or pipeline.
+        X_test (pd.DataFrame): The raw test features.
+        y_test (pd.Series): The test labels.
+
+        Returns:
+        dict: The evaluation metrics.
+        """
+        pass
+
+
+# Concrete Strategy for Batched Classification Evaluation
+# -------------------------------------------------------
+# This strategy transforms and scores the test set in fixed-size batches.
+class BatchedClassificationEvaluationStrategy(ModelEvaluationStrategy):
+    def __init__(
+        self,
+        transformer=None,
+        batch_size: int = 100_000,
+        threshold: float = 0.5,
+        n_bins: int = 1000,
+    ):
+        """
+        Initializes the BatchedClassificationEvaluationStrategy with specific parameters.
+
+        Parameters:
+        transformer: The feature transformer fitted on the training data, applied to every batch.
+        batch_size (int): Number of rows scored at once.
+        threshold (float): Decision threshold on the fraud score.
+        n_bins (int): Number of score histogram bins per class.
+        """
+        self.transformer = transformer
+        self.batch_size = batch_size
+        self.threshold = threshold
+        self.n_bins = n_bins
+
+    def iter_batches(self, model, X_test: pd.DataFrame, y_test: pd.Series):
+        """
+        Transforms and scores the test set one batch at a time.
+
+        Parameters:
+        model: The trained model or pipeline.
+        X_test (pd.DataFrame): The raw test features.
+        y_test (pd.Series): The test labels.
+
+        Yields:
+        tuple: The labels and fraud scores of each batch.
+        """
+        y_values = np.asarray(y_test)
+        for start in range(0, len(X_test), self.batch_size):
+            batch = X_test.iloc[start : start + self.batch_size]
+            if self.transformer is not None:
+                batch = pd.DataFrame(
+                    self.transformer.transform(batch), columns=X_test.columns
+                )
+            yield y_values[start : start + self.batch_size], predict_positive_scores(
+                model, batch
+            )
+
+    def evaluate_model(self, model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
+        """
+        Evaluates the model with metrics accumulated incrementally over the batches.
+
+        Parameters:
+        model: The trained model or pipeline.
+        X_test (pd.DataFrame): The raw test features.
+        y_test (pd.Series): The test labels.
+
+        Returns:
+        dict: The evaluation metrics.
+        """
+        logging.info(
+            f"Evaluating the model on {len(X_test)} rows in batches of {self.batch_size}."
+        )
+        accumulator = StreamingMetricsAccumulator(self.threshold, self.n_bins)
+        for y_batch, scores in self.iter_batches(model, X_test, y_test):
+            accumulator.update(y_batch, scores)
+        # Kept so that threshold sweeps can reuse the score histograms.
+        self.accumulator_ = accumulator
+
+        metrics = accumulator.result()
+        logging.info(f"Model evaluation completed: {metrics}")
+        return metrics
+
+
+# Context Class for Model Evaluation
+# ----------------------------------
+# This class uses a ModelEvaluationStrategy to evaluate a trained model.
+class ModelEvaluator:
+    def __init__(self, strategy: ModelEvaluationStrategy):
+        """
+        Initializes the ModelEvaluator with a specific model evaluation strategy.
+
+        Parameters:
+        strategy (ModelEvaluationStrategy): The strategy to be used for model evaluation.
+        """
+        self._strategy = strategy
+
+    def set_strategy(self, strategy: ModelEvaluationStrategy):
+        """
+        Sets a new strategy for the ModelEvaluator.
+
+        Parameters:
+        strategy (ModelEvaluationStrategy): The new strategy to be used for model evaluation.
+        """
+        logging.info("Switching model evaluation strategy.")
+        self._strategy = strategy
+
+    def evaluate(self, model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
+        """
+        Executes the model evaluation using the current strategy.
+
+        Parameters:
+        model: The trained model or pipeline.
+        X_test (pd.DataFrame): The raw test features.
+        y_test (pd.Series): The test labels.
+
+        Returns:
+        dict: The evaluation metrics.
+        """
+        logging.info("Evaluating the model using the selected strategy.")
+        return self._strategy.evaluate_model(model, X_test, y_test)
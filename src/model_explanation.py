@@ -0,0 +1,347 @@
+import logging
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from constants.string_constants import StringConstants
+from src.caching import LRUCache
+from src.data_modelling import predict_positive_scores
+from src.numpy_inference import NumpyGeneticModel
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+# Abstract Base Class for Explanation Strategy
+# --------------------------------------------
+# Explanations are additive feature attributions of the model's raw (log-odds) output.
+class ExplanationStrategy(ABC):
+    @abstractmethod
+    def explain(self, X: np.ndarray) -> np.ndarray:
+        """
+        Abstract method to attribute the raw model output of a batch to its features.
+
+        Parameters:
+            X (np.ndarray): The transformed feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: SHAP values of shape (n_samples, n_features).
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def expected_value(self) -> float:
+        """
+        The raw output the SHAP values of every row are added to.
+        """
+        pass
+
+
+# Concrete Strategy for LightGBM models
+# -------------------------------------
+# TreeSHAP as implemented by LightGBM itself; it is exact, batched and multi-threaded.
+class TreeShapExplanationStrategy(ExplanationStrategy):
+    def __init__(self, model):
+        """
+        Initializes the TreeShapExplanationStrategy with a trained LightGBM model.
+
+        Parameters:
+            model (lightgbm.Booster or LGBMModel): The trained LightGBM model.
+        """
+        self.booster = getattr(model, "booster_", model)
+        self._expected_value = None
+
+    def explain(self, X: np.ndarray) -> np.ndarray:
+        """
+        Computes exact TreeSHAP values with LightGBM's `pred_contrib`.
+        """
+        contributions = self.booster.predict(X, pred_contrib=True)
+        # The last column is the expected value, identical for every row.
+        self._expected_value = float(contributions[0, -1]) if len(contributions) else None
+        return contributions[:, :-1]
+
+    @property
+    def expected_value(self) -> float:
+        if self._expected_value is None:
+            n_features = self.booster.num_feature()
+            self._expected_value = float(
+                self.booster.predict(np.zeros((1, n_features)), pred_contrib=True)[0, -1]
+            )
+        return self._expected_value
+
+
+# Concrete Strategy for the GA network
+# ------------------------------------
+# Expected gradients (the method behind shap's GradientExplainer), with the forward and
+# backward passes run in numpy on the folded network weights. The pre-sigmoid logit is
+# explained because the network's probabilities are saturated almost everywhere.
+class GradientExplanationStrategy(ExplanationStrategy):
+    def __init__(
+        self,
+        model: NumpyGeneticModel,
+        background: np.ndarray,
+        n_background: int = 100,
+        n_samples: int = 32,
+        chunk_size: int = 2048,
+        random_state: int = 42,
+    ):
+        """
+        Initializes the GradientExplanationStrategy with the network and a background sample.
+
+        Parameters:
+            model (NumpyGeneticModel): The GA network.
+            background (np.ndarray): Transformed training rows the background is drawn from.
+            n_background (int): Size of the cached background sample.
+            n_samples (int): Gradient samples per explained row.
+            chunk_size (int): Rows explained at once, bounding memory.
+            random_state (int): Seed of the background sample and, with the row itself, of
+                the path sampling of every row.
+        """
+        self.layers = model.layers_
+        self.n_samples = n_samples
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+
+        background = np.asarray(background, dtype=np.float32)
+        if len(background) > n_background:
+            rng = np.random.default_rng(random_state)
+            background = background[rng.choice(len(background), n_background, replace=False)]
+        self.background = background
+        self._expected_value = float(self._logit_and_gradient(background)[0].mean())
+
+    def _logit_and_gradient(self, X: np.ndarray) -> tuple:
+        """
+        Runs the network up to its final pre-activation and backpropagates it to the inputs.
+        """
+        pre_activations = []
+        output = X
+        for index, (kernel, bias, activation) in enumerate(self.layers):
+            output = output @ kernel
+            output += bias
+            pre_activations.append(output.copy())
+            if index < len(self.layers) - 1:
+                output = _ACTIVATION_OUTPUTS[activation](output)
+
+        gradient = np.ones_like(output)
+        for index in range(len(self.layers) - 1, -1, -1):
+            kernel, _, activation = self.layers[index]
+            if index < len(self.layers) - 1:
+                gradient *= _ACTIVATION_DERIVATIVES[activation](pre_activations[index])
+            gradient = gradient @ kernel.T
+        return output[:, 0], gradient
+
+    def _sample_paths(self, chunk: np.ndarray) -> tuple:
+        """
+        Draws the background rows and path positions of every row from a generator seeded
+        with the row's values, so a row gets the same explanation in any batch and order.
+        """
+        n_rows = len(chunk)
+        reference_rows = np.empty((n_rows, self.n_samples), dtype=np.int64)
+        alphas = np.empty((n_rows, self.n_samples, 1), dtype=np.float32)
+        for index, row in enumerate(chunk):
+            rng = np.random.default_rng(
+                [self.random_state, *np.frombuffer(row.tobytes(), dtype=np.uint32).tolist()]
+            )
+            reference_rows[index] = rng.integers(0, len(self.background), size=self.n_samples)
+            alphas[index, :, 0] = rng.random(self.n_samples, dtype=np.float32)
+        return self.background[reference_rows], alphas
+
+    def explain(self, X: np.ndarray) -> np.ndarray:
+        """
+        Averages (x - x') * gradient(x' + alpha * (x - x')) over background rows x' and
+        random path positions alpha, for every row in chunks.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        shap_values = np.empty(X.shape, dtype=np.float64)
+        for start in range(0, len(X), self.chunk_size):
+            chunk = X[start : start + self.chunk_size]
+            n_rows = len(chunk)
+
+            references, alphas = self._sample_paths(chunk)
+            differences = chunk[:, None, :] - references
+            points = references + alphas * differences
+
+            _, gradients = self._logit_and_gradient(points.reshape(-1, X.shape[1]))
+            shap_values[start : start + n_rows] = (
+                differences * gradients.reshape(differences.shape)
+            ).mean(axis=1)
+        return shap_values
+
+    @property
+    def expected_value(self) -> float:
+        return self._expected_value
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    """
+    Logistic function, clipped so that exp never overflows in float32.
+    """
+    return 1 / (1 + np.exp(-np.clip(x, -88.0, 88.0)))
+
+
+# Activations and their derivatives, evaluated on the pre-activations.
+_ACTIVATION_OUTPUTS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0),
+    "sigmoid": _sigmoid,
+    "tanh": np.tanh,
+}
+_ACTIVATION_DERIVATIVES = {
+    "linear": lambda x: np.ones_like(x),
+    "relu": lambda x: (x > 0).astype(x.dtype),
+    "sigmoid": lambda x: _sigmoid(x) * (1 - _sigmoid(x)),
+    "tanh": lambda x: 1 - np.tanh(x) ** 2,
+}
+
+
+def explanation_strategy_for_pipeline(pipeline, background: pd.DataFrame) -> ExplanationStrategy:
+    """
+    Picks the explanation strategy matching the model of a trained pipeline.
+
+    Parameters:
+        pipeline (Pipeline): The trained model pipeline.
+        background (pd.DataFrame): Transformed training rows for gradient-based explanations.
+
+    Returns:
+        ExplanationStrategy: The strategy able to explain the pipeline's model.
+
+    Raises:
+        ValueError: If the model type cannot be explained.
+    """
+    model = pipeline.named_steps["model"]
+    if hasattr(model, "booster_"):
+        return TreeShapExplanationStrategy(model)
+    if isinstance(model, NumpyGeneticModel):
+        return GradientExplanationStrategy(model, background.to_numpy())
+    if hasattr(model, "get_weights"):
+        # The Keras GA network is loaded from this file by GACSModellingStrategy.
+        return GradientExplanationStrategy(
+            NumpyGeneticModel(StringConstants.genetic_model_path), background.to_numpy()
+        )
+    raise ValueError(f"Unsupported model for explanations: {type(model).__name__}")
+
+
+# Context Class for Model Explanation
+# -----------------------------------
+# Explains batches with the selected strategy and caches the explanation of every row.
+class ModelExplainer:
+    def __init__(self, strategy: ExplanationStrategy, cache_size: int = 100_000):
+        """
+        Initializes the ModelExplainer with a specific explanation strategy.
+
+        Parameters:
+            strategy (ExplanationStrategy): The strategy used to explain rows.
+            cache_size (int): Number of row explanations kept in the LRU cache.
+        """
+        self._strategy = strategy
+        self.cache = LRUCache(cache_size)
+
+    def set_strategy(self, strategy: ExplanationStrategy):
+        """
+        Sets a new explanation strategy and drops the explanations of the previous one.
+
+        Parameters:
+            strategy (ExplanationStrategy): The new strategy.
+        """
+        logging.info("Switching explanation strategy.")
+        self._strategy = strategy
+        self.cache.clear()
+
+    @property
+    def expected_value(self) -> float:
+        return self._strategy.expected_value
+
+    def explain(self, X) -> np.ndarray:
+        """
+        Explains a batch, computing only the rows that are not cached in one strategy call.
+
+        Parameters:
+            X (array-like): The transformed feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: SHAP values of shape (n_samples, n_features).
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        keys = [row.tobytes() for row in X]
+        shap_values = np.empty(X.shape)
+
+        missing = {}
+        for index, key in enumerate(keys):
+            cached = self.cache.get(key)
+            if cached is None:
+                missing.setdefault(key, []).append(index)
+            else:
+                shap_values[index] = cached
+
+        if missing:
+            first_rows = [indices[0] for indices in missing.values()]
+            computed = self._strategy.explain(X[first_rows])
+            for (key, indices), values in zip(missing.items(), computed):
+                shap_values[indices] = values
+                self.cache.put(key, values)
+
+        logging.info(
+            f"Explained {len(X)} rows ({len(X) - sum(map(len, missing.values()))} from cache)."
+        )
+        return shap_values
+
+    def explain_frame(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Explains a batch and labels the SHAP values with the feature names.
+
+        Parameters:
+            X (pd.DataFrame): The transformed feature data.
+
+        Returns:
+            pd.DataFrame: SHAP values with the same index and columns as `X`.
+        """
+        return pd.DataFrame(self.explain(X.to_numpy()), index=X.index, columns=X.columns)
+
+
+def explain_flagged(
+    explainer: ModelExplainer,
+    model,
+    X: pd.DataFrame,
+    transformer=None,
+    threshold: float = 0.5,
+    max_rows: int = 10_000,
+    batch_size: int = 100_000,
+) -> pd.DataFrame:
+    """
+    Explains the highest-scoring flagged rows of a dataset.
+
+    Parameters:
+        explainer (ModelExplainer): The explainer of the model.
+        model: The trained model or pipeline.
+        X (pd.DataFrame): The raw feature data.
+        transformer: The feature transformer fitted on the training data, if any.
+        threshold (float): Decision threshold on the fraud score.
+        max_rows (int): Maximum number of flagged rows to explain.
+        batch_size (int): Number of rows transformed and scored at once.
+
+    Returns:
+        pd.DataFrame: SHAP values of the explained rows, with their fraud score in a 'score'
+            column. It is empty when no row is flagged.
+    """
+    flagged = []
+    for start in range(0, len(X), batch_size):
+        batch = X.iloc[start : start + batch_size]
+        if transformer is not None:
+            batch = pd.DataFrame(
+                transformer.transform(batch), index=batch.index, columns=X.columns
+            )
+        scores = predict_positive_scores(model, batch)
+        mask = scores >= threshold
+        flagged.append(batch[mask].assign(score=scores[mask]))
+
+    if not any(len(batch) for batch in flagged):
+        return pd.DataFrame(columns=[*X.columns, "score"], dtype=np.float64)
+
+    flagged = pd.concat(flagged).nlargest(max_rows, "score")
+    explanations = explainer.explain_frame(flagged.drop(columns="score"))
+    explanations["score"] = flagged["score"]
+    return explanations
@@ -0,0 +1,141 @@
+import logging
+import mmap
+import os
+import pickle
+import struct
+
+import numpy as np
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+# Package header: magic, number of weight buffers and size of the pickled model structure.
+PACKAGE_MAGIC = b"EFMP"
+PACKAGE_HEADER = struct.Struct("<4sIQ")
+# Every (offset, size) entry of the buffer table.
+BUFFER_ENTRY = struct.Struct("<QQ")
+# Weight buffers start on cache-line boundaries so that the mapped arrays are aligned.
+BUFFER_ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    """
+    Rounds an offset up to the next buffer boundary.
+    """
+    return -(-offset // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+
+
+def save_model_package(model, file_path: str) -> dict:
+    """
+    Saves a model or pipeline into a single file whose weight arrays are stored raw,
+    outside of the pickled model structure.
+
+    Every contiguous numpy array of the model (network kernels, tree node arrays, scaler
+    statistics) is written as an aligned buffer that `load_model_package` maps instead of
+    reading. Use the numpy GA network and the flat tree ensemble rather than the Keras and
+    LightGBM models, whose weights are not numpy arrays.
+
+    Parameters:
+        model: The trained model or pipeline; it must be picklable.
+        file_path (str): Destination path of the package.
+
+    Returns:
+        dict: The number of weight buffers and the sizes of the structure and weights in bytes.
+    """
+    buffers = []
+    structure = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    offset = PACKAGE_HEADER.size + BUFFER_ENTRY.size * len(raw_buffers) + len(structure)
+    table = []
+    for raw in raw_buffers:
+        offset = _aligned(offset)
+        table.append((offset, raw.nbytes))
+        offset += raw.nbytes
+
+    with open(file_path, "wb") as f:
+        f.write(PACKAGE_HEADER.pack(PACKAGE_MAGIC, len(raw_buffers), len(structure)))
+        for entry in table:
+            f.write(BUFFER_ENTRY.pack(*entry))
+        f.write(structure)
+        for (buffer_offset, _), raw in zip(table, raw_buffers):
+            f.write(b"\0" * (buffer_offset - f.tell()))
+            f.write(raw)
+
+    summary = {
+        "buffers": len(raw_buffers),
+        "structure_bytes": len(structure),
+        "weight_bytes": sum(size for _, size in table),
+    }
+    logging.info(f"Saved model package {file_path}: {summary}")
+    return summary
+
+
+def is_model_package(file_path: str) -> bool:
+    """
+    Returns whether a file starts with the model package magic.
+    """
+    with open(file_path, "rb") as f:
+        return f.read(len(PACKAGE_MAGIC)) == PACKAGE_MAGIC
+
+
+def load_model_package(file_path: str):
+    """
+    Loads a model saved with `save_model_package`, mapping its weights read-only.
+
+    The weight arrays of the returned model are views of the mapped file, so every process
+    loading the same package shares one physical copy of them through the page cache.
+
+    Parameters:
+        file_path (str): Path of the package.
+
+    Returns:
+        The model or pipeline, with read-only weight arrays.
+
+    Raises:
+        ValueError: If the file is not a model package.
+    """
+    with open(file_path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    magic, n_buffers, structure_size = PACKAGE_HEADER.unpack_from(view)
+    if magic != PACKAGE_MAGIC:
+        raise ValueError(f"{file_path} is not a model package.")
+
+    offset = PACKAGE_HEADER.size
+    buffers = []
+    for _ in range(n_buffers):
+        buffer_offset, size = BUFFER_ENTRY.unpack_from(view, offset)
+        buffers.append(view[buffer_offset : buffer_offset + size])
+        offset += BUFFER_ENTRY.size
+
+    # The arrays keep the mapping alive; it is released with the last of them.
+    model = pickle.loads(view[offset : offset + structure_size], buffers=buffers)
+    logging.info(f"Mapped {n_buffers} weight buffers from {file_path}.")
+    return model
+
+
+def load_feature_transformer(file_path: str):
+    """
+    Loads the feature transformer saved by the feature engineering step.
+
+    The trained models expect transformed features, so every scoring entry point applies
+    it to raw rows before predicting.
+
+    Parameters:
+        file_path (str): Path of the transformer package.
+
+    Returns:
+        The fitted transformer.
+
+    Raises:
+        FileNotFoundError: If the transformer was not saved, i.e. no training run happened yet.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(
+            f"Feature transformer {file_path} not found; run the training pipeline first."
+        )
+    return load_model_package(file_path)
@@ -0,0 +1,283 @@
+import logging
+
+import numpy as np
+
+from src.numpy_inference import ACTIVATIONS, NumpyGeneticModel
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+# Candidate clipping ratios searched during calibration of the int8 weight scales.
+CLIP_RATIOS = (1.0, 0.999, 0.99, 0.98, 0.95, 0.9, 0.85, 0.8)
+
+
+def quantize_per_channel_int8(kernel: np.ndarray, clip_ratio=1.0) -> tuple:
+    """
+    Symmetrically quantizes a Dense kernel to int8 with one scale per output channel.
+
+    Parameters:
+        kernel (np.ndarray): The float32 kernel of shape (n_inputs, n_outputs).
+        clip_ratio (float or np.ndarray): Fraction of the per-channel max-abs value mapped to 127.
+
+    Returns:
+        tuple: The int8 kernel and the float32 per-channel scales.
+    """
+    max_abs = np.abs(kernel).max(axis=0) * clip_ratio
+    scale = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+    quantized = np.clip(np.rint(kernel / scale), -127, 127).astype(np.int8)
+    return quantized, scale
+
+
+# Quantized GACS network
+# ----------------------
+# Kernels are stored (and pickled into model packages) as int8 or float16 only; the float
+# weights are dropped once calibration no longer needs them. numpy has no BLAS kernel for
+# integer matrix products, so every layer is dequantized into a float32 temporary for its
+# product. `cache_dequantized` keeps those float32 kernels instead, trading the memory the
+# quantization saves for a faster forward pass.
+class QuantizedGeneticModel:
+    def __init__(self, layers: list, dtype: str = "int8", cache_dequantized: bool = False):
+        """
+        Initializes the QuantizedGeneticModel from folded float32 layers.
+
+        Parameters:
+            layers (list): (kernel, bias, activation) tuples as returned by `load_genetic_model_weights`.
+            dtype (str): Storage type of the kernels. Options: 'int8' or 'float16'.
+            cache_dequantized (bool): Whether to keep the dequantized float32 kernels
+                between predictions rather than rebuilding them on every call.
+        """
+        if dtype not in ("int8", "float16"):
+            raise ValueError(f"Unsupported quantization dtype: {dtype}")
+
+        self.dtype = dtype
+        self.cache_dequantized = cache_dequantized
+        self.classes_ = np.array([0, 1])
+        # Kept for int8 calibration only; float16 storage needs none.
+        self.float_layers = layers if dtype == "int8" else None
+        self._quantize(layers, clip_ratios=[1.0] * len(layers))
+
+    @classmethod
+    def from_file(cls, file_path: str, dtype: str = "int8", cache_dequantized: bool = False):
+        """
+        Builds the quantized model directly from the Keras `.h5` file.
+
+        Parameters:
+            file_path (str): Path to the `.h5` model file.
+            dtype (str): Storage type of the kernels. Options: 'int8' or 'float16'.
+            cache_dequantized (bool): Whether to keep the dequantized float32 kernels.
+
+        Returns:
+            QuantizedGeneticModel: The quantized model.
+        """
+        return cls(
+            NumpyGeneticModel(file_path).layers_, dtype=dtype, cache_dequantized=cache_dequantized
+        )
+
+    def _quantize(self, float_layers: list, clip_ratios: list):
+        """
+        Quantizes every kernel with the given per-layer (or per-channel) clipping ratios.
+        """
+        self.layers_ = []
+        for (kernel, bias, activation), clip_ratio in zip(float_layers, clip_ratios):
+            if self.dtype == "int8":
+                quantized, scale = quantize_per_channel_int8(kernel, clip_ratio)
+            else:
+                quantized, scale = kernel.astype(np.float16), None
+            self.layers_.append((quantized, scale, bias, activation))
+        self._dequantized_layers = None
+
+    def __getstate__(self) -> dict:
+        # Neither the float weights nor the float32 cache are stored, only the quantized layers.
+        state = self.__dict__.copy()
+        state["float_layers"] = None
+        state["_dequantized_layers"] = None
+        return state
+
+    @staticmethod
+    def _dequantize_layer(layer: tuple) -> tuple:
+        """
+        Returns the float32 (kernel * scale, None, bias, activation) form of a layer.
+        """
+        kernel, scale, bias, activation = layer
+        kernel = kernel.astype(np.float32)
+        if scale is not None:
+            kernel *= scale
+        return kernel, None, bias, activation
+
+    def _forward_layers(self) -> list:
+        """
+        Returns the layers of the forward pass: the cached float32 ones if enabled.
+        """
+        if not self.cache_dequantized:
+            return self.layers_
+        if self._dequantized_layers is None:
+            self._dequantized_layers = [self._dequantize_layer(layer) for layer in self.layers_]
+        return self._dequantized_layers
+
+    @staticmethod
+    def _forward_layer(output: np.ndarray, layer: tuple) -> np.ndarray:
+        """
+        Applies one Dense layer; products are accumulated in float32.
+        """
+        kernel, scale, bias, activation = layer
+        output = output @ kernel.astype(np.float32, copy=False)
+        if scale is not None:
+            output *= scale
+        output += bias
+        return ACTIVATIONS[activation](output)
+
+    def calibrate(self, X_calibration: np.ndarray) -> "QuantizedGeneticModel":
+        """
+        Chooses per-channel int8 clipping ratios on a held-out slice.
+
+        For each layer and output channel the ratio minimising the squared error of
+        the pre-activation outputs against the float model is kept. Layers are
+        calibrated in order, feeding each layer the float activations of the previous one.
+
+        Parameters:
+            X_calibration (np.ndarray): Held-out feature data used only for calibration.
+
+        Returns:
+            QuantizedGeneticModel: The calibrated model itself.
+        """
+        if self.dtype != "int8":
+            logging.info("Float16 storage needs no calibration.")
+            return self
+        if self.float_layers is None:
+            raise ValueError("The float weights were released; calibrate before saving the model.")
+
+        logging.info(f"Calibrating int8 scales on {len(X_calibration)} rows.")
+        activations = np.asarray(X_calibration, dtype=np.float32)
+        clip_ratios = []
+
+        for kernel, bias, activation in self.float_layers:
+            reference = activations @ kernel
+            errors = []
+            for ratio in CLIP_RATIOS:
+                quantized, scale = quantize_per_channel_int8(kernel, ratio)
+                approximation = (activations @ quantized.astype(np.float32)) * scale
+                errors.append(np.mean((approximation - reference) ** 2, axis=0))
+
+            best = np.argmin(np.vstack(errors), axis=0)
+            clip_ratios.append(np.asarray(CLIP_RATIOS, dtype=np.float32)[best])
+            activations = ACTIVATIONS[activation](reference + bias)
+
+        self._quantize(self.float_layers, clip_ratios)
+        # The float weights are only needed for calibration; keep the worker footprint small.
+        self.float_layers = None
+        logging.info("Calibration completed.")
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the stored kernels, scales and biases.
+        """
+        return sum(
+            kernel.nbytes + bias.nbytes + (0 if scale is None else scale.nbytes)
+            for kernel, scale, bias, _ in self.layers_
+        )
+
+    @property
+    def resident_nbytes(self) -> int:
+        """
+        Memory held by the weight arrays, including the float weights kept for calibration
+        and the dequantized cache.
+        """
+        resident = self.nbytes
+        if self.float_layers is not None:
+            resident += sum(kernel.nbytes for kernel, _, _ in self.float_layers)
+        if self._dequantized_layers is not None:
+            resident += sum(kernel.nbytes for kernel, _, _, _ in self._dequantized_layers)
+        return resident
+
+    def fit(self, X, y=None):
+        """
+        The network is pre-trained, so fitting leaves the weights untouched.
+
+        Returns:
+            QuantizedGeneticModel: The model itself.
+        """
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Runs the quantized forward pass.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: Fraud probabilities of shape (n_samples, 1).
+        """
+        output = np.asarray(X, dtype=np.float32)
+        for layer in self._forward_layers():
+            output = self._forward_layer(output, layer)
+        return output
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Returns the probabilities of both classes.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: Class probabilities of shape (n_samples, 2).
+        """
+        positive = self.predict(X)
+        return np.hstack([1 - positive, positive])
+
+
+def quantization_report(
+    float_model: NumpyGeneticModel,
+    quantized_model: QuantizedGeneticModel,
+    X: np.ndarray,
+    y: np.ndarray,
+    threshold: float = 0.5,
+) -> dict:
+    """
+    Reports the accuracy regression of a quantized model against the float model.
+
+    Parameters:
+        float_model (NumpyGeneticModel): The float32 reference model.
+        quantized_model (QuantizedGeneticModel): The quantized model.
+        X (np.ndarray): Held-out feature data, disjoint from the calibration slice.
+        y (np.ndarray): Held-out labels.
+        threshold (float): Decision threshold for the F1 score.
+
+    Returns:
+        dict: AUC and F1 of both models, their deltas, the weight memory of both and the
+            size of both once pickled (e.g. into a model package).
+    """
+    import pickle
+
+    from sklearn.metrics import f1_score, roc_auc_score
+
+    float_scores = float_model.predict(X).ravel()
+    quantized_scores = quantized_model.predict(X).ravel()
+
+    report = {
+        "float_auc": roc_auc_score(y, float_scores),
+        "quantized_auc": roc_auc_score(y, quantized_scores),
+        "float_f1": f1_score(y, float_scores >= threshold),
+        "quantized_f1": f1_score(y, quantized_scores >= threshold),
+        "max_abs_score_delta": float(np.max(np.abs(float_scores - quantized_scores))),
+        "float_nbytes": sum(k.nbytes + b.nbytes for k, b, _ in float_model.layers_),
+        "quantized_nbytes": quantized_model.nbytes,
+        "quantized_resident_nbytes": quantized_model.resident_nbytes,
+        "float_pickled_bytes": len(pickle.dumps(float_model, protocol=5)),
+        "quantized_pickled_bytes": len(pickle.dumps(quantized_model, protocol=5)),
+    }
+    report["auc_delta"] = report["quantized_auc"] - report["float_auc"]
+    report["f1_delta"] = report["quantized_f1"] - report["float_f1"]
+
+    logging.info(
+        f"{quantized_model.dtype} quantization: AUC delta {report['auc_delta']:+.5f}, "
+        f"F1 delta {report['f1_delta']:+.5f}, "
+        f"{report['float_nbytes']} -> {report['quantized_nbytes']} weight bytes, "
+        f"{report['float_pickled_bytes']} -> {report['quantized_pickled_bytes']} pickled bytes"
+    )
+    return report
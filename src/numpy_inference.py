@@ -0,0 +1,209 @@
+import json
+
+import numpy as np
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    """
+    In-place logistic function, clipped so that exp never overflows in float32.
+    """
+    np.clip(x, -88.0, 88.0, out=x)
+    np.negative(x, out=x)
+    np.exp(x, out=x)
+    x += 1
+    return np.reciprocal(x, out=x)
+
+
+# Activation functions supported by the exported Dense layers.
+ACTIVATIONS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0, out=x),
+    "sigmoid": _sigmoid,
+    "tanh": lambda x: np.tanh(x, out=x),
+}
+
+
+def _read_layer_weights(weights_group, layer_name: str) -> dict:
+    """
+    Reads the weights of a single layer from the Keras HDF5 weights group.
+
+    Parameters:
+        weights_group (h5py.Group): The `model_weights` group of the HDF5 file.
+        layer_name (str): The name of the layer.
+
+    Returns:
+        dict: Weight arrays keyed by their short name (e.g. 'kernel', 'gamma').
+    """
+    layer_group = weights_group[layer_name]
+    weights = {}
+    for weight_name in layer_group.attrs["weight_names"]:
+        if isinstance(weight_name, bytes):
+            weight_name = weight_name.decode("utf8")
+        short_name = weight_name.split("/")[-1].split(":")[0]
+        weights[short_name] = np.asarray(layer_group[weight_name], dtype=np.float32)
+    return weights
+
+
+def load_genetic_model_weights(file_path: str) -> list:
+    """
+    Loads the Dense and BatchNormalization weights of a Keras Sequential model from
+    its HDF5 file without importing TensorFlow, and folds every BatchNormalization
+    into the adjacent Dense layer.
+
+    A BatchNormalization that follows a linear Dense layer is folded into that layer.
+    When the Dense layer has a non-linear activation (as in the GA network) the
+    normalization is folded into the next Dense layer instead.
+
+    Parameters:
+        file_path (str): Path to the `.h5` model file.
+
+    Returns:
+        list: A list of (kernel, bias, activation) tuples, one per Dense layer.
+    """
+    import h5py
+
+    layers = []
+    pending_scale, pending_shift = None, None
+
+    with h5py.File(file_path, "r") as f:
+        model_config = json.loads(f.attrs["model_config"])
+        weights_group = f["model_weights"]
+
+        for layer in model_config["config"]["layers"]:
+            class_name, config = layer["class_name"], layer["config"]
+
+            if class_name == "InputLayer":
+                continue
+            elif class_name == "Dense":
+                weights = _read_layer_weights(weights_group, config["name"])
+                kernel = weights["kernel"]
+                bias = weights.get("bias", np.zeros(kernel.shape[1], np.float32))
+
+                if pending_scale is not None:
+                    # (x * s + t) @ W + b == x @ (s[:, None] * W) + (t @ W + b)
+                    bias = pending_shift @ kernel + bias
+                    kernel = pending_scale[:, None] * kernel
+                    pending_scale, pending_shift = None, None
+
+                layers.append([kernel, bias, config.get("activation", "linear")])
+            elif class_name == "BatchNormalization":
+                weights = _read_layer_weights(weights_group, config["name"])
+                variance = weights["moving_variance"]
+                scale = weights.get("gamma", np.ones_like(variance)) / np.sqrt(
+                    variance + config["epsilon"]
+                )
+                shift = weights.get("beta", np.zeros_like(variance)) - (
+                    weights["moving_mean"] * scale
+                )
+
+                if layers and layers[-1][2] == "linear" and pending_scale is None:
+                    layers[-1][0] = layers[-1][0] * scale
+                    layers[-1][1] = layers[-1][1] * scale + shift
+                elif pending_scale is None:
+                    pending_scale, pending_shift = scale, shift
+                else:
+                    pending_shift = pending_shift * scale + shift
+                    pending_scale = pending_scale * scale
+            elif class_name in ("Dropout", "Activation") and (
+                class_name == "Dropout" or config.get("activation") == "linear"
+            ):
+                # Dropout and linear activations are no-ops at inference time.
+                continue
+            else:
+                raise ValueError(f"Unsupported layer type for numpy inference: {class_name}")
+
+    if pending_scale is not None:
+        # A trailing normalization becomes a diagonal linear layer.
+        layers.append([np.diag(pending_scale), pending_shift, "linear"])
+
+    return [
+        (
+            np.ascontiguousarray(kernel, dtype=np.float32),
+            np.ascontiguousarray(bias, dtype=np.float32),
+            activation,
+        )
+        for kernel, bias, activation in layers
+    ]
+
+
+# Drop-in replacement for the Keras model inside a scikit-learn Pipeline.
+# It deliberately avoids scikit-learn and TensorFlow imports to keep worker cold start low.
+class NumpyGeneticModel:
+    def __init__(self, file_path: str):
+        """
+        Initializes the NumpyGeneticModel with the path of the Keras model file.
+
+        Parameters:
+            file_path (str): Path to the `.h5` model file.
+        """
+        self.file_path = file_path
+        self.layers_ = load_genetic_model_weights(file_path)
+        self.classes_ = np.array([0, 1])
+
+    @property
+    def n_features_in_(self) -> int:
+        """
+        Number of input features expected by the network.
+        """
+        return self.layers_[0][0].shape[0]
+
+    def fit(self, X, y=None):
+        """
+        The network is pre-trained, so fitting leaves the weights untouched.
+
+        Returns:
+            NumpyGeneticModel: The model itself.
+        """
+        return self
+
+    def _forward(self, X, final_activation: bool) -> np.ndarray:
+        """
+        Runs the forward pass as a sequence of float32 matmuls, optionally stopping before
+        the activation of the output layer.
+        """
+        output = np.asarray(X, dtype=np.float32)
+        last = len(self.layers_) - 1
+        for index, (kernel, bias, activation) in enumerate(self.layers_):
+            output = output @ kernel
+            output += bias
+            if index < last or final_activation:
+                output = ACTIVATIONS[activation](output)
+        return output
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Runs the forward pass as a sequence of float32 matmuls.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: Fraud probabilities of shape (n_samples, 1), like Keras' `predict`.
+        """
+        return self._forward(X, final_activation=True)
+
+    def logits(self, X) -> np.ndarray:
+        """
+        Returns the output layer's pre-activation values, which unlike the saturating
+        probabilities still separate rows scored far from the decision boundary.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: The logits of shape (n_samples, 1).
+        """
+        return self._forward(X, final_activation=False)
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Returns the probabilities of both classes.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: Class probabilities of shape (n_samples, 2).
+        """
+        positive = self.predict(X)
+        return np.hstack([1 - positive, positive])
@@ -0,0 +1,336 @@
+import hashlib
+import json
+import struct
+
+import numpy as np
+
+# Feature order of the model trained by `ml_pipeline`, used when no schema is at hand.
+# The input schema artifact saved at training time is authoritative.
+EXPECTED_COLUMNS = [
+    "avg_min_between_sent_tnx",
+    "avg_min_between_received_tnx",
+    "time_diff_between_first_and_last_(mins)",
+    "sent_tnx",
+    "received_tnx",
+    "number_of_created_contracts",
+    "max_value_received",
+    "avg_val_received",
+    "avg_val_sent",
+    "total_ether_sent",
+    "total_ether_balance",
+    "erc20_total_ether_received",
+    "erc20_total_ether_sent",
+    "erc20_total_ether_sent_contract",
+    "erc20_uniq_sent_addr",
+    "erc20_uniq_rec_token_name",
+]
+
+# Content types of the supported request payloads.
+JSON_CONTENT_TYPE = "application/json"
+NPY_CONTENT_TYPE = "application/x-npy"
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+FLOAT32_ROWS_CONTENT_TYPE = "application/x-float32-rows"
+
+# Header of the float32 rows format: magic, schema id, number of rows and of features.
+FLOAT32_ROWS_MAGIC = b"EFR1"
+FLOAT32_ROWS_HEADER = struct.Struct("<4s8sIH2x")
+
+# Upper bound of the bytes read to parse a `.npy` header.
+NPY_MAX_HEADER_SIZE = 65546
+
+
+def _column_order(columns: list, expected_columns: list) -> list:
+    """
+    Returns the position of every expected column in the payload's columns.
+
+    Raises:
+        ValueError: If an expected column is missing from the payload.
+    """
+    positions = {column: index for index, column in enumerate(columns)}
+    missing = [column for column in expected_columns if column not in positions]
+    if missing:
+        raise ValueError(f"Missing features in the payload: {missing}")
+    return [positions[column] for column in expected_columns]
+
+
+def _to_float_array(rows: list, dtype) -> np.ndarray:
+    """
+    Converts nested lists of numbers into an array, turning nulls into NaN so that rows
+    with missing values can be rejected one by one instead of failing the whole batch.
+
+    Raises:
+        ValueError: If a value is neither a number nor null.
+    """
+    try:
+        return np.array(rows, dtype=dtype)
+    except TypeError:
+        values = np.array(rows, dtype=object)
+        values[np.equal(values, None)] = np.nan
+        return values.astype(dtype)
+
+
+def decode_dataframe_records(
+    payload: dict, expected_columns: list = None, dtype=np.float32
+) -> np.ndarray:
+    """
+    Decodes an MLflow `dataframe_records` payload into a feature array.
+
+    Parameters:
+        payload (dict): The decoded JSON request body.
+        expected_columns (list): Feature order expected by the model. Defaults to the keys of the first record.
+        dtype: The dtype of the returned array.
+
+    Returns:
+        np.ndarray: The feature data of shape (n_records, n_features).
+
+    Raises:
+        ValueError: If the payload is not a list of records of numbers. Missing features
+            and nulls become NaN, to be rejected row by row by the input schema.
+    """
+    records = payload.get("dataframe_records")
+    if not isinstance(records, list):
+        raise ValueError("The payload must contain a 'dataframe_records' list.")
+    if not records:
+        return np.empty((0, len(expected_columns or [])), dtype=dtype)
+
+    expected_columns = expected_columns or list(records[0])
+    try:
+        # Features missing from a record are treated as null values.
+        return _to_float_array(
+            [[record.get(column) for column in expected_columns] for record in records], dtype
+        )
+    except (AttributeError, TypeError, ValueError) as e:
+        raise ValueError(f"Records must map every feature to a number: {e}") from None
+
+
+def decode_split_json(payload, expected_columns: list, dtype=np.float32) -> np.ndarray:
+    """
+    Decodes a `split`-orient JSON payload ({"columns", "index", "data"}) into a feature array.
+
+    The row lists are converted in one call and the columns are reordered with a single
+    gather, instead of building a dict per row.
+
+    Parameters:
+        payload (str, bytes or dict): The JSON payload or its decoded form; a
+            `dataframe_split` wrapper (as sent to MLflow) is unwrapped.
+        expected_columns (list): Feature order expected by the model.
+        dtype: The dtype of the returned array.
+
+    Returns:
+        np.ndarray: The feature data of shape (n_rows, len(expected_columns)).
+
+    Raises:
+        ValueError: If the payload has no data, lacks an expected column or its rows do
+            not match its column names.
+    """
+    if isinstance(payload, (str, bytes)):
+        payload = json.loads(payload)
+    payload = payload.get("dataframe_split", payload)
+    if "data" not in payload:
+        raise ValueError("The payload must contain a 'data' list.")
+
+    try:
+        X = _to_float_array(payload["data"], dtype)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"The payload data must be a rectangular list of numbers: {e}") from None
+    if X.size == 0:
+        return np.empty((0, len(expected_columns)), dtype=dtype)
+    if X.ndim != 2:
+        raise ValueError(f"The payload data must be 2-D, got shape {X.shape}.")
+
+    columns = payload.get("columns")
+    if columns is None:
+        if X.shape[1] != len(expected_columns):
+            raise ValueError(
+                f"Expected {len(expected_columns)} features without column names, got {X.shape[1]}."
+            )
+        return X
+    if X.shape[1] != len(columns):
+        raise ValueError(f"Got {len(columns)} column names for rows of {X.shape[1]} values.")
+
+    order = _column_order(columns, expected_columns)
+    if order == list(range(X.shape[1])):
+        return X
+    return np.take(X, order, axis=1)
+
+
+def decode_npy(buffer, expected_columns: list = None) -> np.ndarray:
+    """
+    Maps a `.npy` payload onto its bytes without copying.
+
+    The columns must already be in the expected order; the array keeps the dtype it was
+    written with.
+
+    Parameters:
+        buffer (bytes-like): The `.npy` file contents.
+        expected_columns (list): Feature order expected by the model, used to check the width.
+
+    Returns:
+        np.ndarray: A read-only 2-D view of the payload.
+
+    Raises:
+        ValueError: If the payload is not a valid 2-D numeric `.npy` array.
+    """
+    import io
+
+    # Only the header is copied; it is at most 64 KiB for format version 1.
+    header = io.BytesIO(bytes(memoryview(buffer)[: NPY_MAX_HEADER_SIZE]))
+    try:
+        version = np.lib.format.read_magic(header)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+    except Exception as e:
+        raise ValueError(f"Invalid .npy payload: {e}") from None
+
+    if dtype.hasobject or len(shape) != 2:
+        raise ValueError("The .npy payload must be a 2-D numeric array.")
+    if expected_columns is not None and shape[1] != len(expected_columns):
+        raise ValueError(f"Expected {len(expected_columns)} features, got {shape[1]}.")
+
+    count = shape[0] * shape[1]
+    offset = header.tell()
+    if len(buffer) - offset < count * dtype.itemsize:
+        raise ValueError("The .npy payload is truncated.")
+    X = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    if fortran_order:
+        return X.reshape(shape[::-1]).T
+    return X.reshape(shape)
+
+
+def decode_arrow_ipc(buffer, expected_columns: list, dtype=np.float32) -> np.ndarray:
+    """
+    Decodes an Arrow IPC stream into a feature array in the expected column order.
+
+    Parameters:
+        buffer (bytes-like): The Arrow IPC stream.
+        expected_columns (list): Feature order expected by the model.
+        dtype: The dtype of the returned array.
+
+    Returns:
+        np.ndarray: The feature data of shape (n_rows, len(expected_columns)).
+
+    Raises:
+        ValueError: If the stream lacks an expected column.
+    """
+    # pyarrow is optional; it is only needed by clients sending Arrow payloads.
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(buffer).read_all()
+    _column_order(table.column_names, expected_columns)
+
+    X = np.empty((table.num_rows, len(expected_columns)), dtype=dtype)
+    for index, column in enumerate(expected_columns):
+        X[:, index] = table.column(column).to_numpy()
+    return X
+
+
+def schema_id(columns: list) -> bytes:
+    """
+    Identifies an ordered feature list by the first 8 bytes of its SHA-256 digest.
+
+    Parameters:
+        columns (list): The ordered feature names.
+
+    Returns:
+        bytes: The 8-byte schema id.
+    """
+    return hashlib.sha256("\x1f".join(columns).encode()).digest()[:8]
+
+
+def encode_float32_rows(X, columns: list) -> bytes:
+    """
+    Encodes feature rows as little-endian float32 values behind a schema-id header.
+
+    Parameters:
+        X (array-like): The feature data of shape (n_samples, len(columns)), in `columns` order.
+        columns (list): The ordered feature names the rows follow.
+
+    Returns:
+        bytes: The encoded payload.
+    """
+    X = np.ascontiguousarray(X, dtype="<f4")
+    if X.ndim != 2 or X.shape[1] != len(columns):
+        raise ValueError(f"Expected rows of {len(columns)} features, got shape {X.shape}.")
+    header = FLOAT32_ROWS_HEADER.pack(FLOAT32_ROWS_MAGIC, schema_id(columns), X.shape[0], X.shape[1])
+    return header + X.tobytes()
+
+
+def decode_float32_rows(buffer, expected_columns: list) -> np.ndarray:
+    """
+    Maps a float32 rows payload onto its bytes without copying.
+
+    Parameters:
+        buffer (bytes-like): The encoded payload.
+        expected_columns (list): Feature order expected by the model.
+
+    Returns:
+        np.ndarray: A read-only float32 view of shape (n_rows, len(expected_columns)).
+
+    Raises:
+        ValueError: If the header is invalid or the rows follow a different schema.
+    """
+    if len(buffer) < FLOAT32_ROWS_HEADER.size:
+        raise ValueError("The float32 rows payload is truncated.")
+    magic, payload_schema, n_rows, n_features = FLOAT32_ROWS_HEADER.unpack_from(buffer)
+    if magic != FLOAT32_ROWS_MAGIC:
+        raise ValueError("Invalid float32 rows payload.")
+    if payload_schema != schema_id(expected_columns):
+        raise ValueError(
+            f"Schema id {payload_schema.hex()} does not match the model's "
+            f"{schema_id(expected_columns).hex()}."
+        )
+    if len(buffer) - FLOAT32_ROWS_HEADER.size != 4 * n_rows * n_features:
+        raise ValueError("The float32 rows payload length does not match its header.")
+    return np.frombuffer(
+        buffer, dtype="<f4", count=n_rows * n_features, offset=FLOAT32_ROWS_HEADER.size
+    ).reshape(n_rows, n_features)
+
+
+def decode_payload(
+    body, content_type: str = JSON_CONTENT_TYPE, expected_columns: list = None, dtype=np.float32
+) -> np.ndarray:
+    """
+    Decodes a request payload according to its content type.
+
+    JSON payloads may be `dataframe_records`, `dataframe_split` or bare `split`-orient data;
+    binary payloads may be `.npy`, Arrow IPC or float32 rows with a schema-id header.
+
+    Parameters:
+        body (bytes-like): The request body.
+        content_type (str): The content type of the body.
+        expected_columns (list): Feature order expected by the model.
+        dtype: The dtype of the returned array (JSON and Arrow payloads).
+
+    Returns:
+        np.ndarray: The feature data.
+
+    Raises:
+        ValueError: If the payload is invalid or the content type is not supported.
+    """
+    content_type = (content_type or JSON_CONTENT_TYPE).split(";")[0].strip().lower()
+
+    if content_type == JSON_CONTENT_TYPE:
+        try:
+            payload = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid JSON payload: {e}") from None
+        if not isinstance(payload, dict):
+            raise ValueError("The JSON payload must be an object.")
+        if "dataframe_records" in payload:
+            return decode_dataframe_records(payload, expected_columns, dtype)
+        if expected_columns is None:
+            raise ValueError("Split payloads need the model's expected columns.")
+        return decode_split_json(payload, expected_columns, dtype)
+    if content_type == NPY_CONTENT_TYPE:
+        return decode_npy(body, expected_columns)
+    if content_type == FLOAT32_ROWS_CONTENT_TYPE:
+        if expected_columns is None:
+            raise ValueError("Float32 rows payloads need the model's expected columns.")
+        return decode_float32_rows(body, expected_columns)
+    if content_type == ARROW_CONTENT_TYPE:
+        if expected_columns is None:
+            raise ValueError("Arrow payloads need the model's expected columns.")
+        return decode_arrow_ipc(body, expected_columns, dtype)
+    raise ValueError(f"Unsupported content type: {content_type}")
@@ -0,0 +1,249 @@
+import asyncio
+import json
+import logging
+import ssl
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from src.payload_decoding import (
+    EXPECTED_COLUMNS,
+    FLOAT32_ROWS_CONTENT_TYPE,
+    JSON_CONTENT_TYPE,
+    encode_float32_rows,
+)
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+def to_feature_array(rows, columns: list) -> np.ndarray:
+    """
+    Converts records, a DataFrame or an array into a float32 array in `columns` order.
+
+    Parameters:
+        rows (list, dict, pd.DataFrame or np.ndarray): The rows to score; arrays must
+            already follow `columns`.
+        columns (list): The ordered feature names.
+
+    Returns:
+        np.ndarray: The feature data of shape (n_samples, len(columns)).
+    """
+    if isinstance(rows, dict):
+        rows = [rows]
+    if isinstance(rows, list) and rows and isinstance(rows[0], dict):
+        return np.array([[row[column] for column in columns] for row in rows], dtype=np.float32)
+    if isinstance(rows, pd.DataFrame):
+        return rows[columns].to_numpy(dtype=np.float32)
+    return np.asarray(rows, dtype=np.float32).reshape(-1, len(columns))
+
+
+def encode_batch(X: np.ndarray, columns: list, binary: bool) -> tuple:
+    """
+    Encodes one batch either as float32 rows or as a `dataframe_split` JSON payload,
+    which names every feature once instead of once per record.
+
+    Returns:
+        tuple: The request body and its content type.
+    """
+    if binary:
+        return encode_float32_rows(X, columns), FLOAT32_ROWS_CONTENT_TYPE
+    body = json.dumps({"dataframe_split": {"columns": columns, "data": X.tolist()}})
+    return body.encode(), JSON_CONTENT_TYPE
+
+
+# Pooled synchronous client
+# -------------------------
+# Reuses keep-alive connections through one requests.Session and splits large inputs
+# into batches.
+class PredictionClient:
+    def __init__(
+        self,
+        url: str,
+        columns: list = None,
+        batch_size: int = 10_000,
+        binary: bool = False,
+        pool_size: int = 10,
+        timeout: float = 30.0,
+    ):
+        """
+        Initializes the PredictionClient with the scoring endpoint.
+
+        Parameters:
+            url (str): The `/invocations` URL of the prediction server.
+            columns (list): Feature order expected by the model. Defaults to EXPECTED_COLUMNS.
+            batch_size (int): Maximum number of rows per request.
+            binary (bool): Whether to send float32 rows instead of JSON; needs the local prediction server.
+            pool_size (int): Number of keep-alive connections kept open.
+            timeout (float): Timeout of every request, in seconds.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.url = url
+        self.columns = list(columns or EXPECTED_COLUMNS)
+        self.batch_size = batch_size
+        self.binary = binary
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def predict(self, rows) -> np.ndarray:
+        """
+        Scores rows in batches over the pooled connections.
+
+        Parameters:
+            rows (list, dict, pd.DataFrame or np.ndarray): The rows to score.
+
+        Returns:
+            np.ndarray: The predictions of all rows.
+
+        Raises:
+            requests.HTTPError: If the server rejects a batch.
+        """
+        X = to_feature_array(rows, self.columns)
+        predictions = []
+        for start in range(0, len(X), self.batch_size):
+            body, content_type = encode_batch(
+                X[start : start + self.batch_size], self.columns, self.binary
+            )
+            response = self.session.post(
+                self.url, data=body, headers={"Content-Type": content_type}, timeout=self.timeout
+            )
+            response.raise_for_status()
+            predictions.append(np.asarray(response.json()["predictions"]))
+        return np.concatenate(predictions) if predictions else np.empty(0)
+
+    def close(self):
+        """
+        Closes the pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Pooled asyncio client
+# ---------------------
+# Sends the batches of one call concurrently over a bounded pool of keep-alive connections.
+class AsyncPredictionClient:
+    def __init__(
+        self,
+        url: str,
+        columns: list = None,
+        batch_size: int = 1_000,
+        binary: bool = False,
+        max_connections: int = 8,
+        timeout: float = 30.0,
+    ):
+        """
+        Initializes the AsyncPredictionClient with the scoring endpoint.
+
+        Parameters:
+            url (str): The `/invocations` URL of the prediction server.
+            columns (list): Feature order expected by the model. Defaults to EXPECTED_COLUMNS.
+            batch_size (int): Maximum number of rows per request.
+            binary (bool): Whether to send float32 rows instead of JSON; needs the local prediction server.
+            max_connections (int): Maximum number of concurrent connections.
+            timeout (float): Timeout of every request, in seconds.
+        """
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.path = parts.path or "/"
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.columns = list(columns or EXPECTED_COLUMNS)
+        self.batch_size = batch_size
+        self.binary = binary
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._idle = []
+        self._semaphore = None
+
+    async def _request(self, body: bytes, content_type: str) -> dict:
+        """
+        Posts one body over an idle pooled connection, opening one if none is idle.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+
+        async with self._semaphore:
+            if self._idle:
+                reader, writer = self._idle.pop()
+            else:
+                reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+            try:
+                writer.write(
+                    f"POST {self.path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                    f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.timeout)
+            except Exception:
+                writer.close()
+                raise
+
+            status_line, *header_lines = head.decode("latin-1").split("\r\n")
+            status = int(status_line.split(" ")[1])
+            headers = {}
+            for line in header_lines:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+            response = await reader.readexactly(int(headers.get("content-length", 0)))
+
+            if headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self._idle.append((reader, writer))
+
+        if status != 200:
+            raise RuntimeError(f"Prediction request failed with {status}: {response.decode()}")
+        return json.loads(response)
+
+    async def predict(self, rows) -> np.ndarray:
+        """
+        Scores rows by sending their batches concurrently.
+
+        Parameters:
+            rows (list, dict, pd.DataFrame or np.ndarray): The rows to score.
+
+        Returns:
+            np.ndarray: The predictions of all rows, in input order.
+        """
+        X = to_feature_array(rows, self.columns)
+        responses = await asyncio.gather(
+            *[
+                self._request(
+                    *encode_batch(X[start : start + self.batch_size], self.columns, self.binary)
+                )
+                for start in range(0, len(X), self.batch_size)
+            ]
+        )
+        predictions = [np.asarray(response["predictions"]) for response in responses]
+        return np.concatenate(predictions) if predictions else np.empty(0)
+
+    async def close(self):
+        """
+        Closes the pooled connections.
+        """
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
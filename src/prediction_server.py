@@ -0,0 +1,808 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.caching import PredictionCache
+from src.data_modelling import predict_positive_scores
+from src.input_schema import CompiledSchema
+from src.model_explanation import ModelExplainer, explanation_strategy_for_pipeline
+from src.model_packaging import is_model_package, load_model_package
+from src.payload_decoding import decode_payload
+from src.serving_metrics import PROMETHEUS_CONTENT_TYPE, ServingMetrics
+from src.shadow_scoring import ShadowScorer
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+# Largest accepted request body, in bytes.
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+
+def load_pipeline(model_uri: str):
+    """
+    Loads a trained pipeline logged or registered with MLflow, or from a model package.
+
+    Parameters:
+        model_uri (str): The MLflow model URI, e.g. 'models:/ethereum_fraud_detection/latest',
+            or the path of a package saved with `save_model_package`, whose weights are
+            memory-mapped and shared by every process serving it.
+
+    Returns:
+        Pipeline: The trained model pipeline.
+    """
+    if os.path.isfile(model_uri) and is_model_package(model_uri):
+        return load_model_package(model_uri)
+
+    import mlflow.sklearn
+
+    logging.info(f"Loading the model from {model_uri}.")
+    return mlflow.sklearn.load_model(model_uri)
+
+
+# A loaded model version and the batches currently scored with it
+# ----------------------------------------------------------------
+# A version retired by a hot swap is released once its last in-flight batch has finished.
+class ServedModel:
+    def __init__(
+        self, model, transformer=None, version: str = None, explainer: ModelExplainer = None
+    ):
+        """
+        Initializes the ServedModel with a loaded model.
+
+        Parameters:
+            model: The trained model or pipeline.
+            transformer: Feature transformer applied before predicting, if the model expects it.
+            version (str): Version label of the model.
+            explainer (ModelExplainer): Explains the model's raw output per feature, if any.
+        """
+        self.model = model
+        self.transformer = transformer
+        self.version = version
+        self.explainer = explainer
+        self.in_flight = 0
+        self.retired = False
+
+    def predict(self, X: np.ndarray, metrics: ServingMetrics = None) -> np.ndarray:
+        """
+        Runs one vectorized prediction.
+
+        Parameters:
+            X (np.ndarray): The feature data.
+            metrics (ServingMetrics): Records the preprocessing and model time, if given.
+        """
+        if metrics is None:
+            if self.transformer is not None:
+                X = self.transformer.transform(X)
+            return np.asarray(self.model.predict(X))
+
+        start = time.perf_counter()
+        model = self.model
+        if self.transformer is not None:
+            X = self.transformer.transform(X)
+        elif len(getattr(model, "steps", ())) > 1:
+            # Time the pipeline's preprocessing steps apart from its final estimator.
+            X, model = model[:-1].transform(X), model[-1]
+        preprocessed = time.perf_counter()
+        predictions = np.asarray(model.predict(X))
+        metrics.observe_stages(
+            {"preprocess": preprocessed - start, "model": time.perf_counter() - preprocessed}
+        )
+        return predictions
+
+    def score(self, X: np.ndarray) -> np.ndarray:
+        """
+        Returns the fraud score of every row, rather than the served prediction.
+        """
+        if self.transformer is not None:
+            X = self.transformer.transform(X)
+        return np.asarray(predict_positive_scores(self.model, X), dtype=np.float64)
+
+    def preprocess(self, X: np.ndarray) -> np.ndarray:
+        """
+        Applies the transformer, or the pipeline's steps before its final estimator.
+        """
+        if self.transformer is not None:
+            return self.transformer.transform(X)
+        if len(getattr(self.model, "steps", ())) > 1:
+            return self.model[:-1].transform(X)
+        return X
+
+    def explain(self, X: np.ndarray) -> np.ndarray:
+        """
+        Returns the SHAP values of every row, on the features the final estimator sees.
+        """
+        return self.explainer.explain(self.preprocess(X))
+
+    def stats(self) -> dict:
+        """
+        Returns the `stats()` of the model (or of its pipeline's final estimator), e.g. the
+        per-stage hit rates of a cascade, or None if it keeps no statistics.
+        """
+        model = self.model
+        if len(getattr(model, "steps", ())) > 0:
+            model = model[-1]
+        stats = getattr(model, "stats", None)
+        return stats() if callable(stats) else None
+
+    def release(self):
+        """
+        Drops the references to the model so that its memory can be reclaimed.
+        """
+        logging.info(f"Released model version {self.version}.")
+        self.model = self.transformer = self.explainer = None
+
+
+# Micro-batching of concurrent predictions
+# ----------------------------------------
+# Requests are queued and scored together once the batch is full or the oldest request
+# has waited `max_wait_ms`, so single-row traffic still benefits from vectorized prediction.
+class MicroBatcher:
+    def __init__(
+        self,
+        predict_fn,
+        max_batch_size: int = 256,
+        max_wait_ms: float = 2.0,
+        metrics: ServingMetrics = None,
+    ):
+        """
+        Initializes the MicroBatcher with the batch prediction function and its limits.
+
+        Parameters:
+            predict_fn (callable): Maps a (n_samples, n_features) array to n_samples predictions.
+            max_batch_size (int): Maximum number of rows scored at once.
+            max_wait_ms (float): Longest time a request waits for others to join its batch.
+            metrics (ServingMetrics): Records the batch sizes and queue waits, if given.
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.metrics = metrics
+        self._queue = None
+        self._task = None
+        # One scoring thread keeps the event loop responsive while a batch is predicted.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def start(self):
+        """
+        Starts the batching loop on the running event loop.
+        """
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stops the batching loop and the scoring thread.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=True)
+
+    async def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Queues rows for the next batch and waits for their predictions.
+
+        Parameters:
+            X (np.ndarray): The feature data of one request.
+
+        Returns:
+            np.ndarray: The predictions of the request's rows.
+        """
+        future = asyncio.get_running_loop().create_future()
+        future.queued_at = time.perf_counter()
+        await self._queue.put((X, future))
+        return await future
+
+    async def _collect_batch(self) -> list:
+        """
+        Waits for a first request, then gathers more until the batch is full or the wait expires.
+        """
+        loop = asyncio.get_running_loop()
+        items = [await self._queue.get()]
+        n_rows = len(items[0][0])
+        deadline = loop.time() + self.max_wait
+
+        while n_rows < self.max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+            items.append(item)
+            n_rows += len(item[0])
+        return items
+
+    async def _run(self):
+        """
+        Scores batches one after another; new requests queue up while a batch is predicted.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            items = await self._collect_batch()
+            batch = np.concatenate([X for X, _ in items]) if len(items) > 1 else items[0][0]
+            if self.metrics is not None:
+                now = time.perf_counter()
+                self.metrics.observe_batch(
+                    len(batch), [now - future.queued_at for _, future in items]
+                )
+
+            try:
+                predictions = await loop.run_in_executor(self._executor, self.predict_fn, batch)
+            except Exception as e:
+                logging.error(f"Batch prediction failed: {e}")
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offsets = np.cumsum([len(X) for X, _ in items])[:-1]
+            for (_, future), result in zip(items, np.split(np.asarray(predictions), offsets)):
+                if not future.done():
+                    future.set_result(result)
+
+
+# Asyncio HTTP prediction server
+# ------------------------------
+# A minimal HTTP/1.1 server with keep-alive that speaks MLflow's `/invocations` protocol
+# and swaps model versions without downtime on `/swap`. A candidate model can score the
+# same traffic in the background, reported on `/shadow`; per-stage latency histograms are
+# exported for Prometheus on `/metrics`, and rows are explained with SHAP on `/explain`.
+class PredictionServer:
+    def __init__(
+        self,
+        model,
+        columns: list = None,
+        transformer=None,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_batch_size: int = 256,
+        max_wait_ms: float = 2.0,
+        cache: PredictionCache = None,
+        model_version: str = None,
+        replay_size: int = 256,
+        model_loader=load_pipeline,
+        shadow: ShadowScorer = None,
+        schema: CompiledSchema = None,
+        metrics: ServingMetrics = None,
+        explanation_background=None,
+    ):
+        """
+        Initializes the PredictionServer with a trained model loaded once.
+
+        Parameters:
+            model: The trained model or pipeline.
+            columns (list): Feature order expected by the model. Defaults to the schema's
+                columns, then to the model's `feature_names_in_`, then to the key order of
+                each request's records.
+            transformer: Feature transformer applied before predicting, if the model expects it.
+            host (str): Interface to listen on.
+            port (int): Port to listen on.
+            max_batch_size (int): Maximum number of rows scored at once.
+            max_wait_ms (float): Longest time a request waits for others to join its batch.
+            cache (PredictionCache): Cache of row predictions in front of the model, if any.
+            model_version (str): Version label of the served model.
+            replay_size (int): Number of recent requests replayed to warm up a new model
+                version before it is swapped in.
+            model_loader (callable): Loads a model from its URI for hot swaps.
+            shadow (ShadowScorer): Scores a mirrored copy of every request with a candidate
+                model and the active model in the background, if any.
+            schema (CompiledSchema): Input schema every row is validated against; invalid
+                rows get an error code instead of a prediction.
+            metrics (ServingMetrics): Per-stage latency, batch size and queue wait metrics
+                served on `/metrics`, if any.
+            explanation_background (array-like): Raw feature rows the SHAP values of the
+                network are computed against; `/explain` is enabled when they are given.
+        """
+        self._active = ServedModel(model, transformer, model_version)
+        self._swap_lock = threading.Lock()
+        self._swapping = False
+        self.replay = deque(maxlen=replay_size)
+        self.model_loader = model_loader
+        self.cache = cache
+        if cache is not None:
+            cache.set_model_version(model_version)
+        self.shadow = shadow
+        if shadow is not None:
+            shadow.attach(self.score_batch, transformer)
+        self.schema = schema
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.model_version = model_version
+        if columns is None and schema is not None:
+            columns = schema.columns
+        if columns is None:
+            columns = getattr(model, "feature_names_in_", None)
+        self.columns = list(columns) if columns is not None else None
+        self.explanation_background = self._explanation_rows(explanation_background)
+        self._active.explainer = self._build_explainer(self._active)
+        # One thread explains at a time; the explainer's row cache is not thread-safe.
+        self._explain_executor = ThreadPoolExecutor(max_workers=1)
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(self.predict_batch, max_batch_size, max_wait_ms, metrics)
+        self.routes = {
+            ("POST", "/invocations"): self.handle_invocations,
+            ("GET", "/health"): self.handle_health,
+            ("POST", "/swap"): self.handle_swap,
+            ("GET", "/shadow"): self.handle_shadow,
+            ("GET", "/metrics"): self.handle_metrics,
+            ("POST", "/explain"): self.handle_explain,
+        }
+        self._server = None
+        self._writers = set()
+
+    @property
+    def model(self):
+        return self._active.model
+
+    @property
+    def transformer(self):
+        return self._active.transformer
+
+    @property
+    def model_version(self) -> str:
+        return self._active.version
+
+    def _acquire(self) -> ServedModel:
+        """
+        Pins the active model version for one batch.
+        """
+        with self._swap_lock:
+            served = self._active
+            served.in_flight += 1
+        return served
+
+    def _release(self, served: ServedModel):
+        """
+        Unpins a model version and releases it if it was retired and this was its last batch.
+        """
+        with self._swap_lock:
+            served.in_flight -= 1
+            release = served.retired and served.in_flight == 0
+        if release:
+            served.release()
+
+    def predict_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Runs one vectorized prediction over a micro-batch with the active model version,
+        which stays loaded until the batch has finished even if a swap happens meanwhile.
+        """
+        served = self._acquire()
+        try:
+            return served.predict(X, self.metrics)
+        finally:
+            self._release(served)
+
+    def score_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Returns the active model version's fraud score of every row, for shadow comparisons.
+        """
+        served = self._acquire()
+        try:
+            return served.score(X)
+        finally:
+            self._release(served)
+
+    def _explanation_rows(self, background) -> np.ndarray:
+        """
+        Puts the explanation background in the model's column order and keeps its valid rows.
+        """
+        if background is None:
+            return None
+        if hasattr(background, "columns") and self.columns is not None:
+            background = background[self.columns]
+        background = np.asarray(background, dtype=np.float32)
+        if self.schema is not None:
+            background = background[self.schema.validate(background) == 0]
+        return background
+
+    def _build_explainer(self, served: ServedModel) -> ModelExplainer:
+        """
+        Builds the explainer of a model version, or None if explanations are disabled or
+        the model cannot be explained.
+        """
+        if self.explanation_background is None:
+            return None
+        try:
+            strategy = explanation_strategy_for_pipeline(
+                served.model, pd.DataFrame(served.preprocess(self.explanation_background))
+            )
+        except (AttributeError, KeyError, ValueError) as e:
+            logging.warning(f"Explanations are disabled for model version {served.version}: {e}")
+            return None
+        return ModelExplainer(strategy)
+
+    def _load_and_warm(self, model_uri: str, model, transformer, version: str) -> ServedModel:
+        """
+        Loads a new model version and warms it up by replaying recent requests.
+        """
+        start = time.perf_counter()
+        if model is None:
+            model = self.model_loader(model_uri)
+        candidate = ServedModel(model, transformer, version)
+
+        columns = getattr(model, "feature_names_in_", None)
+        if columns is not None and self.columns is not None and list(columns) != self.columns:
+            raise ValueError("The new model version expects different feature columns.")
+
+        replay = list(self.replay)
+        if replay:
+            X = np.concatenate(replay)
+            for index in range(0, len(X), self.batcher.max_batch_size):
+                candidate.predict(X[index : index + self.batcher.max_batch_size])
+        candidate.explainer = self._build_explainer(candidate)
+        logging.info(
+            f"Loaded model version {version} and replayed {len(replay)} requests "
+            f"in {time.perf_counter() - start:.2f}s."
+        )
+        return candidate
+
+    async def swap_model(
+        self, model_uri: str = None, model_version: str = None, model=None, transformer=None
+    ) -> str:
+        """
+        Loads a new model version in the background, warms it up with a replay of recent
+        requests and then makes it the active version. Batches already being scored finish
+        on the old version, which is released after the last of them.
+
+        Parameters:
+            model_uri (str): URI of the new model, loaded with `model_loader`.
+            model_version (str): Version label of the new model. Defaults to the URI.
+            model: An already loaded model to swap in instead of loading `model_uri`.
+            transformer: Feature transformer of the new model. Defaults to the active
+                version's, as every version is trained on the same transformed features.
+
+        Returns:
+            str: The version label of the new active model.
+
+        Raises:
+            RuntimeError: If another swap is in progress.
+        """
+        if self._swapping:
+            raise RuntimeError("A model swap is already in progress.")
+        self._swapping = True
+        try:
+            version = model_version or model_uri
+            if transformer is None:
+                transformer = self.transformer
+            # Loading runs outside the scoring thread, so requests keep being served.
+            candidate = await asyncio.get_running_loop().run_in_executor(
+                None, self._load_and_warm, model_uri, model, transformer, version
+            )
+            with self._swap_lock:
+                previous, self._active = self._active, candidate
+                previous.retired = True
+                release = previous.in_flight == 0
+            if self.cache is not None:
+                # A swap may reuse the label of the previous version, so always invalidate.
+                self.cache.reset(version)
+            if self.metrics is not None:
+                self.metrics.model_version = version
+            if release:
+                previous.release()
+            logging.info(f"Swapped model version {previous.version} for {version}.")
+            return version
+        finally:
+            self._swapping = False
+
+    async def handle_invocations(self, headers: dict, body: bytes) -> tuple:
+        """
+        Scores a `dataframe_records`, `dataframe_split`, `.npy` or Arrow IPC payload.
+
+        Returns:
+            tuple: The status code and the JSON response.
+        """
+        start = time.perf_counter()
+        try:
+            X = decode_payload(body, headers.get("content-type"), self.columns)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        decoded = time.perf_counter()
+
+        if len(X) == 0:
+            return 200, {"predictions": []}
+
+        codes = self.schema.validate(X) if self.schema is not None else None
+        if self.metrics is not None:
+            stages = {"decode": decoded - start}
+            if codes is not None:
+                stages["validate"] = time.perf_counter() - decoded
+            self.metrics.observe_stages(stages)
+
+        if codes is not None:
+            if codes.any():
+                return 200, await self._predict_valid_rows(X, codes)
+
+        predictions = await self.predict(X)
+        if self.shadow is not None:
+            # Never blocks: the mirrored copy is dropped if the shadow queue is full.
+            self.shadow.submit(X)
+        return 200, {"predictions": predictions.tolist()}
+
+    async def _predict_valid_rows(self, X: np.ndarray, codes: np.ndarray) -> dict:
+        """
+        Scores the valid rows of a batch and reports an error for each of the others.
+
+        Returns:
+            dict: 'predictions' with null for every invalid row, and their 'errors'.
+        """
+        valid = np.flatnonzero(codes == 0)
+        predictions = [None] * len(X)
+        if len(valid):
+            scored = await self.predict(X[valid])
+            if self.shadow is not None:
+                self.shadow.submit(X[valid])
+            for row, prediction in zip(valid, scored.tolist()):
+                predictions[row] = prediction
+        return {"predictions": predictions, "errors": self.schema.row_errors(codes)}
+
+    async def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predicts a request's rows, sending only the rows missing from the cache to the model.
+        """
+        self.replay.append(X)
+        if self.cache is None:
+            return await self.batcher.predict(X)
+
+        active = self._active
+        keys, cached, missing = self.cache.lookup(X)
+        if not missing:
+            return np.stack(cached)
+
+        scored = await self.batcher.predict(X[missing] if len(missing) < len(X) else X)
+        # Predictions of a version swapped out meanwhile must not enter the new version's cache.
+        if self._active is active:
+            self.cache.store([keys[index] for index in missing], scored)
+        for index, prediction in zip(missing, scored):
+            cached[index] = prediction
+        return np.stack(cached)
+
+    async def handle_explain(self, headers: dict, body: bytes) -> tuple:
+        """
+        Explains the rows of an `/invocations` payload with the active model version.
+
+        Returns:
+            tuple: The status code and the JSON response, with the SHAP values of every
+                row (null for invalid rows, reported in 'errors'), the expected value they
+                add up from and the feature columns.
+        """
+        try:
+            X = decode_payload(body, headers.get("content-type"), self.columns)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+
+        codes = self.schema.validate(X) if self.schema is not None else None
+        valid = np.flatnonzero(codes == 0) if codes is not None else np.arange(len(X))
+        shap_values = [None] * len(X)
+
+        served = self._acquire()
+        try:
+            if served.explainer is None:
+                return 404, {"error": "Explanations are not enabled for this model."}
+            expected_value = served.explainer.expected_value
+            if len(valid):
+                # Explaining is far slower than scoring, so it runs off the event loop.
+                explained = await asyncio.get_running_loop().run_in_executor(
+                    self._explain_executor, served.explain, X[valid]
+                )
+                for row, values in zip(valid, explained.tolist()):
+                    shap_values[row] = values
+        finally:
+            self._release(served)
+
+        response = {
+            "model_version": served.version,
+            "expected_value": expected_value,
+            "columns": self.columns,
+            "shap_values": shap_values,
+        }
+        if codes is not None and codes.any():
+            response["errors"] = self.schema.row_errors(codes)
+        return 200, response
+
+    async def handle_health(self, headers: dict, body: bytes) -> tuple:
+        """
+        Reports that the model is loaded and the server accepts requests.
+        """
+        health = {
+            "status": "ok",
+            "model_version": self.model_version,
+            "swapping": self._swapping,
+        }
+        if self.cache is not None:
+            health["cache"] = self.cache.stats()
+        model_stats = self._active.stats()
+        if model_stats is not None:
+            health["model_stats"] = model_stats
+        if self.shadow is not None:
+            health["shadow_model_version"] = self.shadow.model_version
+        return 200, health
+
+    async def handle_metrics(self, headers: dict, body: bytes) -> tuple:
+        """
+        Exports the serving metrics in the Prometheus text format.
+        """
+        if self.metrics is None:
+            return 404, {"error": "Metrics are not enabled."}
+        cache_stats = self.cache.stats() if self.cache is not None else None
+        return 200, self.metrics.render(cache_stats)
+
+    async def handle_shadow(self, headers: dict, body: bytes) -> tuple:
+        """
+        Reports how the shadow candidate's scores compare with the production model's.
+        """
+        if self.shadow is None:
+            return 404, {"error": "No shadow model is configured."}
+        return 200, self.shadow.stats()
+
+    async def handle_swap(self, headers: dict, body: bytes) -> tuple:
+        """
+        Hot-swaps the model to the `model_uri` (and optional `model_version`) of a JSON body.
+
+        Returns:
+            tuple: The status code and the JSON response.
+        """
+        try:
+            request = json.loads(body)
+            model_uri = request["model_uri"]
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": "Expected a JSON body with a 'model_uri'."}
+
+        try:
+            version = await self.swap_model(model_uri, request.get("model_version"))
+        except RuntimeError as e:
+            return 409, {"error": str(e)}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        return 200, {"model_version": version}
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """
+        Reads one HTTP request; returns None when the client closed the connection.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        method, path, _ = request_line.split(" ", 2)
+        headers = {}
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY_SIZE:
+            return method, path.split("?", 1)[0], headers, None
+        body = await reader.readexactly(length) if length else b""
+        return method, path.split("?", 1)[0], headers, body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serves the requests of one keep-alive connection in order.
+        """
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                received = time.perf_counter()
+
+                if body is None:
+                    status, response = 413, {"error": "Request body too large."}
+                elif (method, path) in self.routes:
+                    try:
+                        status, response = await self.routes[(method, path)](headers, body)
+                    except Exception as e:
+                        logging.error(f"Error while handling {method} {path}: {e}")
+                        status, response = 500, {"error": str(e)}
+                elif any(route_path == path for _, route_path in self.routes):
+                    status, response = 405, {"error": f"{method} is not allowed on {path}."}
+                else:
+                    status, response = 404, {"error": f"Unknown path {path}."}
+
+                keep_alive = headers.get("connection", "").lower() != "close" and body is not None
+                if isinstance(response, str):
+                    content_type, payload = PROMETHEUS_CONTENT_TYPE, response.encode()
+                else:
+                    encode_start = time.perf_counter()
+                    content_type, payload = "application/json", json.dumps(response).encode()
+                    if self.metrics is not None and path == "/invocations":
+                        encoded = time.perf_counter()
+                        self.metrics.observe_stage("encode", encoded - encode_start)
+                        self.metrics.observe_request(status, encoded - received)
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def start(self):
+        """
+        Starts the batching loop and begins accepting connections.
+        """
+        await self.batcher.start()
+        if self.shadow is not None:
+            self.shadow.start()
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        # Reflect the actual port when an ephemeral port (0) was requested.
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info(f"Prediction server listening on http://{self.host}:{self.port}/invocations")
+
+    async def stop(self):
+        """
+        Stops accepting connections and shuts the batching loop down.
+        """
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections end their handlers with an incomplete read.
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+        self._explain_executor.shutdown(wait=True)
+        if self.shadow is not None:
+            self.shadow.stop()
+            logging.info(f"Shadow report: {self.shadow.stats()}")
+
+    async def serve_forever(self):
+        """
+        Starts the server and serves until cancelled.
+        """
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def run(self):
+        """
+        Serves in a new event loop until interrupted.
+        """
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            logging.info("Prediction server stopped.")
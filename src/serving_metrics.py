@@ -0,0 +1,276 @@
+import threading
+from collections import deque
+
+import numpy as np
+
+# Upper bounds of the latency buckets, in seconds (50us to 10s).
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 10.0,
+)
+# Upper bounds of the batch size buckets, in rows.
+BATCH_SIZE_BUCKETS = tuple(2**power for power in range(0, 18))
+
+# Content type of the Prometheus text exposition format.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prefix of every exported metric name.
+METRIC_PREFIX = "fraud_serving"
+
+# Number of pending values of one series that triggers folding them into its histogram.
+FOLD_SIZE = 4096
+
+# Metric families of the observed values.
+STAGE_SECONDS = "stage_seconds"
+BATCH_ROWS = "batch_rows"
+QUEUE_WAIT_SECONDS = "queue_wait_seconds"
+REQUESTS = "requests"
+
+FAMILY_BUCKETS = {
+    STAGE_SECONDS: LATENCY_BUCKETS,
+    BATCH_ROWS: BATCH_SIZE_BUCKETS,
+    QUEUE_WAIT_SECONDS: LATENCY_BUCKETS,
+}
+
+
+def _labels(**labels) -> str:
+    """
+    Formats Prometheus labels, skipping those without a value.
+    """
+    pairs = []
+    for name, value in labels.items():
+        if value is not None:
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+            pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        """
+        Initializes the Histogram with fixed bucket upper bounds.
+
+        Parameters:
+            buckets (tuple): Increasing upper bounds; larger values fall into a +Inf bucket.
+        """
+        self.buckets = buckets
+        self._bounds = np.asarray(buckets, dtype=np.float64)
+        self.counts = np.zeros(len(buckets) + 1, dtype=np.int64)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe_many(self, values: np.ndarray):
+        """
+        Records a batch of values; a value equal to a bound falls into that bound's bucket.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self.counts += np.bincount(
+            np.searchsorted(self._bounds, values, side="left"), minlength=len(self.counts)
+        )
+        self.sum += float(values.sum())
+        self.count += len(values)
+
+    def merge(self, other: "Histogram"):
+        """
+        Adds the counts of a histogram with the same buckets.
+        """
+        self.counts += other.counts
+        self.sum += other.sum
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the upper bound of the bucket holding the q-quantile.
+        """
+        if not self.count:
+            return 0.0
+        index = int(np.searchsorted(np.cumsum(self.counts), q * self.count))
+        return self.buckets[index] if index < len(self.buckets) else float("inf")
+
+
+# Serving metrics
+# ---------------
+# Per-stage latency, batch size and queue wait histograms and request counters, labelled
+# with the model version that served them. Observing only appends to a list per series,
+# which is folded into its histogram with one vectorized update once it is long or when
+# the metrics are read, so the request path never takes a lock. Exported in the
+# Prometheus text format for servers and as a flat summary for MLflow in batch jobs.
+class ServingMetrics:
+    def __init__(self, model_version: str = None):
+        """
+        Initializes the ServingMetrics.
+
+        Parameters:
+            model_version (str): Version label of the served model; update it on a swap.
+        """
+        self.model_version = model_version
+        self._histograms = {}
+        self._requests = {}
+        # Values observed but not folded yet, per (family, stage or status, version).
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _append(self, key: tuple, value: float):
+        values = self._pending.get(key)
+        if values is None:
+            values = self._pending.setdefault(key, [])
+        # Appending to a list is atomic, so any thread may observe.
+        values.append(value)
+        if len(values) >= FOLD_SIZE:
+            self._fold()
+
+    def observe_stage(self, stage: str, seconds: float):
+        """
+        Records the time spent in one stage of the prediction path.
+
+        Parameters:
+            stage (str): The stage, e.g. 'decode', 'validate', 'preprocess', 'model' or 'encode'.
+            seconds (float): The time spent, in seconds.
+        """
+        self._append((STAGE_SECONDS, stage, self.model_version), seconds)
+
+    def observe_stages(self, stages: dict):
+        """
+        Records the seconds spent in several stages of the prediction path.
+        """
+        version = self.model_version
+        for stage, seconds in stages.items():
+            self._append((STAGE_SECONDS, stage, version), seconds)
+
+    def observe_request(self, status: int, seconds: float):
+        """
+        Counts one answered request by HTTP status and records its total time.
+        """
+        self._append((REQUESTS, status, self.model_version), seconds)
+
+    def observe_batch(self, n_rows: int, queue_waits: list = ()):
+        """
+        Records the size of a scored batch and how long its requests queued for it.
+
+        Parameters:
+            n_rows (int): Number of rows in the batch.
+            queue_waits (list): Time every request of the batch waited in the queue, in seconds.
+        """
+        version = self.model_version
+        self._append((BATCH_ROWS, None, version), n_rows)
+        for seconds in queue_waits:
+            self._append((QUEUE_WAIT_SECONDS, None, version), seconds)
+
+    def _fold(self):
+        """
+        Moves the pending values into the histograms and counters.
+        """
+        with self._lock:
+            for key, values in list(self._pending.items()):
+                # Slicing and deleting are atomic, so values appended meanwhile are kept.
+                n_values = len(values)
+                if not n_values:
+                    continue
+                batch = values[:n_values]
+                del values[:n_values]
+
+                family, label, version = key
+                if family == REQUESTS:
+                    self._requests[(label, version)] = (
+                        self._requests.get((label, version), 0) + n_values
+                    )
+                    # The request times of all statuses share the 'request' stage histogram.
+                    key = (STAGE_SECONDS, "request", version)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram(FAMILY_BUCKETS[key[0]])
+                histogram.observe_many(batch)
+
+    def _render_histogram(self, lines: list, name: str, histogram: Histogram, **labels):
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+    def render(self, cache_stats: dict = None) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Parameters:
+            cache_stats (dict): The prediction cache's `stats()`, if a cache is used.
+
+        Returns:
+            str: The exposition text.
+        """
+        self._fold()
+        prefix = METRIC_PREFIX
+        lines = [
+            f"# HELP {prefix}_model_info Version of the model currently served.",
+            f"# TYPE {prefix}_model_info gauge",
+            f"{prefix}_model_info{_labels(model_version=self.model_version)} 1",
+        ]
+        with self._lock:
+            for family, description in (
+                (STAGE_SECONDS, "Time spent per stage of the prediction path."),
+                (BATCH_ROWS, "Rows per scored batch."),
+                (QUEUE_WAIT_SECONDS, "Time requests wait for their batch."),
+            ):
+                name = f"{prefix}_{family}"
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+                for (histogram_family, stage, version), histogram in sorted(
+                    self._histograms.items(), key=str
+                ):
+                    if histogram_family == family:
+                        self._render_histogram(
+                            lines, name, histogram, stage=stage, model_version=version
+                        )
+
+            lines += [
+                f"# HELP {prefix}_requests_total Answered requests by HTTP status.",
+                f"# TYPE {prefix}_requests_total counter",
+            ]
+            for (status, version), count in sorted(self._requests.items(), key=str):
+                lines.append(
+                    f"{prefix}_requests_total{_labels(status=status, model_version=version)} {count}"
+                )
+
+        if cache_stats is not None:
+            labels = _labels(model_version=self.model_version)
+            for name, kind in (
+                ("hits", "counter"),
+                ("misses", "counter"),
+                ("evictions", "counter"),
+                ("expirations", "counter"),
+                ("hit_rate", "gauge"),
+            ):
+                suffix = f"{name}_total" if kind == "counter" else name
+                lines += [
+                    f"# TYPE {prefix}_cache_{suffix} {kind}",
+                    f"{prefix}_cache_{suffix}{labels} {cache_stats[name]}",
+                ]
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict:
+        """
+        Summarizes the metrics as flat numbers, e.g. for MLflow.
+
+        Returns:
+            dict: Mean and p95 milliseconds of every stage and of the queue wait, and mean
+                and p95 rows per batch, over all model versions.
+        """
+        self._fold()
+        merged = {}
+        with self._lock:
+            for (family, stage, _), histogram in self._histograms.items():
+                name = f"stage_{stage}" if family == STAGE_SECONDS else family
+                if name not in merged:
+                    merged[name] = (Histogram(histogram.buckets), family)
+                merged[name][0].merge(histogram)
+
+        summary = {}
+        for name, (histogram, family) in sorted(merged.items()):
+            if family == BATCH_ROWS:
+                summary[f"{name}_mean"] = histogram.sum / histogram.count
+                summary[f"{name}_p95"] = float(histogram.quantile(0.95))
+            else:
+                name = name.replace("_seconds", "")
+                summary[f"{name}_mean_ms"] = 1e3 * histogram.sum / histogram.count
+                summary[f"{name}_p95_ms"] = 1e3 * histogram.quantile(0.95)
+        return summary
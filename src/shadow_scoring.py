@@ -0,0 +1,258 @@
+import logging
+import queue
+import threading
+
+import numpy as np
+
+from src.data_modelling import predict_positive_scores
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+# Marks the end of the shadow queue.
+_STOP = None
+
+
+# Streaming comparison of two models
+# ----------------------------------
+# Counts flag agreement and keeps a fixed-size histogram of absolute score deltas, so the
+# report costs the same memory after a million rows as after ten.
+class ShadowReport:
+    def __init__(self, threshold: float = 0.5, n_bins: int = 1000, max_delta: float = 1.0):
+        """
+        Initializes the ShadowReport.
+
+        Parameters:
+            threshold (float): Decision threshold both models are flagged at.
+            n_bins (int): Number of bins of the absolute score delta histogram.
+            max_delta (float): Upper edge of the histogram; larger deltas go into the last bin.
+        """
+        self.threshold = threshold
+        self.edges = np.linspace(0.0, max_delta, n_bins + 1)
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all counts.
+        """
+        self.rows = 0
+        self.agreements = 0
+        self.primary_flags = 0
+        self.candidate_flags = 0
+        self.delta_sum = 0.0
+        self.abs_delta_sum = 0.0
+        self.max_abs_delta = 0.0
+        self.histogram = np.zeros(len(self.edges) - 1, dtype=np.int64)
+
+    def update(self, primary: np.ndarray, candidate: np.ndarray):
+        """
+        Adds the scores of both models for one batch of rows.
+
+        Parameters:
+            primary (np.ndarray): Scores of the production model.
+            candidate (np.ndarray): Scores of the candidate model.
+        """
+        primary_flags = primary >= self.threshold
+        candidate_flags = candidate >= self.threshold
+        delta = candidate - primary
+        abs_delta = np.abs(delta)
+
+        self.rows += len(primary)
+        self.agreements += int(np.count_nonzero(primary_flags == candidate_flags))
+        self.primary_flags += int(np.count_nonzero(primary_flags))
+        self.candidate_flags += int(np.count_nonzero(candidate_flags))
+        self.delta_sum += float(delta.sum())
+        self.abs_delta_sum += float(abs_delta.sum())
+        if len(abs_delta):
+            self.max_abs_delta = max(self.max_abs_delta, float(abs_delta.max()))
+        bins = np.searchsorted(self.edges, abs_delta, side="right") - 1
+        self.histogram += np.bincount(
+            np.clip(bins, 0, len(self.histogram) - 1), minlength=len(self.histogram)
+        )
+
+    def _delta_quantile(self, q: float) -> float:
+        """
+        Returns the upper bin edge below which a fraction `q` of the absolute deltas lie.
+        """
+        index = int(np.searchsorted(np.cumsum(self.histogram), q * self.rows))
+        return float(self.edges[min(index + 1, len(self.edges) - 1)])
+
+    def report(self) -> dict:
+        """
+        Summarizes the comparison so far.
+
+        Returns:
+            dict: Row count, flag agreement and flag rates, and mean, quantiles and maximum
+                of the score delta (candidate minus production).
+        """
+        rows = max(self.rows, 1)
+        return {
+            "rows": self.rows,
+            "agreement_rate": self.agreements / rows,
+            "primary_flag_rate": self.primary_flags / rows,
+            "candidate_flag_rate": self.candidate_flags / rows,
+            "mean_delta": self.delta_sum / rows,
+            "mean_abs_delta": self.abs_delta_sum / rows,
+            "p50_abs_delta": self._delta_quantile(0.50) if self.rows else 0.0,
+            "p95_abs_delta": self._delta_quantile(0.95) if self.rows else 0.0,
+            "p99_abs_delta": self._delta_quantile(0.99) if self.rows else 0.0,
+            "max_abs_delta": self.max_abs_delta,
+        }
+
+
+# Shadow scoring of a candidate model
+# -----------------------------------
+# The serving path only enqueues a mirrored copy of each request without waiting; a
+# background thread scores the queue in batches with both the production model and the
+# candidate, comparing fraud scores rather than served labels. When the queue is full the
+# copy is dropped, so the candidate can never slow production traffic down.
+class ShadowScorer:
+    def __init__(
+        self,
+        model,
+        transformer=None,
+        threshold: float = 0.5,
+        max_queue_size: int = 1024,
+        max_batch_size: int = 4096,
+        model_version: str = None,
+    ):
+        """
+        Initializes the ShadowScorer with the candidate model.
+
+        Parameters:
+            model: The candidate model or pipeline, with `predict_proba` or `predict`.
+            transformer: Feature transformer of the candidate. Defaults to the production
+                model's transformer once attached to a server.
+            threshold (float): Decision threshold of the agreement report.
+            max_queue_size (int): Maximum number of mirrored requests waiting to be scored.
+            max_batch_size (int): Maximum number of rows the candidate scores at once.
+            model_version (str): Version label of the candidate.
+        """
+        self.model = model
+        self.transformer = transformer
+        self.primary_score_fn = None
+        self.max_batch_size = max_batch_size
+        self.model_version = model_version
+        self.report = ShadowReport(threshold)
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self.dropped_requests = 0
+        self.failed_batches = 0
+
+    def attach(self, primary_score_fn, transformer=None):
+        """
+        Connects the shadow to the production model it is compared with.
+
+        Parameters:
+            primary_score_fn (callable): Maps a (n_samples, n_features) array to the
+                production model's fraud score of every row.
+            transformer: The production model's feature transformer, also used for the
+                candidate unless it was given its own.
+        """
+        self.primary_score_fn = primary_score_fn
+        if self.transformer is None:
+            self.transformer = transformer
+
+    def score(self, X: np.ndarray) -> np.ndarray:
+        """
+        Returns the candidate's fraud score of every row.
+        """
+        if self.transformer is not None:
+            X = self.transformer.transform(X)
+        return np.asarray(predict_positive_scores(self.model, X), dtype=np.float64)
+
+    def start(self):
+        """
+        Starts the background scoring thread.
+
+        Raises:
+            RuntimeError: If no production model is attached.
+        """
+        if self.primary_score_fn is None:
+            raise RuntimeError("Attach the production model before starting the shadow.")
+        self._thread = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Scores what is already queued and stops the background thread.
+        """
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, X: np.ndarray) -> bool:
+        """
+        Mirrors one request to the shadow without blocking.
+
+        Parameters:
+            X (np.ndarray): The request's feature data, as given to the production model.
+
+        Returns:
+            bool: Whether the request was queued; it is dropped when the queue is full.
+        """
+        try:
+            self._queue.put_nowait(X)
+            return True
+        except queue.Full:
+            self.dropped_requests += 1
+            return False
+
+    def _collect_batch(self) -> tuple:
+        """
+        Waits for one mirrored request, then drains more until the batch is full.
+        """
+        items = [self._queue.get()]
+        if items[0] is _STOP:
+            return [], True
+        n_rows = len(items[0])
+        while n_rows < self.max_batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return items, True
+            items.append(item)
+            n_rows += len(item)
+        return items, False
+
+    def _run(self):
+        """
+        Scores mirrored requests in batches and feeds the report until stopped.
+        """
+        stopping = False
+        while not stopping:
+            items, stopping = self._collect_batch()
+            if not items:
+                continue
+            X = np.concatenate(items)
+            try:
+                primary = np.asarray(self.primary_score_fn(X), dtype=np.float64)
+                candidate = self.score(X)
+            except Exception as e:
+                logging.error(f"Shadow scoring failed: {e}")
+                self.failed_batches += 1
+                continue
+            with self._lock:
+                self.report.update(primary, candidate)
+
+    def stats(self) -> dict:
+        """
+        Returns the agreement report with the candidate version and the dropped and failed work.
+        """
+        with self._lock:
+            report = self.report.report()
+        report.update(
+            {
+                "model_version": self.model_version,
+                "queued_requests": self._queue.qsize(),
+                "dropped_requests": self.dropped_requests,
+                "failed_batches": self.failed_batches,
+            }
+        )
+        return report
@@ -0,0 +1,52 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedArray:
+    def __init__(self, array: np.ndarray):
+        """
+        Copies an array once into a new shared memory block owned by this process.
+
+        Parameters:
+            array (np.ndarray): The array to share with worker processes.
+        """
+        array = np.ascontiguousarray(array)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.descriptor = (self._shm.name, array.shape, array.dtype.str)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf)[...] = array
+
+    def release(self):
+        """
+        Frees the shared memory block. Workers must have detached before.
+        """
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+# Blocks attached by this worker process, kept open for the lifetime of the process.
+_attached_blocks = {}
+
+
+def attach_shared_array(descriptor: tuple) -> np.ndarray:
+    """
+    Maps a shared array into the current process without copying it.
+
+    Parameters:
+        descriptor (tuple): The (name, shape, dtype) descriptor of a SharedArray.
+
+    Returns:
+        np.ndarray: A read-only view of the shared data.
+    """
+    name, shape, dtype = descriptor
+    if name not in _attached_blocks:
+        _attached_blocks[name] = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_attached_blocks[name].buf)
+    array.flags.writeable = False
+    return array
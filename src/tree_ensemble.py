@@ -0,0 +1,330 @@
+import json
+import logging
+from collections import deque
+
+import numpy as np
+
+
+# Missing value handling of LightGBM numerical splits.
+MISSING_NONE, MISSING_ZERO, MISSING_NAN = 0, 1, 2
+MISSING_TYPES = {"None": MISSING_NONE, "Zero": MISSING_ZERO, "NaN": MISSING_NAN}
+
+# LightGBM treats |x| <= kZeroThreshold as zero for missing_type 'Zero'.
+ZERO_THRESHOLD = 1e-35
+
+# Number of (row, tree) pairs walked at once; keeps the working set in cache.
+CHUNK_PAIRS = 16384
+
+# Copies of the inputs with missing values substituted by -inf (go left) or +inf (go
+# right): NaN only, then NaN and zeros for the splits with missing_type 'Zero'.
+NAN_LEFT, NAN_RIGHT, ZERO_LEFT, ZERO_RIGHT = 0, 1, 2, 3
+
+# Node arrays stored in the flat ensemble file.
+NODE_ARRAYS = ("feature", "routed_feature", "threshold", "left", "value")
+# Per-tree arrays: roots in walk order (deepest first), their depths, and the walk
+# position of every tree in LightGBM's order.
+TREE_ARRAYS = ("roots", "depths", "tree_positions")
+
+
+def _split_copy(tree: dict) -> int:
+    """
+    Returns the copy of the inputs whose substituted missing values a split routes like
+    LightGBM: NaN follows the default direction for Zero/NaN splits and acts as 0
+    otherwise, and zeros follow the default direction for Zero splits.
+    """
+    missing_type = MISSING_TYPES[tree["missing_type"]]
+    if missing_type == MISSING_ZERO:
+        return ZERO_LEFT if tree["default_left"] else ZERO_RIGHT
+    if missing_type == MISSING_NONE:
+        nan_goes_right = tree["threshold"] < 0.0
+    else:
+        nan_goes_right = not tree["default_left"]
+    return NAN_RIGHT if nan_goes_right else NAN_LEFT
+
+
+def _flatten_tree(tree: dict, nodes: dict, n_features: int) -> int:
+    """
+    Appends the nodes of one LightGBM tree to the flat node lists in breadth-first order.
+
+    The two children of a split are stored next to each other, so the next node of a
+    walk is `left + go_right`. Leaves point to themselves with a +inf threshold, so a
+    level-synchronous walk can keep stepping finished rows without branching.
+
+    Parameters:
+        tree (dict): A `tree_structure` node from `Booster.dump_model()`.
+        nodes (dict): Flat node lists keyed by array name.
+        n_features (int): Number of input features, the width of each input copy.
+
+    Returns:
+        int: The index of the root node.
+    """
+
+    def append_node() -> int:
+        for name in NODE_ARRAYS:
+            nodes[name].append(0)
+        return len(nodes["feature"]) - 1
+
+    root = append_node()
+    pending = deque([(tree, root)])
+    while pending:
+        node, index = pending.popleft()
+        if "leaf_value" in node:
+            nodes["threshold"][index] = np.inf
+            nodes["left"][index] = index
+            nodes["value"][index] = node["leaf_value"]
+            continue
+
+        if node["decision_type"] != "<=":
+            raise ValueError("Categorical splits are not supported by the flat tree ensemble.")
+
+        left = append_node()
+        append_node()
+        nodes["feature"][index] = node["split_feature"]
+        nodes["routed_feature"][index] = node["split_feature"] + n_features * _split_copy(node)
+        nodes["threshold"][index] = node["threshold"]
+        nodes["left"][index] = left
+        pending.extend([(node["left_child"], left), (node["right_child"], left + 1)])
+    return root
+
+
+def _tree_depth(tree: dict) -> int:
+    """
+    Returns the number of splits on the longest root-to-leaf path.
+    """
+    if "leaf_value" in tree:
+        return 0
+    return 1 + max(_tree_depth(tree["left_child"]), _tree_depth(tree["right_child"]))
+
+
+# Flat tree ensemble
+# ------------------
+# All arrays are laid out at export time, so loading (or mapping a model package) builds
+# nothing per process. The walk is tree-major with the deepest trees first: at every level
+# only the trees still that deep are stepped, which is a prefix of the (tree, row) pairs.
+# Scoring needs numpy only, whatever the batch size.
+class FlatTreeEnsemble:
+    def __init__(self, arrays: dict, metadata: dict):
+        """
+        Initializes the FlatTreeEnsemble from its node arrays.
+
+        Parameters:
+            arrays (dict): The node arrays ('feature', 'routed_feature', 'threshold', 'left',
+                'value') and the tree arrays ('roots', 'depths', 'tree_positions').
+            metadata (dict): 'objective', 'sigmoid', 'max_depth', 'n_features' and
+                'has_zero_rules'.
+        """
+        self.arrays = arrays
+        self.metadata = metadata
+        self.classes_ = np.array([0, 1])
+
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+        self.max_depth = int(metadata["max_depth"])
+        self.n_features_in_ = int(metadata["n_features"])
+        self.objective = metadata["objective"]
+        self.sigmoid = float(metadata["sigmoid"])
+        self.has_zero_rules = bool(metadata["has_zero_rules"])
+        # Number of trees (deepest first) still walking at every level.
+        self.level_trees = [int(np.sum(self.depths > level)) for level in range(self.max_depth)]
+
+    @classmethod
+    def from_lightgbm(cls, model) -> "FlatTreeEnsemble":
+        """
+        Exports a trained LightGBM model into flat node arrays.
+
+        Parameters:
+            model (lightgbm.Booster or LGBMModel): The trained LightGBM model.
+
+        Returns:
+            FlatTreeEnsemble: The flattened ensemble.
+        """
+        booster = getattr(model, "booster_", model)
+        dump = booster.dump_model()
+
+        if dump["num_tree_per_iteration"] != 1:
+            raise ValueError("Only single-output LightGBM models can be flattened.")
+
+        n_features = dump["max_feature_idx"] + 1
+        trees = [tree["tree_structure"] for tree in dump["tree_info"]]
+        nodes = {name: [] for name in NODE_ARRAYS}
+        roots = np.array([_flatten_tree(tree, nodes, n_features) for tree in trees], dtype=np.int64)
+        depths = np.array([_tree_depth(tree) for tree in trees], dtype=np.int64)
+        walk_order = np.argsort(-depths, kind="stable")
+
+        objective = dump["objective"].split(" ")
+        sigmoid = 1.0
+        for option in objective[1:]:
+            if option.startswith("sigmoid:"):
+                sigmoid = float(option.split(":")[1])
+
+        arrays = {
+            "feature": np.array(nodes["feature"], dtype=np.int64),
+            "routed_feature": np.array(nodes["routed_feature"], dtype=np.int64),
+            "threshold": np.array(nodes["threshold"], dtype=np.float64),
+            "left": np.array(nodes["left"], dtype=np.int64),
+            "value": np.array(nodes["value"], dtype=np.float64),
+            "roots": roots[walk_order],
+            "depths": depths[walk_order],
+            "tree_positions": np.argsort(walk_order).astype(np.int64),
+        }
+        metadata = {
+            "objective": objective[0],
+            "sigmoid": sigmoid,
+            "max_depth": int(depths.max(initial=0)),
+            "n_features": n_features,
+            "has_zero_rules": bool(
+                np.any(arrays["routed_feature"] >= ZERO_LEFT * n_features)
+            ),
+        }
+        logging.info(
+            f"Flattened {len(roots)} trees into {len(arrays['feature'])} nodes "
+            f"(max depth {metadata['max_depth']})."
+        )
+        return cls(arrays, metadata)
+
+    def save(self, file_path: str):
+        """
+        Saves the node arrays and metadata into an uncompressed `.npz` file.
+
+        Parameters:
+            file_path (str): Destination path of the ensemble file.
+        """
+        with open(file_path, "wb") as f:
+            np.savez(f, metadata=np.array(json.dumps(self.metadata)), **self.arrays)
+
+    @classmethod
+    def load(cls, file_path: str) -> "FlatTreeEnsemble":
+        """
+        Loads an ensemble saved with `save`.
+
+        Parameters:
+            file_path (str): Path of the ensemble file.
+
+        Returns:
+            FlatTreeEnsemble: The loaded ensemble.
+        """
+        with np.load(file_path) as data:
+            metadata = json.loads(str(data["metadata"]))
+            arrays = {name: data[name] for name in data.files if name != "metadata"}
+        return cls(arrays, metadata)
+
+    def _missing_value_copies(self, X: np.ndarray) -> np.ndarray:
+        """
+        Stacks the copies of the inputs in which missing values are replaced by -inf or
+        +inf, so that every split routes them by a plain comparison.
+
+        Returns:
+            np.ndarray: The copies of shape (n_samples, 4 * n_features).
+        """
+        is_nan = np.isnan(X)
+        is_zero = is_nan | (np.abs(X) <= ZERO_THRESHOLD)
+        copies = np.empty((X.shape[0], 4, X.shape[1]))
+        copies[:, NAN_LEFT] = np.where(is_nan, -np.inf, X)
+        copies[:, NAN_RIGHT] = np.where(is_nan, np.inf, X)
+        copies[:, ZERO_LEFT] = np.where(is_zero, -np.inf, X)
+        copies[:, ZERO_RIGHT] = np.where(is_zero, np.inf, X)
+        return copies.reshape(X.shape[0], -1)
+
+    def _predict_chunk(self, X: np.ndarray, feature: np.ndarray) -> np.ndarray:
+        """
+        Walks all trees level-synchronously over a chunk of rows.
+        """
+        n_rows, row_size = X.shape
+        n_trees = len(self.roots)
+        # (tree, row) pairs, tree-major: the trees still walking are always a prefix.
+        nodes = np.repeat(self.roots, n_rows)
+        row_offsets = np.tile(np.arange(0, n_rows * row_size, row_size, dtype=np.int64), n_trees)
+        X_flat = X.ravel()
+
+        # np.take into preallocated outputs avoids the overhead of fancy indexing;
+        # every index is in range, so mode="clip" only skips the bounds checks.
+        positions = np.empty_like(nodes)
+        values = np.empty(len(nodes))
+        thresholds = np.empty(len(nodes))
+        go_right = np.empty(len(nodes), dtype=bool)
+
+        for level_trees in self.level_trees:
+            active = level_trees * n_rows
+            walking = nodes[:active]
+            np.take(feature, walking, out=positions[:active], mode="clip")
+            positions[:active] += row_offsets[:active]
+            np.take(X_flat, positions[:active], out=values[:active], mode="clip")
+            np.take(self.threshold, walking, out=thresholds[:active], mode="clip")
+            np.greater(values[:active], thresholds[:active], out=go_right[:active])
+            np.take(self.left, walking, out=walking, mode="clip")
+            walking += go_right[:active]
+
+        # Sequential (not pairwise) summation in LightGBM's tree order reproduces its
+        # scores exactly.
+        leaf_values = self.value[nodes].reshape(n_trees, n_rows)[self.tree_positions]
+        return np.cumsum(leaf_values, axis=0)[-1]
+
+    def predict_raw(self, X) -> np.ndarray:
+        """
+        Walks all trees level-synchronously over the batch and sums the leaf values.
+
+        Rows are processed in chunks so that the per-level (tree, row) arrays stay in cache.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: The raw scores, equal to LightGBM's `raw_score=True` output.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+        if len(self.roots) == 0:
+            return np.zeros(X.shape[0])
+
+        # Without missing values (or zero rules) the copies route exactly like the inputs.
+        if self.has_zero_rules or np.isnan(X).any():
+            X, feature = self._missing_value_copies(X), self.routed_feature
+        else:
+            feature = self.feature
+        rows_per_chunk = max(1, CHUNK_PAIRS // len(self.roots))
+        return np.concatenate(
+            [
+                self._predict_chunk(X[start : start + rows_per_chunk], feature)
+                for start in range(0, X.shape[0], rows_per_chunk)
+            ]
+            or [np.zeros(0)]
+        )
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Returns the class probabilities of a binary ensemble.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: Class probabilities of shape (n_samples, 2).
+        """
+        positive = 1.0 / (1.0 + np.exp(-self.sigmoid * self.predict_raw(X)))
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predicts like the exported LightGBM model: class labels for binary objectives
+        and raw scores otherwise.
+
+        Parameters:
+            X (array-like): The feature data of shape (n_samples, n_features).
+
+        Returns:
+            np.ndarray: The predictions of shape (n_samples,).
+        """
+        if self.objective == "binary":
+            return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+        return self.predict_raw(X)
+
+    def fit(self, X, y=None):
+        """
+        The ensemble is exported from a trained model, so fitting is a no-op.
+
+        Returns:
+            FlatTreeEnsemble: The ensemble itself.
+        """
+        return self
@@ -0,0 +1,421 @@
+import io
+import json
+import logging
+import os
+import select
+import signal
+import socket
+import struct
+import time
+
+import numpy as np
+
+from constants.string_constants import StringConstants
+from src.payload_decoding import decode_float32_rows, encode_float32_rows
+
+# Setup logging configuration
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+# Frame header: a one-byte command (requests) or status (responses) and the body length.
+FRAME_HEADER = struct.Struct("<cI")
+PREDICT_COMMAND, HEALTH_COMMAND = b"P", b"H"
+STATUS_OK, STATUS_ERROR = b"0", b"1"
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    """
+    Reads exactly `size` bytes; returns fewer only when the peer closed the connection.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = connection.recv_into(view[received:])
+        if count == 0:
+            break
+        received += count
+    return bytes(view[:received])
+
+
+def send_frame(connection: socket.socket, kind: bytes, body: bytes):
+    """
+    Sends one length-prefixed frame.
+    """
+    connection.sendall(FRAME_HEADER.pack(kind, len(body)) + body)
+
+
+def receive_frame(connection: socket.socket):
+    """
+    Receives one length-prefixed frame.
+
+    Returns:
+        tuple: The command or status byte and the body, or None when the peer closed the connection.
+    """
+    header = _receive_exactly(connection, FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    kind, length = FRAME_HEADER.unpack(header)
+    body = _receive_exactly(connection, length)
+    if len(body) < length:
+        return None
+    return kind, body
+
+
+def _serve_worker(
+    listener: socket.socket,
+    model,
+    columns: list,
+    ready_fd: int,
+    transformer=None,
+    model_loader=None,
+):
+    """
+    Runs in a forked worker: loads the model if it was not inherited, warms it up, reports
+    readiness and serves connections from the shared listening socket one at a time.
+    """
+    if model is None:
+        model = model_loader()
+
+    def predict(X: np.ndarray) -> np.ndarray:
+        if transformer is not None:
+            X = transformer.transform(X)
+        return np.asarray(model.predict(X))
+
+    # The first prediction pays for lazy initialisation before any client request does.
+    predict(np.zeros((1, len(columns)), dtype=np.float32))
+    os.write(ready_fd, b"1")
+    os.close(ready_fd)
+
+    served = 0
+    started = time.time()
+    while True:
+        connection, _ = listener.accept()
+        with connection:
+            while True:
+                frame = receive_frame(connection)
+                if frame is None:
+                    break
+                command, body = frame
+                try:
+                    if command == PREDICT_COMMAND:
+                        predictions = predict(decode_float32_rows(body, columns))
+                        buffer = io.BytesIO()
+                        np.lib.format.write_array(buffer, np.ascontiguousarray(predictions))
+                        send_frame(connection, STATUS_OK, buffer.getvalue())
+                        served += 1
+                    elif command == HEALTH_COMMAND:
+                        health = {
+                            "pid": os.getpid(),
+                            "ready": True,
+                            "requests_served": served,
+                            "uptime_s": time.time() - started,
+                        }
+                        send_frame(connection, STATUS_OK, json.dumps(health).encode())
+                    else:
+                        send_frame(connection, STATUS_ERROR, b"Unknown command.")
+                except Exception as e:
+                    send_frame(connection, STATUS_ERROR, str(e).encode())
+
+
+# Pre-forked warm worker pool
+# ---------------------------
+# The parent loads the model once and forks the workers, which share its memory
+# copy-on-write and accept batches from one Unix socket. Dead workers are re-forked from
+# the warm parent, so the cold start is paid once per deployment. Models that are not
+# fork-safe are instead loaded by every worker after the fork.
+class WarmWorkerPool:
+    def __init__(
+        self,
+        model,
+        columns: list,
+        n_workers: int = 3,
+        socket_path: str = StringConstants.worker_pool_socket,
+        max_startup_failures: int = 3,
+        transformer=None,
+        model_loader=None,
+    ):
+        """
+        Initializes the WarmWorkerPool with a model already loaded in this process, or with
+        a loader every worker calls after the fork.
+
+        A preloaded model must be fork-safe, e.g. the numpy GA network or the flat tree
+        ensemble of a model package; TensorFlow and OpenMP runtimes that started threads
+        before the fork are not, so Keras models are loaded with `model_loader` instead.
+
+        Parameters:
+            model: The trained model or pipeline, or None to load it in every worker.
+            columns (list): Feature order expected by the model.
+            n_workers (int): Number of worker processes.
+            socket_path (str): Path of the Unix socket the workers listen on.
+            max_startup_failures (int): Number of workers allowed to die before reporting
+                ready; beyond it the pool gives up instead of re-forking them forever.
+            transformer: Feature transformer applied to every batch before predicting, if
+                the model expects it. It is loaded here and inherited by the workers.
+            model_loader (callable): Loads the model in a worker when `model` is None.
+
+        Raises:
+            ValueError: If neither a model nor a loader is given.
+        """
+        if model is None and model_loader is None:
+            raise ValueError("The pool needs a loaded model or a model loader.")
+        self.model = model
+        self.transformer = transformer
+        self.model_loader = model_loader
+        self.columns = list(columns)
+        self.n_workers = n_workers
+        self.socket_path = socket_path
+        self.max_startup_failures = max_startup_failures
+        self._startup_failures = 0
+        self._listener = None
+        self._workers = {}
+
+    def _spawn_worker(self):
+        """
+        Forks one worker and records the pipe it reports readiness on.
+        """
+        ready_read, ready_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            exit_code = 1
+            try:
+                _serve_worker(
+                    self._listener,
+                    self.model,
+                    self.columns,
+                    ready_write,
+                    self.transformer,
+                    self.model_loader,
+                )
+                exit_code = 0
+            except BaseException:
+                logging.exception(f"Worker {os.getpid()} failed.")
+            finally:
+                # Never run the parent's cleanup in the child.
+                os._exit(exit_code)
+        os.close(ready_write)
+        self._workers[pid] = {"ready_fd": ready_read, "ready": False, "started": time.time()}
+        logging.info(f"Forked worker {pid}.")
+
+    def start(self):
+        """
+        Binds the Unix socket and forks the workers.
+        """
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.socket_path)
+        self._listener.listen(128)
+        for _ in range(self.n_workers):
+            self._spawn_worker()
+
+    def _poll_readiness(self, timeout: float = 0.0):
+        """
+        Marks workers whose readiness byte has arrived.
+        """
+        pending = {
+            info["ready_fd"]: pid
+            for pid, info in self._workers.items()
+            if info["ready_fd"] is not None and not info["ready"]
+        }
+        if not pending:
+            return
+        readable, _, _ = select.select(list(pending), [], [], timeout)
+        for fd in readable:
+            pid = pending[fd]
+            if os.read(fd, 1) == b"1":
+                self._workers[pid]["ready"] = True
+                logging.info(
+                    f"Worker {pid} is ready after {time.time() - self._workers[pid]['started']:.2f}s."
+                )
+            # An empty read means the worker died before warming up; it is reaped later.
+            os.close(fd)
+            self._workers[pid]["ready_fd"] = None
+
+    def wait_until_ready(self, timeout: float = 60.0) -> bool:
+        """
+        Waits until every worker has warmed up.
+
+        Parameters:
+            timeout (float): Longest time to wait, in seconds.
+
+        Returns:
+            bool: Whether all workers are ready.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._poll_readiness(min(remaining, 0.5))
+            self._reap_workers()
+        return True
+
+    def _reap_workers(self) -> list:
+        """
+        Collects exited workers and forks replacements.
+
+        Returns:
+            list: The pids of the workers that exited.
+
+        Raises:
+            RuntimeError: If more than `max_startup_failures` workers died before warming up.
+        """
+        exited = []
+        for pid in list(self._workers):
+            finished, status = os.waitpid(pid, os.WNOHANG)
+            if finished:
+                info = self._workers.pop(pid)
+                if info["ready_fd"] is not None:
+                    os.close(info["ready_fd"])
+                exit_code = os.waitstatus_to_exitcode(status)
+                exited.append(pid)
+                if not info["ready"]:
+                    self._startup_failures += 1
+                    if self._startup_failures > self.max_startup_failures:
+                        raise RuntimeError(
+                            f"{self._startup_failures} workers failed to warm up, the last "
+                            f"with exit code {exit_code}; see the worker logs."
+                        )
+                logging.warning(
+                    f"Worker {pid} exited with code {exit_code}; forking a replacement."
+                )
+                self._spawn_worker()
+        return exited
+
+    def ready(self) -> bool:
+        """
+        Returns whether the pool has its full set of warmed-up workers.
+        """
+        return len(self._workers) == self.n_workers and all(
+            info["ready"] for info in self._workers.values()
+        )
+
+    def health(self) -> dict:
+        """
+        Replaces dead workers and reports the state of the pool.
+
+        Returns:
+            dict: Readiness of the pool and of every worker, and the workers replaced by this check.
+        """
+        replaced = self._reap_workers()
+        self._poll_readiness()
+        return {
+            "ready": self.ready(),
+            "socket_path": self.socket_path,
+            "workers": {pid: info["ready"] for pid, info in self._workers.items()},
+            "replaced": replaced,
+        }
+
+    def supervise(self, interval: float = 1.0):
+        """
+        Keeps the pool healthy until interrupted, then stops it.
+
+        Parameters:
+            interval (float): Seconds between health checks.
+        """
+        try:
+            while True:
+                self.health()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logging.info("Stopping the worker pool.")
+        finally:
+            self.stop()
+
+    def stop(self):
+        """
+        Terminates the workers and removes the socket.
+        """
+        for pid in list(self._workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            info = self._workers.pop(pid)
+            if info["ready_fd"] is not None:
+                os.close(info["ready_fd"])
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+# Client of the warm worker pool
+# ------------------------------
+# Keeps one connection to a worker and sends float32 row batches over it.
+class WarmPoolClient:
+    def __init__(self, columns: list, socket_path: str = StringConstants.worker_pool_socket):
+        """
+        Initializes the WarmPoolClient for a running pool.
+
+        Parameters:
+            columns (list): Feature order expected by the model.
+            socket_path (str): Path of the pool's Unix socket.
+        """
+        self.columns = list(columns)
+        self.socket_path = socket_path
+        self._connection = None
+
+    def _request(self, command: bytes, body: bytes) -> bytes:
+        """
+        Sends one frame and returns the response body, reconnecting once if the worker went away.
+        """
+        for _ in range(2):
+            if self._connection is None:
+                self._connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._connection.connect(self.socket_path)
+            try:
+                send_frame(self._connection, command, body)
+                frame = receive_frame(self._connection)
+            except OSError:
+                frame = None
+            if frame is not None:
+                break
+            self.close()
+        else:
+            raise ConnectionError(f"The worker pool at {self.socket_path} closed the connection.")
+
+        status, response = frame
+        if status != STATUS_OK:
+            raise RuntimeError(f"Worker error: {response.decode()}")
+        return response
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Scores a batch on a warm worker.
+
+        Parameters:
+            X (np.ndarray): The feature data, in the pool's column order.
+
+        Returns:
+            np.ndarray: The model's predictions.
+        """
+        response = self._request(PREDICT_COMMAND, encode_float32_rows(X, self.columns))
+        return np.lib.format.read_array(io.BytesIO(response))
+
+    def health(self) -> dict:
+        """
+        Returns the health report of the worker serving this connection.
+        """
+        return json.loads(self._request(HEALTH_COMMAND, b""))
+
+    def close(self):
+        """
+        Closes the connection to the worker.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
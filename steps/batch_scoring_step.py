@@ -0,0 +1,69 @@
+import logging
+import os
+
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import PowerTransformer
+from zenml import step
+
+from constants.string_constants import StringConstants
+from src.batch_scoring import StreamingBatchScorer
+from src.input_schema import load_compiled_schema
+from src.serving_metrics import ServingMetrics
+
+
+# The experiment tracker is attached with `with_options` when the pipeline is composed.
+@step(enable_cache=False)
+def batch_scoring_step(
+    trained_model: Pipeline,
+    transformer: PowerTransformer,
+    input_path: str,
+    output_path: str,
+    chunk_size: int = 50_000,
+    n_workers: int = None,
+    schema_path: str = StringConstants.input_schema_path,
+) -> dict:
+    """
+    Scores a JSONL or CSV file of records with the trained model in bounded memory.
+
+    Records are read, transformed, scored and written chunk by chunk; the output keeps
+    the input order and adds a `fraud_score` column, plus an `input_errors` column for
+    the records failing the input schema checks, which are not scored. The throughput
+    and the mean and p95 time of every stage are logged to MLflow.
+
+    Args:
+        trained_model (Pipeline): The trained model pipeline.
+        transformer (PowerTransformer): The feature transformer fitted on the training data.
+        input_path (str): The JSONL or CSV file of raw records.
+        output_path (str): The JSONL or CSV file to write the scored records to.
+        chunk_size (int): Number of records scored at once.
+        n_workers (int): Number of scoring threads. Defaults to the CPU count.
+        schema_path (str): The input schema artifact saved at training time, if it exists.
+
+    Returns:
+        dict: The number of rows and chunks, the elapsed time, the throughput and the
+            per-stage timings.
+    """
+    import mlflow
+
+    scorer = StreamingBatchScorer(
+        trained_model,
+        # The transformer was fitted on the training DataFrame, so it knows the feature order.
+        columns=list(transformer.feature_names_in_),
+        transformer=transformer,
+        chunk_size=chunk_size,
+        n_workers=n_workers,
+        metrics=ServingMetrics(),
+        schema=load_compiled_schema(schema_path) if os.path.exists(schema_path) else None,
+    )
+    summary = scorer.score_file(input_path, output_path)
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+        logging.info("Starting a new MLflow run for batch scoring.")
+
+    try:
+        mlflow.log_metrics({f"batch_scoring_{name}": value for name, value in summary.items()})
+    finally:
+        mlflow.end_run()
+
+    return summary
@@ -0,0 +1,56 @@
+import logging
+
+import pandas as pd
+from zenml import step
+
+from src.cross_validation import StratifiedCrossValidator
+from steps.data_modelling_step import get_modelling_strategy
+
+
+# The experiment tracker is attached with `with_options` when the pipeline is composed.
+@step(enable_cache=False)
+def cross_validation_step(
+    X: pd.DataFrame,
+    y: pd.Series,
+    strategy: str = "gacs",
+    n_splits: int = 5,
+    n_workers: int = None,
+    threshold: float = 0.5,
+) -> pd.DataFrame:
+    """
+    Cross-validates a modelling strategy on stratified folds in parallel worker processes.
+
+    The imputer and the power transform are re-fitted on every training fold, so the step
+    takes the raw features rather than the normalized training set.
+
+    Args:
+        X (pd.DataFrame): The raw feature data.
+        y (pd.Series): The target data.
+        strategy (str): The modelling strategy, as in `data_modelling_step`.
+        n_splits (int): Number of stratified folds.
+        n_workers (int): Number of worker processes. Defaults to the CPU count.
+        threshold (float): Decision threshold on the fraud score.
+
+    Returns:
+        pd.DataFrame: The timings and metrics of every fold.
+    """
+    import mlflow
+
+    validator = StratifiedCrossValidator(
+        n_splits=n_splits, n_workers=n_workers, threshold=threshold
+    )
+    results = validator.cross_validate(get_modelling_strategy(strategy), X, y)
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+        logging.info("Starting a new MLflow run for cross-validation.")
+
+    try:
+        for row in results.to_dict(orient="records"):
+            fold = row.pop("fold")
+            mlflow.log_metrics({f"cv_{name}": value for name, value in row.items()}, step=fold)
+        mlflow.log_metrics(StratifiedCrossValidator.summarize(results))
+    finally:
+        mlflow.end_run()
+
+    return results
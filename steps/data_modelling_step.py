@@ -1,20 +1,57 @@
+from functools import lru_cache
 from zenml import step, Model, ArtifactConfig
-from zenml.client import Client
 
 # from typing import Annotated
 import logging
 import pandas as pd
 from sklearn.pipeline import Pipeline
-import mlflow
 
 from src.data_modelling import (
+    CascadeModellingStrategy,
     DataModeller,
+    DataModellingStrategy,
     GACSModellingStrategy,
+    LGBMClassifierModellingStrategy,
     LGBMModellingStrategy,
+    NumpyGACSModellingStrategy,
 )
 
-# Get the active experiment tracker from ZenML
-experiment_tracker = Client().active_stack.experiment_tracker
+
+@lru_cache(maxsize=None)
+def get_experiment_tracker_name() -> str:
+    """
+    Looks up the active experiment tracker from ZenML.
+
+    The lookup initialises the ZenML client and stack, so it is deferred until a
+    pipeline that trains a model is composed instead of running at import time.
+    """
+    from zenml.client import Client
+
+    return Client().active_stack.experiment_tracker.name
+
+
+def get_modelling_strategy(strategy: str) -> DataModellingStrategy:
+    """
+    Creates the modelling strategy with the given name.
+
+    Args:
+        strategy (str): 'gacs', 'numpy_gacs', 'lgbm', 'lgbm_classifier' or 'cascade'.
+
+    Raises:
+        ValueError: If an unsupported modelling strategy is provided.
+    """
+    if strategy == "gacs":
+        return GACSModellingStrategy()
+    elif strategy == "numpy_gacs":
+        return NumpyGACSModellingStrategy()
+    elif strategy == "lgbm":
+        return LGBMModellingStrategy()
+    elif strategy == "lgbm_classifier":
+        return LGBMClassifierModellingStrategy()
+    elif strategy == "cascade":
+        return CascadeModellingStrategy()
+    raise ValueError(f"Unsupported modelling strategy: {strategy}")
+
 
 model = Model(
     name="ethereum_fraud_detector",
@@ -24,20 +61,32 @@ model = Model(
 )
 
 
+# The experiment tracker is attached with `with_options` when the pipeline is composed.
 @step(
     enable_cache=False,
-    experiment_tracker=experiment_tracker.name,
     model=model,
 )
 def data_modelling_step(
     X_train: pd.DataFrame,
     y_train: pd.Series,
+    strategy: str = "gacs",
 ) -> Pipeline:
     """
     This step is responsible for building and training a machine learning model to predict Ethereum transaction fraud.
-    It utilizes the GACSModellingStrategy for model building and training, and leverages MLflow for experiment tracking.
+    It utilizes the selected modelling strategy for model building and training, and leverages MLflow for experiment tracking.
+
+    Args:
+        X_train (pd.DataFrame): The feature data for training the model.
+        y_train (pd.Series): The target data for training the model.
+        strategy (str): The modelling strategy. Options: 'gacs', 'numpy_gacs', 'lgbm',
+            'lgbm_classifier' or 'cascade'. Default is 'gacs'.
+
+    Raises:
+        ValueError: If an unsupported modelling strategy is provided.
     """
-    data_modeller = DataModeller(GACSModellingStrategy())
+    import mlflow
+
+    data_modeller = DataModeller(get_modelling_strategy(strategy))
 
     # Start an MLflow run to log the model training process
     if not mlflow.active_run():
@@ -56,6 +105,11 @@ def data_modelling_step(
             y_train=y_train,
         )
         logging.info("Model training completed successfully.")
+
+        # Report how the cascade splits the training data between its stages
+        training_stats = getattr(model_pipeline.named_steps["model"], "training_stats_", None)
+        if training_stats:
+            mlflow.log_metrics(training_stats)
     except Exception as e:
         logging.error(f"Error during model training: {e}")
         raise e
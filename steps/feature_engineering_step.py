@@ -1,28 +1,37 @@
+from typing import Tuple
+
 from zenml import step
 import pandas as pd
+from sklearn.preprocessing import PowerTransformer
 
+from constants.string_constants import StringConstants
 from src.feature_engineering import (
     FeatureEngineeringHandler,
     NormalizeFeatureEngineeringStrategy,
 )
+from src.model_packaging import save_model_package
 
 
 @step
-def feature_engineering_step(df: pd.DataFrame) -> pd.DataFrame:
+def feature_engineering_step(
+    df: pd.DataFrame,
+    transformer_path: str = StringConstants.transformer_path,
+) -> Tuple[pd.DataFrame, PowerTransformer]:
     """
     Applies feature engineering transformations to the input DataFrame as a ZenML Step.
 
     Parameters:
         df (pd.DataFrame): The input DataFrame containing features to be engineered.
+        transformer_path (str): Where the fitted transformer is saved for the scoring CLIs.
 
     Returns:
         pd.DataFrame: The DataFrame with features engineered and normalized.
+        PowerTransformer: The fitted transformer, to transform test and serving data the same way.
     """
-
-    feature_engineering_handler = FeatureEngineeringHandler(
-        NormalizeFeatureEngineeringStrategy()
-    )
+    strategy = NormalizeFeatureEngineeringStrategy()
+    feature_engineering_handler = FeatureEngineeringHandler(strategy)
     feature_engineered = feature_engineering_handler.apply_transformation(df)
 
     print(feature_engineered.shape)
-    return feature_engineered
+    save_model_package(strategy.transformer, transformer_path)
+    return feature_engineered, strategy.transformer
@@ -0,0 +1,60 @@
+from typing import Tuple
+
+import pandas as pd
+from zenml import step
+
+from src.feature_cleaning import FeatureCleaning, GeneticFeatureSelectionStrategy
+
+# Strategies serving the pre-trained GA network, whose input layer takes exactly the
+# columns of the input schema it was trained on; the cascade runs it as stage two.
+FIXED_INPUT_STRATEGIES = ("gacs", "numpy_gacs", "cascade")
+
+
+@step
+def feature_selection_step(
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_train: pd.Series,
+    strategy: str,
+    feature_penalty: float = 0.0,
+) -> Tuple[
+    pd.DataFrame,
+    pd.DataFrame,
+]:
+    """
+    Selects features with the genetic algorithm on the training split only, and keeps the
+    same columns in the test split, so that no test label informs the selection.
+
+    Args:
+        X_train (pd.DataFrame): The training features.
+        X_test (pd.DataFrame): The testing features.
+        y_train (pd.Series): The training target.
+        strategy (str): The modelling strategy trained on the selected features.
+        feature_penalty (float): Fitness penalty per fraction of features kept.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The training and testing features with only the
+            selected columns.
+
+    Raises:
+        ValueError: If the strategy serves the pre-trained GA network, which cannot be
+            retrained on fewer columns.
+    """
+    if strategy in FIXED_INPUT_STRATEGIES:
+        raise ValueError(
+            f"Genetic feature selection cannot be combined with the '{strategy}' strategy: "
+            "the pre-trained GA network expects every column of its input schema."
+        )
+
+    feature_cleaning = FeatureCleaning(
+        GeneticFeatureSelectionStrategy(
+            target_column=y_train.name,
+            feature_penalty=feature_penalty,
+        )
+    )
+    selected_df = feature_cleaning.apply_strategy(X_train.assign(**{y_train.name: y_train}))
+    selected_columns = [column for column in X_train.columns if column in selected_df.columns]
+
+    print("Selected features:", selected_columns)
+
+    return X_train[selected_columns], X_test[selected_columns]
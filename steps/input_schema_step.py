@@ -0,0 +1,41 @@
+import logging
+
+import pandas as pd
+from zenml import step
+
+from constants.string_constants import StringConstants
+from src.input_schema import InputSchema
+
+
+# The experiment tracker is attached with `with_options` when the pipeline is composed.
+@step(enable_cache=False)
+def input_schema_step(
+    X: pd.DataFrame,
+    file_path: str = StringConstants.input_schema_path,
+) -> dict:
+    """
+    Records the input schema of the model trained on these features, for the serving
+    path to validate and reorder incoming batches against.
+
+    Args:
+        X (pd.DataFrame): The raw training features, in model order.
+        file_path (str): Where the schema artifact is saved for the serving code.
+
+    Returns:
+        dict: The schema, with its feature order, ranges and validation rules.
+    """
+    import mlflow
+
+    schema = InputSchema.from_frame(X)
+    schema.save(file_path)
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+        logging.info("Starting a new MLflow run for the input schema.")
+
+    try:
+        mlflow.log_dict(schema.to_dict(), "input_schema.json")
+    finally:
+        mlflow.end_run()
+
+    return schema.to_dict()
@@ -1 +1,160 @@
-# TODO: Implement model evaluation as a step
+import logging
+from typing import Tuple
+
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import PowerTransformer
+from zenml import step
+
+from src.model_evaluation import (
+    BatchedClassificationEvaluationStrategy,
+    ModelEvaluator,
+    PoissonBootstrap,
+    ThresholdSweep,
+)
+from src.model_explanation import (
+    ModelExplainer,
+    explain_flagged,
+    explanation_strategy_for_pipeline,
+)
+
+
+def log_flagged_explanations(
+    trained_model: Pipeline,
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    transformer: PowerTransformer,
+    threshold: float,
+    n_explanations: int,
+    batch_size: int,
+):
+    """
+    Explains the top flagged test rows and logs their mean absolute SHAP value per feature.
+    """
+    import mlflow
+
+    # The background of the explanations is drawn from the training data, never the test set.
+    background = X_train.sample(n=min(len(X_train), 1000), random_state=42)
+    try:
+        explainer = ModelExplainer(
+            explanation_strategy_for_pipeline(trained_model, background)
+        )
+    except ValueError as e:
+        logging.warning(f"Skipping the SHAP explanations: {e}")
+        return
+
+    explanations = explain_flagged(
+        explainer,
+        trained_model,
+        X_test,
+        transformer=transformer,
+        threshold=threshold,
+        max_rows=n_explanations,
+        batch_size=batch_size,
+    )
+    if explanations.empty:
+        logging.info("No test row was flagged; there are no explanations to log.")
+        return
+
+    mean_abs_shap = explanations.drop(columns="score").abs().mean()
+    mlflow.log_dict(
+        mean_abs_shap.sort_values(ascending=False).to_dict(), "flagged_mean_abs_shap.json"
+    )
+
+
+# The experiment tracker is attached with `with_options` when the pipeline is composed.
+@step(enable_cache=False)
+def model_evaluation_step(
+    trained_model: Pipeline,
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    transformer: PowerTransformer,
+    batch_size: int = 100_000,
+    threshold: float = 0.5,
+    cost_fp: float = 1.0,
+    cost_fn: float = 1.0,
+    n_bootstrap: int = 1000,
+    n_explanations: int = 1000,
+) -> Tuple[dict, dict]:
+    """
+    Evaluates the trained model on the test set and logs the metrics to MLflow.
+
+    The test features are transformed with the transformer fitted on the training data
+    and scored in fixed-size batches, so memory stays constant in the size of the test set.
+
+    Args:
+        trained_model (Pipeline): The trained model pipeline.
+        X_train (pd.DataFrame): The transformed training features; a sample of them is the
+            background of the SHAP explanations.
+        X_test (pd.DataFrame): The raw test features.
+        y_test (pd.Series): The test labels.
+        transformer (PowerTransformer): The feature transformer fitted on the training data.
+        batch_size (int): Number of rows scored at once.
+        threshold (float): Decision threshold on the fraud score.
+        cost_fp (float): Cost of flagging a legitimate address.
+        cost_fn (float): Cost of missing a fraudulent address.
+        n_bootstrap (int): Number of bootstrap replicates for the confidence intervals; 0 disables them.
+        n_explanations (int): Number of top flagged test rows explained with SHAP; 0 disables them.
+
+    Returns:
+        dict: The evaluation metrics, with `<metric>_ci_lower`/`<metric>_ci_upper` 95% bounds.
+        dict: The cost-optimal decision threshold, found by sweeping the score histograms.
+    """
+    import mlflow
+
+    strategy = BatchedClassificationEvaluationStrategy(
+        transformer=transformer,
+        batch_size=batch_size,
+        threshold=threshold,
+    )
+    evaluator = ModelEvaluator(strategy)
+    metrics = evaluator.evaluate(trained_model, X_test, y_test)
+
+    if n_bootstrap:
+        bootstrap = PoissonBootstrap(n_replicates=n_bootstrap, threshold=threshold)
+        intervals = bootstrap.from_histograms(
+            strategy.accumulator_.positive_histogram,
+            strategy.accumulator_.negative_histogram,
+        )
+        for name, interval in intervals.items():
+            metrics[f"{name}_ci_lower"] = interval["lower"]
+            metrics[f"{name}_ci_upper"] = interval["upper"]
+
+    sweep = ThresholdSweep(cost_fp=cost_fp, cost_fn=cost_fn)
+    decision_threshold = sweep.optimal_threshold(
+        sweep.from_histograms(
+            strategy.accumulator_.positive_histogram,
+            strategy.accumulator_.negative_histogram,
+        )
+    )
+
+    # Start an MLflow run to log the evaluation metrics
+    if not mlflow.active_run():
+        mlflow.start_run()
+        logging.info("Starting a new MLflow run for model evaluation.")
+
+    try:
+        mlflow.log_metrics({f"test_{name}": value for name, value in metrics.items()})
+        mlflow.log_metrics(
+            {
+                "optimal_threshold": decision_threshold["threshold"],
+                "optimal_expected_cost": decision_threshold["expected_cost"],
+            }
+        )
+        mlflow.log_dict(decision_threshold, "decision_threshold.json")
+
+        if n_explanations:
+            log_flagged_explanations(
+                trained_model,
+                X_train,
+                X_test,
+                transformer,
+                threshold,
+                n_explanations,
+                batch_size,
+            )
+    finally:
+        mlflow.end_run()
+
+    return metrics, decision_threshold
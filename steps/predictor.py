@@ -1,66 +1,170 @@
-import json
+import logging
+import mmap
+import time
+
 import numpy as np
 import pandas as pd
 from zenml import step
 
 from zenml.integrations.mlflow.services import MLFlowDeploymentService
 
+from constants.string_constants import StringConstants
+from src.input_schema import load_compiled_schema
+from src.model_packaging import load_feature_transformer
+from src.payload_decoding import JSON_CONTENT_TYPE, decode_payload
+from src.serving_metrics import ServingMetrics
+from src.worker_pool import WarmPoolClient
+
+
+def decode_and_validate(
+    input_data: str, content_type: str, schema_path: str, metrics: ServingMetrics = None
+) -> tuple:
+    """
+    Decodes a payload into the model's column order and validates every row against the
+    input schema saved at training time.
+
+    Returns:
+        tuple: The feature data, the indices of the valid rows and the compiled schema.
+    """
+    start = time.perf_counter()
+    schema = load_compiled_schema(schema_path)
+    if content_type == JSON_CONTENT_TYPE:
+        data_array = decode_payload(input_data.encode(), content_type, schema.columns)
+    else:
+        with open(input_data, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data_array = decode_payload(buffer, content_type, schema.columns)
+
+    decoded = time.perf_counter()
+    codes = schema.validate(data_array)
+    if metrics is not None:
+        metrics.observe_stages(
+            {"decode": decoded - start, "validate": time.perf_counter() - decoded}
+        )
+    for error in schema.row_errors(codes):
+        logging.warning(f"Skipping row {error['row']}: {', '.join(error['reasons'])}.")
+    return data_array, np.flatnonzero(codes == 0), schema
+
+
+def scatter_predictions(predictions: list, valid_rows: np.ndarray, n_rows: int) -> np.ndarray:
+    """
+    Places the predictions of the valid rows into an array with NaN for the invalid rows.
+    """
+    if not predictions:
+        return np.full(n_rows, np.nan)
+    predictions = np.concatenate(predictions)
+    output = np.full((n_rows,) + predictions.shape[1:], np.nan)
+    output[valid_rows] = predictions
+    return output
+
+
+def timed_requests(predict_fn, X: np.ndarray, batch_size: int, metrics: ServingMetrics) -> list:
+    """
+    Sends the rows in bounded requests, recording the size and latency of each of them.
+    """
+    predictions = []
+    for start in range(0, len(X), batch_size):
+        batch = X[start : start + batch_size]
+        request_start = time.perf_counter()
+        predictions.append(np.asarray(predict_fn(batch)))
+        metrics.observe_stage("request", time.perf_counter() - request_start)
+        metrics.observe_batch(len(batch))
+    logging.info(f"Prediction timings: {metrics.summary()}")
+    return predictions
+
+
+def log_serving_metrics(metrics: ServingMetrics, prefix: str):
+    """
+    Logs the stage timings and batch sizes of a batch prediction job to MLflow.
+    """
+    import mlflow
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+        logging.info("Starting a new MLflow run for the batch predictions.")
+
+    try:
+        mlflow.log_metrics({f"{prefix}_{name}": value for name, value in metrics.summary().items()})
+    finally:
+        mlflow.end_run()
 
+
+# The experiment tracker is attached with `with_options` when the pipeline is composed.
 @step(enable_cache=False)
 def predictor(
     service: MLFlowDeploymentService,
     input_data: str,
+    content_type: str = JSON_CONTENT_TYPE,
+    batch_size: int = 100_000,
+    schema_path: str = StringConstants.input_schema_path,
+    transformer_path: str = StringConstants.transformer_path,
 ) -> np.ndarray:
+    """
+    Scores a batch with the deployed model.
+
+    Args:
+        service (MLFlowDeploymentService): The running prediction service.
+        input_data (str): A `split`-orient JSON payload, or for binary payloads
+            ('application/x-npy' or 'application/vnd.apache.arrow.stream') the path of the
+            payload file, which is memory-mapped instead of read.
+        content_type (str): The content type of the payload.
+        batch_size (int): Number of rows sent to the service per request.
+        schema_path (str): The input schema artifact saved at training time.
+        transformer_path (str): The feature transformer saved at training time; the
+            deployed pipeline expects transformed features.
 
+    Returns:
+        np.ndarray: The predictions of all rows, NaN for rows failing the schema checks.
+    """
     # Start the service (should be a NOP if already started)
     service.start(timeout=10)
 
-    # Load the input data from JSON string
-    data = json.loads(input_data)
-
-    # Extract the actual data and expected columns
-    data.pop("columns", None)  # Remove 'columns' if it's present
-    data.pop("index", None)  # Remove 'index' if it's present
-
-    expected_columns = [
-        "avg_min_between_sent_tnx",
-        "avg_min_between_received_tnx",
-        "time_diff_between_first_and_last_(mins)",
-        "sent_tnx",
-        "received_tnx",
-        "number_of_created_contracts",
-        "unique_received_from_addresses",
-        "unique_sent_to_addresses",
-        "min_value_received",
-        "max_value_received",
-        "avg_val_received",
-        "min_val_sent",
-        "max_val_sent",
-        "avg_val_sent",
-        "total_transactions_(including_tnx_to_create_contract",
-        "total_ether_sent",
-        "total_ether_received",
-        "total_ether_balance",
-        "total_erc20_tnxs",
-        "erc20_total_ether_received",
-        "erc20_total_ether_sent",
-        "erc20_total_ether_sent_contract",
-        "erc20_uniq_sent_addr",
-        "erc20_uniq_rec_addr",
-        "erc20_uniq_rec_contract_addr",
-        "erc20_min_val_rec",
-        "erc20_avg_val_rec",
-        "erc20_uniq_sent_token_name",
-    ]
-
-    # Convert the data into a DataFrame with the correct columns
-    df = pd.DataFrame(data["data"], columns=expected_columns)
-
-    # Convert DataFrame to JSON list for prediction
-    json_list = json.loads(json.dumps(list(df.T.to_dict().values())))
-    data_array = np.array(json_list)
-
-    # Run the prediction
-    prediction = service.predict(data_array)
-
-    return prediction
+    # Decode straight into a float32 array in the model's column order
+    metrics = ServingMetrics()
+    data_array, valid_rows, schema = decode_and_validate(
+        input_data, content_type, schema_path, metrics
+    )
+
+    # Transform the valid rows like the training data
+    transformer = load_feature_transformer(transformer_path)
+    start = time.perf_counter()
+    X = transformer.transform(pd.DataFrame(data_array[valid_rows], columns=schema.columns))
+    metrics.observe_stage("preprocess", time.perf_counter() - start)
+
+    # Run the prediction in bounded requests
+    predictions = timed_requests(service.predict, X, batch_size, metrics)
+    log_serving_metrics(metrics, "predictor")
+    return scatter_predictions(predictions, valid_rows, len(data_array))
+
+
+# The experiment tracker is attached with `with_options` when the pipeline is composed.
+@step(enable_cache=False)
+def warm_pool_predictor(
+    input_data: str,
+    socket_path: str = StringConstants.worker_pool_socket,
+    batch_size: int = 100_000,
+    schema_path: str = StringConstants.input_schema_path,
+) -> np.ndarray:
+    """
+    Scores a batch on the warm worker pool started with `run_worker_pool.py`, which keeps
+    the model loaded between pipeline runs. The raw rows are sent; the workers apply the
+    feature transformer themselves.
+
+    Args:
+        input_data (str): A `split`-orient JSON payload.
+        socket_path (str): The Unix socket of the worker pool.
+        batch_size (int): Number of rows sent to a worker per request.
+        schema_path (str): The input schema artifact saved at training time.
+
+    Returns:
+        np.ndarray: The predictions of all rows, NaN for rows failing the schema checks.
+    """
+    metrics = ServingMetrics()
+    data_array, valid_rows, schema = decode_and_validate(
+        input_data, JSON_CONTENT_TYPE, schema_path, metrics
+    )
+
+    with WarmPoolClient(schema.columns, socket_path) as client:
+        predictions = timed_requests(client.predict, data_array[valid_rows], batch_size, metrics)
+    log_serving_metrics(metrics, "warm_pool_predictor")
+    return scatter_predictions(predictions, valid_rows, len(data_array))
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Project root, so that `src` and `constants` are importable.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from constants.string_constants import StringConstants  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def genetic_model_path() -> str:
+    """
+    Path of the pre-trained Keras GA network.
+    """
+    return os.path.join(ROOT_DIR, StringConstants.genetic_model_path)
+
+
+@pytest.fixture(scope="session")
+def transformed_rows() -> np.ndarray:
+    """
+    Real labelled rows in the model's column order, power-transformed like the training
+    pipeline does before the network sees them.
+    """
+    from sklearn.preprocessing import PowerTransformer
+
+    from src.feature_cleaning import RenameFeatureCleaningStrategy
+    from src.input_schema import InputSchema
+
+    df = RenameFeatureCleaningStrategy().apply_strategy(
+        pd.read_csv(os.path.join(ROOT_DIR, StringConstants.file_path))
+    )
+    columns = InputSchema.load(os.path.join(ROOT_DIR, StringConstants.input_schema_path)).columns
+    X = df[columns].dropna()
+    return PowerTransformer().fit_transform(X).astype(np.float32)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+
+from src.data_modelling import PipelineNumpyGeneticModel
+from src.model_explanation import (
+    GradientExplanationStrategy,
+    ModelExplainer,
+    explain_flagged,
+    explanation_strategy_for_pipeline,
+)
+
+
+@pytest.fixture(scope="module")
+def numpy_pipeline(genetic_model_path):
+    return Pipeline([("model", PipelineNumpyGeneticModel(genetic_model_path))])
+
+
+@pytest.fixture(scope="module")
+def explainer(numpy_pipeline, transformed_rows):
+    background = pd.DataFrame(transformed_rows[:1000])
+    return ModelExplainer(explanation_strategy_for_pipeline(numpy_pipeline, background))
+
+
+@pytest.mark.parametrize("threshold", [0.5, 1.1])
+def test_explain_flagged_without_flagged_rows_is_empty(
+    explainer, numpy_pipeline, transformed_rows, threshold
+):
+    # No rows at all, and rows of which none reaches the threshold.
+    X = pd.DataFrame(transformed_rows[: 0 if threshold < 1 else 100])
+
+    explanations = explain_flagged(explainer, numpy_pipeline, X, threshold=threshold)
+
+    assert explanations.empty
+    assert list(explanations.columns) == [*X.columns, "score"]
+
+
+def test_sigmoid_hidden_layer_gradient_matches_finite_differences():
+    rng = np.random.default_rng(0)
+    model = type("SigmoidNetwork", (), {})()
+    model.layers_ = [
+        (rng.normal(size=(4, 8)).astype(np.float32), np.zeros(8, np.float32), "sigmoid"),
+        (rng.normal(size=(8, 1)).astype(np.float32), np.zeros(1, np.float32), "sigmoid"),
+    ]
+    strategy = GradientExplanationStrategy(model, rng.normal(size=(10, 4)))
+
+    X = rng.normal(size=(5, 4))
+    _, gradient = strategy._logit_and_gradient(X)
+    epsilon = 1e-4
+    for feature in range(4):
+        step = np.zeros(4)
+        step[feature] = epsilon
+        numerical = (
+            strategy._logit_and_gradient(X + step)[0] - strategy._logit_and_gradient(X - step)[0]
+        ) / (2 * epsilon)
+        np.testing.assert_allclose(gradient[:, feature], numerical, rtol=1e-4, atol=1e-6)
@@ -0,0 +1,37 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.model_quantization import QuantizedGeneticModel
+from src.numpy_inference import NumpyGeneticModel
+
+
+@pytest.fixture(scope="module")
+def float_model(genetic_model_path):
+    return NumpyGeneticModel(genetic_model_path)
+
+
+@pytest.mark.parametrize("dtype", ["int8", "float16"])
+def test_quantized_pickle_is_smaller_than_float(float_model, transformed_rows, dtype):
+    model = QuantizedGeneticModel(float_model.layers_, dtype=dtype).calibrate(
+        transformed_rows[:500]
+    )
+    model.predict(transformed_rows[:10])
+
+    quantized_size = len(pickle.dumps(model, protocol=5))
+    assert quantized_size < len(pickle.dumps(float_model, protocol=5))
+    # Nothing but the quantized layers stays resident once calibrated.
+    assert model.resident_nbytes == model.nbytes
+
+
+def test_quantized_predictions_track_float(float_model, transformed_rows):
+    model = QuantizedGeneticModel(float_model.layers_, dtype="int8").calibrate(
+        transformed_rows[:500]
+    )
+    restored = pickle.loads(pickle.dumps(model, protocol=5))
+
+    X = transformed_rows[500:1500]
+    np.testing.assert_array_equal(restored.predict(X), model.predict(X))
+    agreement = np.mean((model.predict(X) > 0.5) == (float_model.predict(X) > 0.5))
+    assert agreement > 0.98
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.numpy_inference import NumpyGeneticModel
+
+
+@pytest.fixture(scope="module")
+def keras_logits_model(genetic_model_path):
+    """
+    The Keras network with its output activation removed, so that it returns logits.
+    """
+    keras = pytest.importorskip("keras")
+
+    model = keras.models.load_model(genetic_model_path, compile=False)
+    model.layers[-1].activation = keras.activations.linear
+    return model
+
+
+def test_logits_match_keras(genetic_model_path, keras_logits_model, transformed_rows):
+    # Probabilities saturate to exactly 0 or 1 for most real rows, so only the logits
+    # show whether the folded BatchNormalization weights are right.
+    expected = keras_logits_model.predict(transformed_rows, verbose=0)
+    logits = NumpyGeneticModel(genetic_model_path).logits(transformed_rows)
+
+    assert logits.shape == expected.shape
+    assert np.std(expected) > 1.0
+    np.testing.assert_allclose(logits, expected, rtol=1e-4, atol=1e-3)
+
+
+def test_predict_is_sigmoid_of_logits(genetic_model_path, transformed_rows):
+    model = NumpyGeneticModel(genetic_model_path)
+    logits = model.logits(transformed_rows).astype(np.float64)
+
+    expected = 1 / (1 + np.exp(-np.clip(logits, -88.0, 88.0)))
+    np.testing.assert_allclose(model.predict(transformed_rows), expected, rtol=1e-5, atol=1e-7)
+    np.testing.assert_allclose(model.predict_proba(transformed_rows).sum(axis=1), 1.0, rtol=1e-6)
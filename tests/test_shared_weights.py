@@ -0,0 +1,138 @@
+import multiprocessing
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+lgb = pytest.importorskip("lightgbm")
+
+# Serving workers that load the same package at once.
+N_WORKERS = 3
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists("/proc/self/smaps_rollup"), reason="needs Linux smaps_rollup"
+)
+
+
+def unique_memory() -> int:
+    """
+    Reads the unique set size (USS) of the current process, in bytes.
+    """
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    return fields["Private_Clean"] + fields["Private_Dirty"]
+
+
+def _touch_weights(value, seen: set):
+    """
+    Reads every numpy array reachable from a model, so that all weight pages are resident.
+    """
+    if id(value) in seen:
+        return
+    seen.add(id(value))
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        value.view(np.uint8).sum()
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _touch_weights(item, seen)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _touch_weights(item, seen)
+    elif hasattr(value, "__dict__"):
+        _touch_weights(vars(value), seen)
+
+
+def _measure_worker(model_path: str, packaged: bool, X: np.ndarray, barrier, results):
+    """
+    Loads the model in a fresh worker, scores a batch and reports the unique memory it
+    added while all workers hold the model.
+    """
+    # Import the model's classes first so that only the weights show up in the delta.
+    import src.data_modelling  # noqa: F401
+    from src.model_packaging import load_model_package
+
+    baseline = unique_memory()
+    if packaged:
+        model = load_model_package(model_path)
+    else:
+        with open(model_path, "rb") as f:
+            model = pickle.load(f)
+    model.predict_proba(X)
+    _touch_weights(model, set())
+
+    barrier.wait()
+    results.put(unique_memory() - baseline)
+    barrier.wait()
+
+
+def measure_workers(model_path: str, packaged: bool, X: np.ndarray) -> list:
+    """
+    Runs `N_WORKERS` spawned workers on one model file and collects their USS deltas.
+    """
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(N_WORKERS)
+    results = context.Queue()
+    workers = [
+        context.Process(target=_measure_worker, args=(model_path, packaged, X, barrier, results))
+        for _ in range(N_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    usages = [results.get(timeout=120) for _ in workers]
+    for worker in workers:
+        worker.join()
+    return usages
+
+
+@pytest.fixture(scope="module")
+def model_files(tmp_path_factory):
+    """
+    A flattened LightGBM pipeline saved both as a plain pickle and as a model package.
+    """
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    from src.data_modelling import flatten_lgbm_pipeline
+    from src.model_packaging import save_model_package
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(10_000, 28))
+    y = (X[:, :4].sum(axis=1) + rng.normal(size=len(X)) > 0).astype(int)
+    pipeline = flatten_lgbm_pipeline(
+        Pipeline(
+            [
+                ("scaler", StandardScaler()),
+                (
+                    "model",
+                    lgb.LGBMClassifier(
+                        n_estimators=200, num_leaves=255, min_child_samples=2, verbose=-1
+                    ),
+                ),
+            ]
+        ).fit(X, y)
+    )
+
+    directory = tmp_path_factory.mktemp("shared_weights")
+    pickle_path = str(directory / "model.pkl")
+    package_path = str(directory / "model.efmp")
+    with open(pickle_path, "wb") as f:
+        pickle.dump(pipeline, f)
+    weight_bytes = save_model_package(pipeline, package_path)["weight_bytes"]
+    return pickle_path, package_path, weight_bytes, X[:1000]
+
+
+def test_packaged_weights_are_shared_across_workers(model_files):
+    pickle_path, package_path, weight_bytes, X = model_files
+
+    pickled = measure_workers(pickle_path, packaged=False, X=X)
+    packaged = measure_workers(package_path, packaged=True, X=X)
+
+    # Unpickled weights are private to every worker (allocator reuse hides a little) ...
+    assert min(pickled) > weight_bytes / 2
+    # ... while mapped weights are not copied: each worker only adds its scoring buffers.
+    assert max(packaged) < weight_bytes / 4
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from src.tree_ensemble import FlatTreeEnsemble
+
+lgb = pytest.importorskip("lightgbm")
+
+
+@pytest.fixture(scope="module")
+def missing_rows() -> np.ndarray:
+    """
+    Random rows with NaN and zero values, which exercise every missing-value direction.
+    """
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(2000, 8))
+    X[rng.random(X.shape) < 0.05] = np.nan
+    X[rng.random(X.shape) < 0.05] = 0.0
+    return X
+
+
+@pytest.mark.parametrize("zero_as_missing", [False, True])
+def test_raw_scores_match_lightgbm(missing_rows, zero_as_missing):
+    y = (np.nan_to_num(missing_rows[:, :3]).sum(axis=1) > 0).astype(int)
+    model = lgb.LGBMClassifier(
+        n_estimators=50, zero_as_missing=zero_as_missing, verbose=-1
+    ).fit(missing_rows, y)
+    flat = FlatTreeEnsemble.from_lightgbm(model)
+
+    # Batches larger than one chunk are scored by the numpy walk too.
+    for n_rows in (1, 37, len(missing_rows)):
+        batch = missing_rows[:n_rows]
+        np.testing.assert_array_equal(
+            flat.predict_raw(batch), model.predict(batch, raw_score=True)
+        )
+    assert flat.has_zero_rules == zero_as_missing
+
+
+def test_saved_ensemble_predicts_identically(missing_rows, tmp_path):
+    y = (np.nan_to_num(missing_rows[:, 0]) > 0).astype(int)
+    flat = FlatTreeEnsemble.from_lightgbm(
+        lgb.LGBMClassifier(n_estimators=20, verbose=-1).fit(missing_rows, y)
+    )
+    flat.save(tmp_path / "ensemble.npz")
+
+    restored = FlatTreeEnsemble.load(tmp_path / "ensemble.npz")
+    np.testing.assert_array_equal(
+        restored.predict_proba(missing_rows), flat.predict_proba(missing_rows)
+    )